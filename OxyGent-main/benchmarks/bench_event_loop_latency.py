@@ -0,0 +1,86 @@
+"""Event-loop latency benchmark of synchronous tools.
+
+A ticker coroutine sleeps for a fixed interval and records how late it wakes up,
+while a batch of concurrent calls to a blocking, CPU-bound tool function runs in
+each execution mode of FunctionTool: ``inline`` on the event loop, or in the
+``thread`` and ``process`` pools owned by the MAS.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_event_loop_latency.py
+    PYTHONPATH=. python benchmarks/bench_event_loop_latency.py --calls 16 --work 2000000
+"""
+
+import argparse
+import asyncio
+import functools
+import statistics
+import time
+
+from oxygent.mas import MAS
+
+
+def blocking_tool(n):
+    """Stand-in for a synchronous tool: pure-Python CPU work that holds the GIL."""
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+async def ticker(interval, lags, stop):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def run_mode(mas, mode, args):
+    lags, stop = [], asyncio.Event()
+    ticker_task = asyncio.create_task(ticker(args.interval, lags, stop))
+    await asyncio.sleep(args.interval * 2)
+
+    async def call():
+        if mode == "inline":
+            return blocking_tool(args.work)
+        return await mas.run_in_executor(
+            mode, functools.partial(blocking_tool, args.work)
+        )
+
+    start = time.perf_counter()
+    await asyncio.gather(*[call() for _ in range(args.calls)])
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker_task
+
+    lags = sorted(lags) or [0.0]
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+    print(
+        f"{mode:<8} wall={elapsed * 1000:9.1f}ms "
+        f"lag p50={statistics.median(lags) * 1000:8.3f}ms "
+        f"p99={p99 * 1000:8.3f}ms max={lags[-1] * 1000:8.3f}ms"
+    )
+
+
+async def main(args):
+    mas = MAS(name="bench_event_loop_latency")
+    try:
+        # Warm up the pools so that worker start-up is not measured
+        for mode in ["thread", "process"]:
+            await asyncio.gather(
+                *[
+                    mas.run_in_executor(mode, functools.partial(blocking_tool, 1))
+                    for _ in range(args.calls)
+                ]
+            )
+        for mode in ["inline", "thread", "process"]:
+            await run_mode(mas, mode, args)
+    finally:
+        mas.shutdown_executors()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=8)
+    parser.add_argument("--work", type=int, default=1000000)
+    parser.add_argument("--interval", type=float, default=0.005)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,124 @@
+"""Per-call overhead benchmark of FunctionTool argument binding.
+
+Measures the time FunctionTool spends turning ``oxy_request.arguments`` into the
+keyword arguments of the wrapped function, for a small and a wide signature:
+``legacy`` re-inspects the signature on every call as ``_execute`` used to,
+``binder`` uses the binder precomputed at construction, and ``validated`` adds the
+TypeAdapter validation of ``is_validate_arguments``. ``execute`` is the full
+``_execute`` call of an inline tool around a no-op function.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_function_tool_overhead.py
+    PYTHONPATH=. python benchmarks/bench_function_tool_overhead.py --calls 200000
+"""
+
+import argparse
+import asyncio
+import time
+from inspect import Parameter, signature
+
+from pydantic import Field
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+
+from oxygent.oxy.function_tools.function_tool import FunctionTool
+from oxygent.schemas import OxyRequest
+
+
+async def small_tool(
+    query: str = Field(description="query"),
+    top_k: int = Field(default=5, description="number of results"),
+):
+    return None
+
+
+async def wide_tool(
+    oxy_request: OxyRequest,
+    a: str = Field(description="a"),
+    b: int = Field(description="b"),
+    c: float = Field(default=1.0, description="c"),
+    d: bool = Field(default=False, description="d"),
+    e: list = Field(default_factory=list, description="e"),
+    f: dict = Field(default=None, description="f"),
+    g: str = "g",
+    h: int = 8,
+    i=None,
+    j: str = Field(default="j", description="j"),
+):
+    return None
+
+
+def legacy_bind(func, oxy_request):
+    """Argument binding of FunctionTool._execute before the precomputed binder."""
+    func_kwargs = {}
+    sig = signature(func)
+    for param_name, param in sig.parameters.items():
+        param_type = param.annotation
+        if param_type is Parameter.empty:
+            type_name = None
+        else:
+            type_name = getattr(param_type, "__name__", str(param_type))
+            if type_name == "OxyRequest":
+                func_kwargs[param_name] = oxy_request
+                continue
+        if param_name in oxy_request.arguments:
+            func_kwargs[param_name] = oxy_request.arguments[param_name]
+        elif isinstance(param.default, FieldInfo):
+            func_kwargs[param_name] = (
+                param.default.default
+                if param.default.default is not PydanticUndefined
+                else None
+            )
+        elif param.default is not Parameter.empty:
+            func_kwargs[param_name] = param.default
+        else:
+            func_kwargs[param_name] = None
+    return func_kwargs
+
+
+def timed(label, func, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<10} {elapsed / calls * 1e6:8.3f}us/call")
+
+
+async def timed_async(label, func, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        await func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<10} {elapsed / calls * 1e6:8.3f}us/call")
+
+
+async def main(args):
+    cases = [
+        (small_tool, {"query": "weather in Beijing"}),
+        (wide_tool, {"a": "x", "b": 2, "c": 0.5, "g": "y", "i": [1, 2]}),
+    ]
+    for func, arguments in cases:
+        print(f"{func.__name__} ({len(signature(func).parameters)} parameters)")
+        oxy_request = OxyRequest(callee=func.__name__, arguments=arguments)
+        tool = FunctionTool(name=func.__name__, desc="", func_process=func)
+        validated_tool = FunctionTool(
+            name=func.__name__,
+            desc="",
+            func_process=func,
+            is_validate_arguments=True,
+        )
+        assert legacy_bind(func, oxy_request) == tool.bind_arguments(oxy_request)
+        timed("legacy", lambda: legacy_bind(func, oxy_request), args.calls)
+        timed("binder", lambda: tool.bind_arguments(oxy_request), args.calls)
+        timed(
+            "validated",
+            lambda: validated_tool.bind_arguments(oxy_request),
+            args.calls,
+        )
+        await timed_async("execute", lambda: tool._execute(oxy_request), args.calls)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,103 @@
+"""CPU cost of assembling the ReAct prompt over many rounds.
+
+Compares the per-round rebuild ReActAgent used to do (a new Memory with the
+instruction, the short memory converted to Messages, the query and the react memory,
+serialized with ``to_dict_list``) with the round-persistent MessageBuffer that builds
+the prefix once and appends each round's turns. Only prompt assembly is timed; no
+LLM or tool is called.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_react_prompt_assembly.py
+    PYTHONPATH=. python benchmarks/bench_react_prompt_assembly.py --rounds 16 64 256 --history 20
+"""
+
+import argparse
+import re
+import time
+
+from oxygent.schemas import Memory, Message, MessageBuffer
+
+PROMPT = "You are a helpful assistant.\n${tools_description}\n" + "Rules. " * 200
+ARGUMENTS = {"tools_description": "tool: description\n" * 50}
+
+
+def build_instruction(arguments):
+    """LocalAgent._build_instruction before its pattern was precompiled."""
+    pattern = re.compile(r"\$\{(\w+)\}")
+
+    def replacer(match):
+        return str(arguments.get(match.group(1), match.group(0)))
+
+    return pattern.sub(replacer, PROMPT.strip())
+
+
+def make_turn(i):
+    assistant = '{"tool_name": "search", "arguments": {"query": "q%d"}}' % i
+    observation = f"Tool [search] execution result: {'observation ' * 100}{i}"
+    return Message.assistant_message(assistant), Message.user_message(observation)
+
+
+def legacy(short_memory, query, rounds):
+    react_memory = Memory()
+    for i in range(rounds):
+        temp_memory = Memory()
+        temp_memory.add_message(Message.system_message(build_instruction(ARGUMENTS)))
+        temp_memory.add_messages(Message.dict_list_to_messages(short_memory))
+        temp_memory.add_message(Message.user_message(query))
+        temp_memory.add_messages(react_memory.messages)
+        full_memory = temp_memory.to_dict_list()
+        for message in make_turn(i):
+            react_memory.add_message(message)
+    return full_memory
+
+
+def buffered(short_memory, query, rounds):
+    from oxygent.oxy.agents.local_agent import _PROMPT_VARIABLE_PATTERN
+
+    def replacer(match):
+        return str(ARGUMENTS.get(match.group(1), match.group(0)))
+
+    react_memory = Memory()
+    message_buffer = MessageBuffer()
+    message_buffer.add_message(
+        Message.system_message(_PROMPT_VARIABLE_PATTERN.sub(replacer, PROMPT.strip()))
+    )
+    message_buffer.add_dict_list(short_memory)
+    message_buffer.add_message(Message.user_message(query))
+    for i in range(rounds):
+        full_memory = message_buffer.to_dict_list()
+        for message in make_turn(i):
+            react_memory.add_message(message)
+            message_buffer.add_message(message)
+    return full_memory
+
+
+def main(args):
+    short_memory = []
+    for i in range(args.history):
+        short_memory.append({"role": "user", "content": f"question {i} " * 20})
+        short_memory.append({"role": "assistant", "content": f"answer {i} " * 50})
+    query = "What is the weather like in Beijing tomorrow?"
+    for rounds in args.rounds:
+        assert legacy(short_memory, query, rounds) == buffered(
+            short_memory, query, rounds
+        )
+        timings = {}
+        for label, func in [("legacy", legacy), ("buffered", buffered)]:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                func(short_memory, query, rounds)
+            timings[label] = (time.perf_counter() - start) / args.repeat
+        print(
+            f"rounds={rounds:<4} legacy={timings['legacy'] * 1000:9.3f}ms "
+            f"buffered={timings['buffered'] * 1000:9.3f}ms "
+            f"speedup={timings['legacy'] / timings['buffered']:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, nargs="+", default=[4, 16, 64, 256])
+    parser.add_argument("--history", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,187 @@
+"""Latency and recall benchmark of retrieve_tools.
+
+The catalogue is built from the FunctionHubs in ``oxygent.preset_tools``, with
+``desc_for_llm`` generated exactly as at runtime. Every query below names the tool
+a human would pick for it. The lexical index is always measured. If a config with a
+``vearch`` section is passed, the vector and hybrid modes are measured as well.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_tool_retrieval.py
+    PYTHONPATH=. python benchmarks/bench_tool_retrieval.py --config config.json --env default
+    PYTHONPATH=. python benchmarks/bench_tool_retrieval.py --scale 50
+"""
+
+import argparse
+import asyncio
+import importlib
+import statistics
+import time
+
+from oxygent import preset_tools
+from oxygent.config import Config
+from oxygent.databases.db_vector import (
+    LexicalIndex,
+    LocalVectorDB,
+    VearchDB,
+    reciprocal_rank_fusion,
+)
+from oxygent.oxy import FunctionHub
+from oxygent.oxy.function_tools.function_tool import FunctionTool
+
+APP_NAME = "bench_tool_retrieval"
+AGENT_NAME = "bench_agent"
+# Tool modules that preset_tools does not import by default; they are skipped when
+# their dependencies or settings (e.g. SQL_TOOLS_DB_URL) are missing
+EXTRA_TOOL_MODULES = ["sql_tools", "train_ticket_tools"]
+
+QUERIES = [
+    ("calculate 3.5 * (2 + 7)", "calculate_expression"),
+    ("give me pi to 20 decimal places", "calc_pi"),
+    ("add two lists element by element", "list_operation"),
+    ("what time is it in Tokyo", "get_current_time"),
+    ("convert 9am New York time to Beijing time", "convert_time"),
+    ("save this text into report.md", "write_file"),
+    ("show me what is inside notes.txt", "read_file"),
+    ("remove the temp directory", "delete_file"),
+    ("find every email address in this paragraph", "extract_emails"),
+    ("pull all links out of the page text", "extract_urls"),
+    ("is foo@bar.com a valid address", "validate_email"),
+    ("which operating system and python version is this", "get_system_info"),
+    ("how much memory and cpu are in use", "get_system_usage"),
+    ("run this python snippet", "run_python_code"),
+    ("search the web for the latest news", "search_baidu"),
+    ("draw a picture of a cat on the moon", "gen_image"),
+    ("查询明天北京到上海的车票", "get_tickets"),
+    ("今天是几号", "get_current_date"),
+    ("上海有哪些火车站", "get_stations_of_city"),
+    ("list the tables in the database", "list_tables"),
+    ("what columns does the users table have", "describe_tables"),
+    ("fetch https://example.com", "http_get"),
+    ("send a POST request with this json payload", "http_post"),
+    ("list the files in the current directory with ls", "run_shell_command"),
+    ("count the orders placed last month with sql", "run_sql"),
+]
+
+
+def load_catalogue(scale):
+    """Return ``{tool_name: desc_for_llm}`` for the preset tools.
+
+    With ``scale > 1`` the catalogue is padded with renamed copies of every tool, so
+    latency can be measured on a larger index while recall still targets the
+    originals.
+    """
+    hubs = [getattr(preset_tools, hub_name) for hub_name in preset_tools.__all__]
+    for module_name in EXTRA_TOOL_MODULES:
+        try:
+            module = importlib.import_module(f"oxygent.preset_tools.{module_name}")
+        except Exception as e:
+            print(f"skipping {module_name}: {e}")
+            continue
+        hubs.append(getattr(module, module_name))
+    catalogue = {}
+    for hub in hubs:
+        if not isinstance(hub, FunctionHub):
+            continue
+        for tool_name, (tool_desc, tool_func) in hub.func_dict.items():
+            tool = FunctionTool(name=tool_name, desc=tool_desc, func_process=tool_func)
+            catalogue[tool_name] = tool.desc_for_llm
+    for i in range(1, scale):
+        for tool_name, desc in list(catalogue.items()):
+            if "__copy" not in tool_name:
+                copy_name = f"{tool_name}__copy{i}"
+                catalogue[copy_name] = desc.replace(tool_name, copy_name)
+    return catalogue
+
+
+def recall_at_k(results, queries, k):
+    hits = sum(expected in result[:k] for result, (_, expected) in zip(results, queries))
+    return hits / len(queries)
+
+
+def report(label, latencies, results, queries, top_k):
+    latencies = sorted(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{label:<10} p50={statistics.median(latencies) * 1000:8.3f}ms "
+        f"p99={p99 * 1000:8.3f}ms "
+        f"recall@1={recall_at_k(results, queries, 1):.2f} "
+        f"recall@{top_k}={recall_at_k(results, queries, top_k):.2f}"
+    )
+
+
+async def timed(func, queries, rounds):
+    latencies, results = [], []
+    for round_idx in range(rounds):
+        for query, _ in queries:
+            start = time.perf_counter()
+            result = await func(query)
+            latencies.append(time.perf_counter() - start)
+            if round_idx == 0:
+                results.append(result or [])
+    return latencies, results
+
+
+async def main(args):
+    catalogue = load_catalogue(args.scale)
+    queries = [(query, tool) for query, tool in QUERIES if tool in catalogue]
+    names = list(catalogue)
+    print(f"catalogue: {len(catalogue)} tools, queries: {len(queries)}")
+
+    start = time.perf_counter()
+    lexical_index = LexicalIndex()
+    for tool_name, desc in catalogue.items():
+        lexical_index.add(tool_name, desc)
+    print(f"lexical index build: {(time.perf_counter() - start) * 1000:.3f}ms")
+
+    async def lexical(query):
+        return lexical_index.search(query, args.top_k, names=names)
+
+    report("lexical", *await timed(lexical, queries, args.rounds), queries, args.top_k)
+
+    if not args.config:
+        return
+    Config.load_from_json(args.config, args.env)
+    vearch_config = Config.get_vearch_config()
+    if not vearch_config:
+        print("no vearch config, skipping vector and hybrid")
+        return
+    if vearch_config.get("backend") == "local":
+        vearch_client = LocalVectorDB(vearch_config)
+    else:
+        vearch_client = VearchDB(vearch_config)
+    try:
+        await vearch_client.create_vearch_table_by_tool_list(
+            [(APP_NAME, AGENT_NAME, name, desc) for name, desc in catalogue.items()]
+        )
+
+        async def vector(query):
+            return await vearch_client.tool_retrieval(
+                query, APP_NAME, AGENT_NAME, args.top_k
+            )
+
+        async def hybrid(query):
+            lexical_tools = lexical_index.search(query, args.top_k, names=names)
+            vector_tools = await vector(query)
+            return reciprocal_rank_fusion(
+                [vector_tools, lexical_tools], k=Config.get_tool_rrf_k()
+            )[: args.top_k]
+
+        # Each mode starts from a cold retrieval cache and runs one round, so the
+        # latencies include the query embedding
+        for label, func in [("vector", vector), ("hybrid", hybrid)]:
+            vearch_client.retrieval_cache.embeddings.clear()
+            vearch_client.retrieval_cache.invalidate()
+            report(label, *await timed(func, queries, 1), queries, args.top_k)
+        await vearch_client.delete_by_appname(APP_NAME)
+    finally:
+        await vearch_client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", default=None, help="config.json with vearch")
+    parser.add_argument("--env", default=None)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--scale", type=int, default=1)
+    asyncio.run(main(parser.parse_args()))
@@ -72,6 +72,53 @@ class Config:
             "is_send_full_arguments": False,
         },
         "vearch": {},
+        "embedding": {
+            "batch_size": 32,  # texts per embedding request
+            "max_concurrency": 4,  # concurrent embedding requests
+            "dtype": "float32",  # float32 / float16 storage of cached embeddings
+        },
+        "knowledge": {
+            "chunk_size": 500,  # max characters per chunk
+            "chunk_overlap": 50,  # characters shared by consecutive chunks
+            "top_k": 5,  # chunks returned per query
+            "cache_size": 1024,  # cached queries per knowledge base
+            "cache_ttl": 300,  # seconds a cached query result stays valid
+        },
+        "sandbox": {
+            "pool_size": 2,  # warm worker processes of run_python_code
+            "timeout": 30,  # wall-clock seconds per snippet
+            "cpu_limit": 30,  # CPU seconds per snippet
+            "memory_limit": 2048,  # MB of address space per worker, 0 = unlimited
+            "max_output_chars": 20000,  # captured stdout kept per snippet
+            "preload_modules": ["numpy", "pandas"],  # imported before forking
+        },
+        "shell": {
+            "max_concurrency": 8,  # shell commands running at the same time
+            "timeout": 300,  # seconds before the process group is killed
+            "head_lines": 10,  # first output lines kept besides the tail
+            "max_line_chars": 2000,  # characters kept per output line
+            "is_stream": True,  # stream output lines to the frontend
+        },
+        "sql": {
+            "is_async": False,  # use an AsyncEngine, the URL must name an async driver
+            "pool_size": 5,  # pooled connections of sql_tools
+            "max_overflow": 10,  # connections allowed beyond pool_size
+            "pool_recycle": 3600,  # seconds after which a connection is replaced
+            "max_rows": 1000,  # rows returned by run_sql at most
+            "max_bytes": 1048576,  # bytes of encoded rows returned by run_sql at most
+            "cache_size": 256,  # cached table lists, schemas and read-only queries
+            "cache_ttl": 60,  # seconds a cached result stays valid
+        },
+        "http": {
+            "max_connections": 100,  # connections of the shared HTTP client
+            "max_keepalive_connections": 20,  # idle connections kept alive
+            "keepalive_expiry": 30,  # seconds an idle connection is kept
+            "max_connections_per_host": 10,  # requests in flight to a single host
+            "is_cache": True,  # cache GET responses by Cache-Control / ETag / Last-Modified
+            "cache_size": 512,  # responses kept in memory
+            "max_cache_entry_bytes": 1048576,  # larger responses are not cached
+            "is_disk_cache": False,  # also persist cached responses under cache_dir
+        },
         "es": {},
         "es_schema": {
             "shared_data": {"type": "text"},
@@ -81,6 +128,18 @@ class Config:
             "number_of_shards": 1,
             "number_of_replicas": 1,
         },
+        "es_lifecycle": {
+            "is_enabled": False,
+            "period": "daily",  # daily / weekly
+            # Retention in days per index type, 0 keeps the partitions forever
+            "retention": {"trace": 90, "node": 30, "message": 30, "history": 90},
+            "history_lookback": 30,  # days of history read by agents
+            "janitor_interval": 3600,  # seconds
+        },
+        "blob": {
+            "is_enabled": True,
+            "threshold": 4096,  # bytes of serialized json
+        },
         "redis": {},
         "redis_param": {
             "expire_time": 86400,  # 24 hours 60 * 60 * 24
@@ -102,10 +161,26 @@ class Config:
             },
             "short_memory_size": 10,
             "welcome_message": "Hi, I’m OxyGent. How can I assist you?",
+            "tokenizer": "auto",  # tiktoken encoding name, auto, or heuristic
+            "chars_per_token": 4.0,  # non-CJK characters per token of the heuristic
+            "max_prompt_tokens": 0,  # token ceiling of ReAct prompts, 0 = unlimited
+            "is_function_calling": False,  # ReAct tool calls through the LLM tools API
         },
         "tool": {
             "mcp_is_keep_alive": True,
             "is_concurrent_init": True,
+            "mcp_session_pool_size": 16,  # warm sessions per MCP client without keep-alive
+            "mcp_session_idle_timeout": 300,  # seconds before an unused session is closed
+            "mcp_session_health_check_interval": 60,  # seconds between session pings
+            "mcp_is_manifest_cached": True,  # register MCP tools from cached list_tools
+            "sync_execution_mode": "inline",  # inline / thread / process for sync tools
+            "thread_pool_size": 32,  # threads shared by thread-mode tools
+            "process_pool_size": 0,  # processes of process-mode tools, 0 = CPU count
+            "is_validate_arguments": False,  # validate function tool arguments by type
+            "batch_max_size": 32,  # calls after which a batch tool runs without waiting
+            "batch_window": 0.005,  # seconds a batch tool waits for concurrent calls
+            "retrieval_mode": "hybrid",  # vector / lexical / hybrid for retrieve_tools
+            "rrf_k": 60,  # damping constant of reciprocal-rank fusion
         },
     }
 
@@ -428,6 +503,82 @@ class Config:
     def get_es_settings_config(cls) -> dict:
         return cls.get_module_config("es_settings")
 
+    """ es_lifecycle """
+
+    @classmethod
+    def set_es_lifecycle_config(cls, es_lifecycle_config):
+        cls.set_module_config("es_lifecycle", es_lifecycle_config)
+
+    @classmethod
+    def get_es_lifecycle_config(cls):
+        return cls.get_module_config("es_lifecycle")
+
+    @classmethod
+    def set_es_lifecycle_is_enabled(cls, is_enabled=True):
+        cls.set_module_config("es_lifecycle", "is_enabled", is_enabled)
+
+    @classmethod
+    def get_es_lifecycle_is_enabled(cls):
+        return cls.get_module_config("es_lifecycle", "is_enabled")
+
+    @classmethod
+    def set_es_lifecycle_period(cls, period):
+        cls.set_module_config("es_lifecycle", "period", period)
+
+    @classmethod
+    def get_es_lifecycle_period(cls):
+        return cls.get_module_config("es_lifecycle", "period")
+
+    @classmethod
+    def set_es_lifecycle_retention(cls, retention):
+        cls.set_module_config("es_lifecycle", "retention", retention)
+
+    @classmethod
+    def get_es_lifecycle_retention(cls):
+        return cls.get_module_config("es_lifecycle", "retention")
+
+    @classmethod
+    def set_es_lifecycle_history_lookback(cls, history_lookback):
+        cls.set_module_config("es_lifecycle", "history_lookback", history_lookback)
+
+    @classmethod
+    def get_es_lifecycle_history_lookback(cls):
+        return cls.get_module_config("es_lifecycle", "history_lookback")
+
+    @classmethod
+    def set_es_lifecycle_janitor_interval(cls, janitor_interval):
+        cls.set_module_config("es_lifecycle", "janitor_interval", janitor_interval)
+
+    @classmethod
+    def get_es_lifecycle_janitor_interval(cls):
+        return cls.get_module_config("es_lifecycle", "janitor_interval")
+
+    """ blob """
+
+    @classmethod
+    def set_blob_config(cls, blob_config):
+        cls.set_module_config("blob", blob_config)
+
+    @classmethod
+    def get_blob_config(cls):
+        return cls.get_module_config("blob")
+
+    @classmethod
+    def set_blob_is_enabled(cls, is_enabled=True):
+        cls.set_module_config("blob", "is_enabled", is_enabled)
+
+    @classmethod
+    def get_blob_is_enabled(cls):
+        return cls.get_module_config("blob", "is_enabled")
+
+    @classmethod
+    def set_blob_threshold(cls, threshold):
+        cls.set_module_config("blob", "threshold", threshold)
+
+    @classmethod
+    def get_blob_threshold(cls):
+        return cls.get_module_config("blob", "threshold")
+
     """ vearch """
 
     @classmethod
@@ -442,6 +593,330 @@ class Config:
     def get_vearch_embedding_model_url(cls):
         return cls.get_module_config("vearch", "embedding_model_url")
 
+    """ embedding """
+
+    @classmethod
+    def set_embedding_config(cls, embedding_config):
+        cls.set_module_config("embedding", embedding_config)
+
+    @classmethod
+    def get_embedding_config(cls):
+        return cls.get_module_config("embedding")
+
+    @classmethod
+    def set_embedding_batch_size(cls, batch_size):
+        cls.set_module_config("embedding", "batch_size", batch_size)
+
+    @classmethod
+    def get_embedding_batch_size(cls):
+        return cls.get_module_config("embedding", "batch_size")
+
+    @classmethod
+    def set_embedding_max_concurrency(cls, max_concurrency):
+        cls.set_module_config("embedding", "max_concurrency", max_concurrency)
+
+    @classmethod
+    def get_embedding_max_concurrency(cls):
+        return cls.get_module_config("embedding", "max_concurrency")
+
+    @classmethod
+    def set_embedding_dtype(cls, dtype):
+        cls.set_module_config("embedding", "dtype", dtype)
+
+    @classmethod
+    def get_embedding_dtype(cls):
+        return cls.get_module_config("embedding", "dtype")
+
+    """ knowledge """
+
+    @classmethod
+    def set_knowledge_config(cls, knowledge_config):
+        cls.set_module_config("knowledge", knowledge_config)
+
+    @classmethod
+    def get_knowledge_config(cls):
+        return cls.get_module_config("knowledge")
+
+    @classmethod
+    def set_knowledge_chunk_size(cls, chunk_size):
+        cls.set_module_config("knowledge", "chunk_size", chunk_size)
+
+    @classmethod
+    def get_knowledge_chunk_size(cls):
+        return cls.get_module_config("knowledge", "chunk_size")
+
+    @classmethod
+    def set_knowledge_chunk_overlap(cls, chunk_overlap):
+        cls.set_module_config("knowledge", "chunk_overlap", chunk_overlap)
+
+    @classmethod
+    def get_knowledge_chunk_overlap(cls):
+        return cls.get_module_config("knowledge", "chunk_overlap")
+
+    @classmethod
+    def set_knowledge_top_k(cls, top_k):
+        cls.set_module_config("knowledge", "top_k", top_k)
+
+    @classmethod
+    def get_knowledge_top_k(cls):
+        return cls.get_module_config("knowledge", "top_k")
+
+    @classmethod
+    def set_knowledge_cache_size(cls, cache_size):
+        cls.set_module_config("knowledge", "cache_size", cache_size)
+
+    @classmethod
+    def get_knowledge_cache_size(cls):
+        return cls.get_module_config("knowledge", "cache_size")
+
+    @classmethod
+    def set_knowledge_cache_ttl(cls, cache_ttl):
+        cls.set_module_config("knowledge", "cache_ttl", cache_ttl)
+
+    @classmethod
+    def get_knowledge_cache_ttl(cls):
+        return cls.get_module_config("knowledge", "cache_ttl")
+
+    """ sandbox """
+
+    @classmethod
+    def get_sandbox_config(cls):
+        return cls.get_module_config("sandbox")
+
+    @classmethod
+    def set_sandbox_pool_size(cls, pool_size):
+        cls.set_module_config("sandbox", "pool_size", pool_size)
+
+    @classmethod
+    def get_sandbox_pool_size(cls):
+        return cls.get_module_config("sandbox", "pool_size")
+
+    @classmethod
+    def set_sandbox_timeout(cls, timeout):
+        cls.set_module_config("sandbox", "timeout", timeout)
+
+    @classmethod
+    def get_sandbox_timeout(cls):
+        return cls.get_module_config("sandbox", "timeout")
+
+    @classmethod
+    def set_sandbox_cpu_limit(cls, cpu_limit):
+        cls.set_module_config("sandbox", "cpu_limit", cpu_limit)
+
+    @classmethod
+    def get_sandbox_cpu_limit(cls):
+        return cls.get_module_config("sandbox", "cpu_limit")
+
+    @classmethod
+    def set_sandbox_memory_limit(cls, memory_limit):
+        cls.set_module_config("sandbox", "memory_limit", memory_limit)
+
+    @classmethod
+    def get_sandbox_memory_limit(cls):
+        return cls.get_module_config("sandbox", "memory_limit")
+
+    @classmethod
+    def set_sandbox_max_output_chars(cls, max_output_chars):
+        cls.set_module_config("sandbox", "max_output_chars", max_output_chars)
+
+    @classmethod
+    def get_sandbox_max_output_chars(cls):
+        return cls.get_module_config("sandbox", "max_output_chars")
+
+    @classmethod
+    def set_sandbox_preload_modules(cls, preload_modules):
+        cls.set_module_config("sandbox", "preload_modules", preload_modules)
+
+    @classmethod
+    def get_sandbox_preload_modules(cls):
+        return cls.get_module_config("sandbox", "preload_modules")
+
+    """ shell """
+
+    @classmethod
+    def get_shell_config(cls):
+        return cls.get_module_config("shell")
+
+    @classmethod
+    def set_shell_max_concurrency(cls, max_concurrency):
+        cls.set_module_config("shell", "max_concurrency", max_concurrency)
+
+    @classmethod
+    def get_shell_max_concurrency(cls):
+        return cls.get_module_config("shell", "max_concurrency")
+
+    @classmethod
+    def set_shell_timeout(cls, timeout):
+        cls.set_module_config("shell", "timeout", timeout)
+
+    @classmethod
+    def get_shell_timeout(cls):
+        return cls.get_module_config("shell", "timeout")
+
+    @classmethod
+    def set_shell_head_lines(cls, head_lines):
+        cls.set_module_config("shell", "head_lines", head_lines)
+
+    @classmethod
+    def get_shell_head_lines(cls):
+        return cls.get_module_config("shell", "head_lines")
+
+    @classmethod
+    def set_shell_max_line_chars(cls, max_line_chars):
+        cls.set_module_config("shell", "max_line_chars", max_line_chars)
+
+    @classmethod
+    def get_shell_max_line_chars(cls):
+        return cls.get_module_config("shell", "max_line_chars")
+
+    @classmethod
+    def set_shell_is_stream(cls, is_stream):
+        cls.set_module_config("shell", "is_stream", is_stream)
+
+    @classmethod
+    def get_shell_is_stream(cls):
+        return cls.get_module_config("shell", "is_stream")
+
+    """ sql """
+
+    @classmethod
+    def get_sql_config(cls):
+        return cls.get_module_config("sql")
+
+    @classmethod
+    def set_sql_is_async(cls, is_async):
+        cls.set_module_config("sql", "is_async", is_async)
+
+    @classmethod
+    def get_sql_is_async(cls):
+        return cls.get_module_config("sql", "is_async")
+
+    @classmethod
+    def set_sql_pool_size(cls, pool_size):
+        cls.set_module_config("sql", "pool_size", pool_size)
+
+    @classmethod
+    def get_sql_pool_size(cls):
+        return cls.get_module_config("sql", "pool_size")
+
+    @classmethod
+    def set_sql_max_overflow(cls, max_overflow):
+        cls.set_module_config("sql", "max_overflow", max_overflow)
+
+    @classmethod
+    def get_sql_max_overflow(cls):
+        return cls.get_module_config("sql", "max_overflow")
+
+    @classmethod
+    def set_sql_pool_recycle(cls, pool_recycle):
+        cls.set_module_config("sql", "pool_recycle", pool_recycle)
+
+    @classmethod
+    def get_sql_pool_recycle(cls):
+        return cls.get_module_config("sql", "pool_recycle")
+
+    @classmethod
+    def set_sql_max_rows(cls, max_rows):
+        cls.set_module_config("sql", "max_rows", max_rows)
+
+    @classmethod
+    def get_sql_max_rows(cls):
+        return cls.get_module_config("sql", "max_rows")
+
+    @classmethod
+    def set_sql_max_bytes(cls, max_bytes):
+        cls.set_module_config("sql", "max_bytes", max_bytes)
+
+    @classmethod
+    def get_sql_max_bytes(cls):
+        return cls.get_module_config("sql", "max_bytes")
+
+    @classmethod
+    def set_sql_cache_size(cls, cache_size):
+        cls.set_module_config("sql", "cache_size", cache_size)
+
+    @classmethod
+    def get_sql_cache_size(cls):
+        return cls.get_module_config("sql", "cache_size")
+
+    @classmethod
+    def set_sql_cache_ttl(cls, cache_ttl):
+        cls.set_module_config("sql", "cache_ttl", cache_ttl)
+
+    @classmethod
+    def get_sql_cache_ttl(cls):
+        return cls.get_module_config("sql", "cache_ttl")
+
+    """ http """
+
+    @classmethod
+    def get_http_config(cls):
+        return cls.get_module_config("http")
+
+    @classmethod
+    def set_http_max_connections(cls, max_connections):
+        cls.set_module_config("http", "max_connections", max_connections)
+
+    @classmethod
+    def get_http_max_connections(cls):
+        return cls.get_module_config("http", "max_connections")
+
+    @classmethod
+    def set_http_max_keepalive_connections(cls, max_keepalive_connections):
+        cls.set_module_config("http", "max_keepalive_connections", max_keepalive_connections)
+
+    @classmethod
+    def get_http_max_keepalive_connections(cls):
+        return cls.get_module_config("http", "max_keepalive_connections")
+
+    @classmethod
+    def set_http_keepalive_expiry(cls, keepalive_expiry):
+        cls.set_module_config("http", "keepalive_expiry", keepalive_expiry)
+
+    @classmethod
+    def get_http_keepalive_expiry(cls):
+        return cls.get_module_config("http", "keepalive_expiry")
+
+    @classmethod
+    def set_http_max_connections_per_host(cls, max_connections_per_host):
+        cls.set_module_config("http", "max_connections_per_host", max_connections_per_host)
+
+    @classmethod
+    def get_http_max_connections_per_host(cls):
+        return cls.get_module_config("http", "max_connections_per_host")
+
+    @classmethod
+    def set_http_is_cache(cls, is_cache):
+        cls.set_module_config("http", "is_cache", is_cache)
+
+    @classmethod
+    def get_http_is_cache(cls):
+        return cls.get_module_config("http", "is_cache")
+
+    @classmethod
+    def set_http_cache_size(cls, cache_size):
+        cls.set_module_config("http", "cache_size", cache_size)
+
+    @classmethod
+    def get_http_cache_size(cls):
+        return cls.get_module_config("http", "cache_size")
+
+    @classmethod
+    def set_http_max_cache_entry_bytes(cls, max_cache_entry_bytes):
+        cls.set_module_config("http", "max_cache_entry_bytes", max_cache_entry_bytes)
+
+    @classmethod
+    def get_http_max_cache_entry_bytes(cls):
+        return cls.get_module_config("http", "max_cache_entry_bytes")
+
+    @classmethod
+    def set_http_is_disk_cache(cls, is_disk_cache):
+        cls.set_module_config("http", "is_disk_cache", is_disk_cache)
+
+    @classmethod
+    def get_http_is_disk_cache(cls):
+        return cls.get_module_config("http", "is_disk_cache")
+
     """ redis """
 
     @classmethod
@@ -570,6 +1045,38 @@ class Config:
     def get_agent_short_memory_size(cls):
         return cls.get_module_config("agent", "short_memory_size")
 
+    @classmethod
+    def set_agent_tokenizer(cls, tokenizer):
+        cls.set_module_config("agent", "tokenizer", tokenizer)
+
+    @classmethod
+    def get_agent_tokenizer(cls):
+        return cls.get_module_config("agent", "tokenizer")
+
+    @classmethod
+    def set_agent_chars_per_token(cls, chars_per_token):
+        cls.set_module_config("agent", "chars_per_token", chars_per_token)
+
+    @classmethod
+    def get_agent_chars_per_token(cls):
+        return cls.get_module_config("agent", "chars_per_token")
+
+    @classmethod
+    def set_agent_max_prompt_tokens(cls, max_prompt_tokens):
+        cls.set_module_config("agent", "max_prompt_tokens", max_prompt_tokens)
+
+    @classmethod
+    def get_agent_max_prompt_tokens(cls):
+        return cls.get_module_config("agent", "max_prompt_tokens")
+
+    @classmethod
+    def set_agent_is_function_calling(cls, is_function_calling):
+        cls.set_module_config("agent", "is_function_calling", is_function_calling)
+
+    @classmethod
+    def get_agent_is_function_calling(cls):
+        return cls.get_module_config("agent", "is_function_calling")
+
     @classmethod
     def set_agent_welcome_message(cls, welcome_message):
         cls.set_module_config("agent", "welcome_message", welcome_message)
@@ -603,3 +1110,99 @@ class Config:
     @classmethod
     def get_tool_is_concurrent_init(cls):
         return cls.get_module_config("tool", "is_concurrent_init")
+
+    @classmethod
+    def set_tool_retrieval_mode(cls, retrieval_mode):
+        cls.set_module_config("tool", "retrieval_mode", retrieval_mode)
+
+    @classmethod
+    def get_tool_retrieval_mode(cls):
+        return cls.get_module_config("tool", "retrieval_mode")
+
+    @classmethod
+    def set_tool_rrf_k(cls, rrf_k):
+        cls.set_module_config("tool", "rrf_k", rrf_k)
+
+    @classmethod
+    def get_tool_rrf_k(cls):
+        return cls.get_module_config("tool", "rrf_k")
+
+    @classmethod
+    def set_tool_mcp_session_pool_size(cls, session_pool_size):
+        cls.set_module_config("tool", "mcp_session_pool_size", session_pool_size)
+
+    @classmethod
+    def get_tool_mcp_session_pool_size(cls):
+        return cls.get_module_config("tool", "mcp_session_pool_size")
+
+    @classmethod
+    def set_tool_mcp_session_idle_timeout(cls, session_idle_timeout):
+        cls.set_module_config("tool", "mcp_session_idle_timeout", session_idle_timeout)
+
+    @classmethod
+    def get_tool_mcp_session_idle_timeout(cls):
+        return cls.get_module_config("tool", "mcp_session_idle_timeout")
+
+    @classmethod
+    def set_tool_mcp_session_health_check_interval(cls, session_health_check_interval):
+        cls.set_module_config("tool", "mcp_session_health_check_interval", session_health_check_interval)
+
+    @classmethod
+    def get_tool_mcp_session_health_check_interval(cls):
+        return cls.get_module_config("tool", "mcp_session_health_check_interval")
+
+    @classmethod
+    def set_tool_mcp_is_manifest_cached(cls, mcp_is_manifest_cached):
+        cls.set_module_config("tool", "mcp_is_manifest_cached", mcp_is_manifest_cached)
+
+    @classmethod
+    def get_tool_mcp_is_manifest_cached(cls):
+        return cls.get_module_config("tool", "mcp_is_manifest_cached")
+
+    @classmethod
+    def set_tool_sync_execution_mode(cls, sync_execution_mode):
+        cls.set_module_config("tool", "sync_execution_mode", sync_execution_mode)
+
+    @classmethod
+    def get_tool_sync_execution_mode(cls):
+        return cls.get_module_config("tool", "sync_execution_mode")
+
+    @classmethod
+    def set_tool_thread_pool_size(cls, thread_pool_size):
+        cls.set_module_config("tool", "thread_pool_size", thread_pool_size)
+
+    @classmethod
+    def get_tool_thread_pool_size(cls):
+        return cls.get_module_config("tool", "thread_pool_size")
+
+    @classmethod
+    def set_tool_process_pool_size(cls, process_pool_size):
+        cls.set_module_config("tool", "process_pool_size", process_pool_size)
+
+    @classmethod
+    def get_tool_process_pool_size(cls):
+        return cls.get_module_config("tool", "process_pool_size")
+
+    @classmethod
+    def set_tool_is_validate_arguments(cls, is_validate_arguments):
+        cls.set_module_config("tool", "is_validate_arguments", is_validate_arguments)
+
+    @classmethod
+    def get_tool_is_validate_arguments(cls):
+        return cls.get_module_config("tool", "is_validate_arguments")
+
+    @classmethod
+    def set_tool_batch_max_size(cls, batch_max_size):
+        cls.set_module_config("tool", "batch_max_size", batch_max_size)
+
+    @classmethod
+    def get_tool_batch_max_size(cls):
+        return cls.get_module_config("tool", "batch_max_size")
+
+    @classmethod
+    def set_tool_batch_window(cls, batch_window):
+        cls.set_module_config("tool", "batch_window", batch_window)
+
+    @classmethod
+    def get_tool_batch_window(cls):
+        return cls.get_module_config("tool", "batch_window")
@@ -8,6 +8,8 @@ from typing import Any
 
 from pydantic import Field
 
+from oxygent.config import Config
+from oxygent.databases.db_vector.lexical_index import reciprocal_rank_fusion
 from oxygent.oxy.function_tools.function_hub import FunctionHub
 
 fh = FunctionHub(name="core_tools")
@@ -22,11 +24,16 @@ async def retrieve_tools(
     agent_name: str = Field(description="SystemArg"),
     top_k: int = Field(description="SystemArg", default=10),
     vearch_client: Any = Field(description="SystemArg"),
+    lexical_index: Any = Field(description="SystemArg", default=None),
+    tool_names: list = Field(description="SystemArg", default=None),
 ) -> str:
     """Retrieve relevant tools based on query and filter by app_name and agent_name.
 
     This function performs semantic search to find tools that match the given query,
-    while applying filters based on the application and agent context.
+    while applying filters based on the application and agent context. Depending on
+    ``Config.get_tool_retrieval_mode()``, the vector ranking is used alone
+    (``vector``), replaced by a BM25 ranking over ``desc_for_llm`` (``lexical``), or
+    merged with it by reciprocal-rank fusion (``hybrid``).
 
     Args:
         query: Description of the tool functionality or use case to search for
@@ -34,6 +41,8 @@ async def retrieve_tools(
         agent_name: Name of the agent to filter tools by
         top_k: Maximum number of most relevant tools to return (default: 10)
         vearch_client: Vector search client used for tool retrieval operations
+        lexical_index: BM25 index of the registered oxys
+        tool_names: Tools of the agent that can be retrieved
 
     Returns:
         A string containing the retrieved tool information
@@ -46,6 +55,16 @@ async def retrieve_tools(
             'agent_name': 'agent_test1'
         }
     """
-    # Perform tool retrieval using the vector search client
-    # Filter results by app_name and agent_name, then return top_k most relevant tools
-    return await vearch_client.tool_retrieval(query, app_name, agent_name, top_k)
+    mode = Config.get_tool_retrieval_mode()
+    if lexical_index is None or mode == "vector":
+        # Filter results by app_name and agent_name, then return top_k most relevant tools
+        return await vearch_client.tool_retrieval(query, app_name, agent_name, top_k)
+    lexical_tools = lexical_index.search(query, top_k, names=tool_names or [])
+    if mode == "lexical":
+        return lexical_tools
+    vector_tools = await vearch_client.tool_retrieval(
+        query, app_name, agent_name, top_k
+    )
+    return reciprocal_rank_fusion(
+        [vector_tools, lexical_tools], k=Config.get_tool_rrf_k()
+    )[:top_k]
@@ -0,0 +1,9 @@
+from .base_blob import BaseBlob
+from .es_blob import EsBlob
+from .local_blob import LocalBlob
+
+__all__ = [
+    "BaseBlob",
+    "EsBlob",
+    "LocalBlob",
+]
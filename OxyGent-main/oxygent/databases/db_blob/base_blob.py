@@ -0,0 +1,146 @@
+"""base_blob.py Base Blob Store Class Module.
+
+This file defines the abstract base class for content-addressed blob stores. Large
+node fields (such as ``messages`` or ``full_memory``) are serialized, compressed and
+stored once under the sha256 of their content, while the node document only keeps a
+small ``{"$blob": <key>}`` reference. Identical payloads (e.g. the shared prefix of a
+conversation that grows round by round) are therefore stored only once.
+"""
+
+import hashlib
+import json
+import logging
+import zlib
+from abc import ABC, abstractmethod
+
+from oxygent.databases.base_db import BaseDB
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+BLOB_REF_KEY = "$blob"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def is_blob_ref(value) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and BLOB_REF_KEY in value
+
+
+def _compress(data: bytes) -> bytes:
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(payload: bytes) -> bytes:
+    # The codec is detected from the frame magic, so blobs written without
+    # zstandard installed stay readable after it is installed and vice versa.
+    if payload[:4] == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise ImportError("zstandard is required to read zstd-compressed blobs")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    return zlib.decompress(payload)
+
+
+class BaseBlob(BaseDB, ABC):
+    """Abstract base class for content-addressed blob stores.
+
+    Subclasses only implement raw byte persistence (``_write``, ``_read`` and
+    ``_exists``); hashing, compression, deduplication and reference handling
+    are shared here.
+    """
+
+    def __init__(self):
+        self._known_keys: set = set()
+
+    @abstractmethod
+    async def _write(self, key: str, payload: bytes):
+        """Persist the compressed *payload* under *key*."""
+        pass
+
+    @abstractmethod
+    async def _read(self, key: str) -> bytes:
+        """Return the compressed payload stored under *key*."""
+        pass
+
+    @abstractmethod
+    async def _exists(self, key: str) -> bool:
+        """Check whether a payload is already stored under *key*."""
+        pass
+
+    async def put(self, value) -> str:
+        """Store a json-serializable value and return its content key.
+
+        Args:
+            value: Any json-serializable object.
+
+        Returns:
+            str: The sha256 hex digest of the serialized value.
+        """
+        data = json.dumps(value, ensure_ascii=False, default=str).encode("utf-8")
+        key = hashlib.sha256(data).hexdigest()
+        if key in self._known_keys:
+            return key
+        if not await self._exists(key):
+            await self._write(key, _compress(data))
+        if len(self._known_keys) >= 100000:
+            self._known_keys.clear()
+        self._known_keys.add(key)
+        return key
+
+    async def get(self, key: str):
+        """Load the value stored under *key*."""
+        return json.loads(_decompress(await self._read(key)).decode("utf-8"))
+
+    async def offload(self, data: dict, threshold: int) -> dict:
+        """Replace the large values of *data* with blob references.
+
+        Values whose serialized size exceeds *threshold* bytes are moved to the
+        store. Lists are split element by element, so that a conversation which
+        only grows at its tail re-uses the blobs of all previous messages.
+
+        Args:
+            data: A flat dict of json-serializable values, e.g. node arguments.
+            threshold: Size in bytes above which a value is offloaded.
+
+        Returns:
+            dict: A shallow copy of *data* with references in place of large values.
+        """
+        result = {}
+        for k, v in data.items():
+            size = len(json.dumps(v, ensure_ascii=False, default=str).encode("utf-8"))
+            if size <= threshold:
+                result[k] = v
+                continue
+            items = v if isinstance(v, list) else [v]
+            try:
+                keys = [await self.put(item) for item in items]
+            except Exception as e:
+                # Keep the value inline rather than losing it on a store failure
+                logger.error(f"Failed to offload {k} to the blob store: {e}")
+                result[k] = v
+                continue
+            if isinstance(v, list):
+                result[k] = [{BLOB_REF_KEY: key} for key in keys]
+            else:
+                result[k] = {BLOB_REF_KEY: keys[0]}
+        return result
+
+    async def resolve(self, data: dict) -> dict:
+        """Inverse of :meth:`offload`: load the values behind blob references."""
+        result = {}
+        for k, v in data.items():
+            if is_blob_ref(v):
+                result[k] = await self.get(v[BLOB_REF_KEY])
+            elif isinstance(v, list) and v and all(is_blob_ref(item) for item in v):
+                result[k] = [await self.get(item[BLOB_REF_KEY]) for item in v]
+            else:
+                result[k] = v
+        return result
+
+    async def close(self):
+        pass
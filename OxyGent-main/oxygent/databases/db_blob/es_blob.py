@@ -0,0 +1,60 @@
+"""es_blob.py Elasticsearch Blob Store Module.
+
+Stores compressed blobs as base64 encoded ``binary`` fields in the
+``{app_name}_blob`` index, with the content key as document id.
+"""
+
+import base64
+
+from oxygent.config import Config
+from oxygent.utils.common_utils import get_format_time
+
+from .base_blob import BaseBlob
+
+
+class EsBlob(BaseBlob):
+    """Blob store backed by the same ES client as the node table."""
+
+    def __init__(self, es_client) -> None:
+        super().__init__()
+        self.es_client = es_client
+        self.index_name = Config.get_app_name() + "_blob"
+
+    async def create_index(self):
+        return await self.es_client.create_index(
+            self.index_name,
+            {
+                "mappings": {
+                    "properties": {
+                        "data": {"type": "binary"},
+                        "create_time": {
+                            "format": "yyyy-MM-dd HH:mm:ss.SSSSSSSSS",
+                            "type": "date",
+                        },
+                    },
+                },
+                "settings": Config.get_es_settings_config(),
+            },
+        )
+
+    async def _write(self, key: str, payload: bytes):
+        await self.es_client.index(
+            self.index_name,
+            doc_id=key,
+            body={
+                "data": base64.b64encode(payload).decode("ascii"),
+                "create_time": get_format_time(),
+            },
+        )
+
+    async def _read(self, key: str) -> bytes:
+        es_response = await self.es_client.search(
+            self.index_name, {"query": {"term": {"_id": key}}, "size": 1}
+        )
+        datas = es_response["hits"]["hits"]
+        if not datas:
+            raise KeyError(f"Blob {key} not found.")
+        return base64.b64decode(datas[0]["_source"]["data"])
+
+    async def _exists(self, key: str) -> bool:
+        return bool(await self.es_client.exists(self.index_name, doc_id=key))
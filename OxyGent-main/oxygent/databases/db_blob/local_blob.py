@@ -0,0 +1,52 @@
+"""local_blob.py Local Blob Store Module.
+
+Stores every blob as an individual write-once file under
+``{cache_dir}/local_blob_data/<key[:2]>/<key>``. Because files are named by the
+hash of their content, an existing file never has to be rewritten.
+"""
+
+import os
+
+import aiofiles
+import aiofiles.os
+from aiofiles import tempfile
+
+from oxygent.config import Config
+
+from .base_blob import BaseBlob
+
+
+class LocalBlob(BaseBlob):
+    """File-system-backed blob store used together with :class:`LocalEs`."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.data_dir: str = os.path.join(
+            Config.get_cache_save_dir(), "local_blob_data"
+        )
+        os.makedirs(self.data_dir, exist_ok=True)
+
+    def _blob_path(self, key: str) -> str:
+        return os.path.join(self.data_dir, key[:2], key)
+
+    async def _write(self, key: str, payload: bytes):
+        path = self._blob_path(key)
+        dir_name = os.path.dirname(path)
+        await aiofiles.os.makedirs(dir_name, exist_ok=True)
+        async with tempfile.NamedTemporaryFile(
+            mode="wb", delete=False, dir=dir_name, suffix=".tmp"
+        ) as tf:
+            await tf.write(payload)
+            tmp_path = tf.name
+        try:
+            await aiofiles.os.replace(tmp_path, path)
+        finally:
+            if await aiofiles.os.path.exists(tmp_path):
+                await aiofiles.os.unlink(tmp_path)
+
+    async def _read(self, key: str) -> bytes:
+        async with aiofiles.open(self._blob_path(key), "rb") as f:
+            return await f.read()
+
+    async def _exists(self, key: str) -> bool:
+        return await aiofiles.os.path.exists(self._blob_path(key))
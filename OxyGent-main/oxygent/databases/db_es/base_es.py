@@ -57,12 +57,14 @@ class BaseEs(BaseDB, ABC):
         pass
 
     @abstractmethod
-    async def search(self, index_name, body):
+    async def search(self, index_name, body, lookback_days=None):
         """Execute a search query against an Elasticsearch index.
 
         Args:
             index_name: Name of the index to search
             body: Search query body containing filters, aggregations, etc.
+            lookback_days: If the index is time-partitioned, only search the
+                partitions of the last ``lookback_days`` days
 
         Returns:
             Search results matching the query criteria
@@ -88,6 +90,21 @@ class BaseEs(BaseDB, ABC):
         """
         pass
 
+    @abstractmethod
+    async def purge_expired_partitions(self, index_name):
+        """Delete the partitions of a time-partitioned index that exceeded retention.
+
+        Args:
+            index_name: Logical name of the partitioned index
+
+        Returns:
+            List of the deleted partition names
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses
+        """
+        pass
+
     @abstractmethod
     async def close(self):
         """Close the Elasticsearch client connection and clean up resources.
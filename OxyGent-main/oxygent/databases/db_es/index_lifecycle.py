@@ -0,0 +1,93 @@
+"""index_lifecycle.py Time-partitioned index helpers.
+
+When ``es_lifecycle.is_enabled`` is set, the ``{app_name}_trace``, ``_node``,
+``_message`` and ``_history`` indices are split into daily or weekly partitions
+named ``{index_name}-YYYY.MM.DD`` (the date is the first day of the period).
+Writes go to the current partition, reads use ``{index_name}`` as an alias over
+all partitions, and partitions older than the configured retention are deleted
+by a background janitor.
+
+The functions here are shared by :class:`JesEs` and :class:`LocalEs`.
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from oxygent.config import Config
+
+PARTITIONED_INDEX_TYPES = ("trace", "node", "message", "history")
+PERIOD_DAYS = {"daily": 1, "weekly": 7}
+PARTITION_DATE_FORMAT = "%Y.%m.%d"
+
+
+def get_index_type(index_name: str) -> Optional[str]:
+    prefix = Config.get_app_name() + "_"
+    if index_name.startswith(prefix):
+        return index_name[len(prefix) :]
+    return None
+
+
+def is_partitioned(index_name: str) -> bool:
+    """Whether *index_name* is a logical index split into time partitions."""
+    return bool(Config.get_es_lifecycle_is_enabled()) and (
+        get_index_type(index_name) in PARTITIONED_INDEX_TYPES
+    )
+
+
+def get_period_days() -> int:
+    period = Config.get_es_lifecycle_period()
+    if period not in PERIOD_DAYS:
+        raise ValueError(f"Unsupported es_lifecycle period: {period}")
+    return PERIOD_DAYS[period]
+
+
+def get_partition_start(dt: datetime) -> datetime:
+    start = datetime(dt.year, dt.month, dt.day)
+    if get_period_days() == 7:
+        start -= timedelta(days=start.weekday())
+    return start
+
+
+def get_partition_name(index_name: str, dt: Optional[datetime] = None) -> str:
+    """Name of the partition of *index_name* that holds documents written at *dt*."""
+    start = get_partition_start(dt or datetime.now())
+    return f"{index_name}-{start.strftime(PARTITION_DATE_FORMAT)}"
+
+
+def get_partition_names(
+    index_name: str, days: int, now: Optional[datetime] = None
+) -> list:
+    """Names of the partitions covering the last *days* days, newest first."""
+    now = now or datetime.now()
+    period_days = get_period_days()
+    start = get_partition_start(now)
+    oldest = get_partition_start(now - timedelta(days=days))
+    names = []
+    while start >= oldest:
+        names.append(f"{index_name}-{start.strftime(PARTITION_DATE_FORMAT)}")
+        start -= timedelta(days=period_days)
+    return names
+
+
+def parse_partition_start(index_name: str, partition_name: str) -> Optional[datetime]:
+    prefix = index_name + "-"
+    if not partition_name.startswith(prefix):
+        return None
+    try:
+        return datetime.strptime(partition_name[len(prefix) :], PARTITION_DATE_FORMAT)
+    except ValueError:
+        return None
+
+
+def is_partition_expired(
+    index_name: str, partition_name: str, now: Optional[datetime] = None
+) -> bool:
+    """Whether every document of *partition_name* is older than its retention."""
+    retention_days = Config.get_es_lifecycle_retention().get(
+        get_index_type(index_name), 0
+    )
+    start = parse_partition_start(index_name, partition_name)
+    if not retention_days or start is None:
+        return False
+    end = start + timedelta(days=get_period_days())
+    return end <= (now or datetime.now()) - timedelta(days=retention_days)
@@ -1,9 +1,16 @@
 import logging
 import os
 
-from elasticsearch import AsyncElasticsearch
+from elasticsearch import AsyncElasticsearch, NotFoundError
 
 from .base_es import BaseEs
+from .index_lifecycle import (
+    get_partition_name,
+    get_partition_names,
+    get_period_days,
+    is_partition_expired,
+    is_partitioned,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +24,8 @@ class JesEs(BaseEs):
         except Exception as e:
             logger.error(e)
             self.client = None
+        # Read targets of the time-partitioned indices, see create_index
+        self._read_index_names = {}
 
     async def create_index(self, index_name: str, body: dict) -> dict:
         """Create a new index in Elasticsearch with the specified configuration.
@@ -37,6 +46,9 @@ class JesEs(BaseEs):
         if not body:
             raise ValueError("The config of the index ca not be empty")
 
+        if is_partitioned(index_name):
+            return await self._create_partitioned_index(index_name, body)
+
         # await self.client.indices.delete(index=index_name)  # !!! delete table
         # Create the index if not exists
         if not await self._index_exists(index_name):
@@ -68,17 +80,92 @@ class JesEs(BaseEs):
         """
         return await self.client.indices.create(index=index_name, body=body)
 
+    async def _create_partitioned_index(self, index_name: str, body: dict) -> dict:
+        """Register an index template for the partitions of *index_name*.
+
+        Partitions are created on first write from the template, which also
+        attaches them to the ``index_name`` read alias. An existing
+        unpartitioned index of the same name cannot coexist with that alias,
+        so it is kept and searched together with the partitions instead.
+        """
+        template = {k: v for k, v in body.items() if k in ["settings", "mappings"]}
+        is_legacy = await self._index_exists(
+            index_name
+        ) and not await self.client.indices.exists_alias(name=index_name)
+        if is_legacy:
+            logger.warning(
+                f"Index {index_name} is not partitioned, reindex it into "
+                f"{index_name}-* to enable the read alias."
+            )
+            self._read_index_names[index_name] = [index_name, f"{index_name}-*"]
+        else:
+            template["aliases"] = {index_name: {}}
+            self._read_index_names[index_name] = [index_name]
+        result = await self.client.indices.put_index_template(
+            name=index_name,
+            body={"index_patterns": [f"{index_name}-*"], "template": template},
+        )
+        partition_name = get_partition_name(index_name)
+        if not await self._index_exists(partition_name):
+            await self.client.indices.create(index=partition_name, body=template)
+        return result
+
     async def index(self, index_name, doc_id, body):
+        if index_name in self._read_index_names:
+            index_name = get_partition_name(index_name)
         return await self.client.index(index=index_name, id=doc_id, body=body)
 
     async def update(self, index_name, doc_id, body):
-        return await self.client.update(index=index_name, id=doc_id, body={"doc": body})
+        if index_name not in self._read_index_names:
+            return await self.client.update(
+                index=index_name, id=doc_id, body={"doc": body}
+            )
+        # The document was indexed in the current or, around a rollover, in the
+        # previous partition
+        partition_names = get_partition_names(index_name, get_period_days())
+        for partition_name in partition_names[:-1]:
+            try:
+                return await self.client.update(
+                    index=partition_name, id=doc_id, body={"doc": body}
+                )
+            except NotFoundError:
+                continue
+        return await self.client.update(
+            index=partition_names[-1], id=doc_id, body={"doc": body}
+        )
 
-    async def search(self, index_name, body):
-        return await self.client.search(index=index_name, body=body)
+    async def search(self, index_name, body, lookback_days=None):
+        if index_name not in self._read_index_names:
+            return await self.client.search(index=index_name, body=body)
+        if lookback_days is None:
+            index_names = self._read_index_names[index_name]
+        else:
+            index_names = get_partition_names(index_name, lookback_days)
+            if len(self._read_index_names[index_name]) > 1:
+                index_names.append(index_name)
+        return await self.client.search(
+            index=",".join(index_names), body=body, ignore_unavailable=True
+        )
 
     async def exists(self, index_name, doc_id):
-        return await self.client.exists(index=index_name, id=doc_id)
+        if index_name not in self._read_index_names:
+            return await self.client.exists(index=index_name, id=doc_id)
+        es_response = await self.search(
+            index_name, {"query": {"ids": {"values": [doc_id]}}, "size": 1}
+        )
+        return bool(es_response["hits"]["hits"])
+
+    async def purge_expired_partitions(self, index_name):
+        indices = await self.client.indices.get(
+            index=f"{index_name}-*", ignore_unavailable=True
+        )
+        expired_names = [
+            name for name in indices if is_partition_expired(index_name, name)
+        ]
+        if expired_names:
+            await self.client.indices.delete(index=",".join(expired_names))
+            logger.info(f"Deleted expired partitions: {expired_names}")
+        return expired_names
 
     async def close(self):
         return await self.client.close()
@@ -29,6 +29,14 @@ from aiofiles import tempfile
 from oxygent.config import Config
 
 from .base_es import BaseEs
+from .index_lifecycle import (
+    get_partition_name,
+    get_partition_names,
+    get_period_days,
+    is_partition_expired,
+    is_partitioned,
+    parse_partition_start,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +59,27 @@ class LocalEs(BaseEs):
     def _mapping_path(self, index_name: str) -> str:
         return os.path.join(self.data_dir, f"{index_name}_mapping.json")
 
+    def _partition_names(self, index_name: str) -> list[str]:
+        """Existing partitions of a time-partitioned index, newest first."""
+        names = []
+        for file_name in os.listdir(self.data_dir):
+            name, ext = os.path.splitext(file_name)
+            if ext == ".json" and parse_partition_start(index_name, name):
+                names.append(name)
+        return sorted(names, reverse=True)
+
+    def _read_index_names(
+        self, index_name: str, lookback_days: Optional[int] = None
+    ) -> list[str]:
+        """Files read for *index_name*: its partitions plus any legacy file."""
+        if not is_partitioned(index_name):
+            return [index_name]
+        if lookback_days is None:
+            names = self._partition_names(index_name)
+        else:
+            names = get_partition_names(index_name, lookback_days)
+        return names + [index_name]
+
     async def _write_json_atomic(self, path: str, data: Dict[str, Any]) -> None:
         """Write *data* to *path* atomically, UTF‑8 encoded."""
         async with tempfile.NamedTemporaryFile(
@@ -113,6 +142,8 @@ class LocalEs(BaseEs):
         await self._write_json_atomic(self._mapping_path(index_name), body)
 
         # 2) create empty index *only if it does not exist* – avoids wiping logs
+        if is_partitioned(index_name):
+            index_name = get_partition_name(index_name)
         index_path = self._index_path(index_name)
         if not await aiofiles.os.path.exists(index_path):
             await self._write_json_atomic(index_path, {})
@@ -164,17 +195,41 @@ class LocalEs(BaseEs):
         return {"_id": doc_id, "result": "updated" if update_mode else "created"}
 
     async def index(self, index_name: str, doc_id: str, body: dict[str, Any]):
+        if is_partitioned(index_name):
+            index_name = get_partition_name(index_name)
         return await self.insert(index_name, doc_id, body, update_mode=False)
 
     async def update(self, index_name: str, doc_id: str, body: dict[str, Any]):
+        if is_partitioned(index_name):
+            # The document was indexed in the current or, around a rollover,
+            # in the previous partition
+            partition_names = get_partition_names(index_name, get_period_days())
+            target_name = partition_names[0]
+            for partition_name in partition_names:
+                data = await self._read_json_safe(self._index_path(partition_name))
+                if data and doc_id in data:
+                    target_name = partition_name
+                    break
+            index_name = target_name
         return await self.insert(index_name, doc_id, body, update_mode=True)
 
     async def exists(self, index_name: str, doc_id: str) -> bool:
-        data = await self._read_json_safe(self._index_path(index_name)) or {}
-        return doc_id in data
+        for name in self._read_index_names(index_name):
+            data = await self._read_json_safe(self._index_path(name)) or {}
+            if doc_id in data:
+                return True
+        return False
 
-    async def search(self, index_name: str, body: dict[str, Any]):
-        data = await self._read_json_safe(self._index_path(index_name)) or {}
+    async def search(
+        self,
+        index_name: str,
+        body: dict[str, Any],
+        lookback_days: Optional[int] = None,
+    ):
+        data = {}
+        # Oldest first, so that the newest copy of a document wins
+        for name in reversed(self._read_index_names(index_name, lookback_days)):
+            data.update(await self._read_json_safe(self._index_path(name)) or {})
         docs = self._build_docs(data)
         docs = self._filter_docs(docs, body.get("query", {}))
         docs = self._sort_docs(docs, body.get("sort", []))
@@ -328,5 +383,22 @@ class LocalEs(BaseEs):
 
             return {"_id": target_doc_id, "result": "updated"}
 
+    async def purge_expired_partitions(self, index_name: str) -> list[str]:
+        expired_names = [
+            name
+            for name in self._partition_names(index_name)
+            if is_partition_expired(index_name, name)
+        ]
+        for name in expired_names:
+            lock = self._locks.setdefault(name, asyncio.Lock())
+            async with lock:
+                for path in [self._index_path(name), f"{self._index_path(name)}.bak"]:
+                    if await aiofiles.os.path.exists(path):
+                        await aiofiles.os.unlink(path)
+            self._locks.pop(name, None)
+        if expired_names:
+            logger.info("Deleted expired partitions: %s", expired_names)
+        return expired_names
+
     async def close(self) -> bool:  # noqa: D401 – nothing to clean
         return True
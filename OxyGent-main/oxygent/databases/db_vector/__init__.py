@@ -1,7 +1,12 @@
 from .base_vector_db import BaseVectorDB
+from .lexical_index import LexicalIndex, reciprocal_rank_fusion
+from .local_vector_db import LocalVectorDB
 from .vearch_db import VearchDB
 
 __all__ = [
     "BaseVectorDB",
+    "LexicalIndex",
+    "LocalVectorDB",
     "VearchDB",
+    "reciprocal_rank_fusion",
 ]
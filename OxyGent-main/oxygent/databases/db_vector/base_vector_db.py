@@ -20,3 +20,6 @@ class BaseVectorDB(BaseDB, ABC):
     @abstractmethod
     async def query_search(self, index_name, body):
         pass
+
+    async def close(self):
+        pass
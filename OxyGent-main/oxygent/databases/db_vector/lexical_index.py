@@ -0,0 +1,157 @@
+"""lexical_index.py Lexical Tool Index Module.
+
+This file implements an in-memory BM25 inverted index over the ``desc_for_llm`` of
+registered oxys. It complements the vector index for ``retrieve_tools``: exact tool
+names, parameter names and rare keywords are matched lexically, and the two rankings
+are merged with reciprocal-rank fusion.
+
+Text is tokenized into lower-cased word tokens, with ``snake_case`` and ``camelCase``
+identifiers additionally split into their parts. Runs of CJK characters, which have
+no word boundaries, are indexed as character unigrams and bigrams.
+
+The index is updated one document at a time, so oxys can be added while the MAS is
+being built without re-indexing the whole catalogue.
+"""
+
+import math
+import re
+from collections import defaultdict
+
+_WORD_PATTERN = re.compile(r"[A-Za-z0-9_]+")
+_CJK_PATTERN = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]+")
+_CAMEL_PATTERN = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+
+def tokenize(text):
+    """Split text into the terms used by :class:`LexicalIndex`.
+
+    Args:
+        text (str): Text to tokenize.
+
+    Returns:
+        list: Terms, with repetitions, in order of appearance.
+    """
+    tokens = []
+    for word in _WORD_PATTERN.findall(text):
+        tokens.append(word.lower())
+        parts = [
+            part.lower()
+            for piece in word.split("_")
+            for part in _CAMEL_PATTERN.findall(piece)
+        ]
+        if len(parts) > 1:
+            tokens.extend(parts)
+    for run in _CJK_PATTERN.findall(text):
+        tokens.extend(run)
+        tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def reciprocal_rank_fusion(rank_lists, k=60):
+    """Merge several rankings with reciprocal-rank fusion.
+
+    Each item scores ``sum(1 / (k + rank))`` over the lists it appears in, with ranks
+    starting at 1.
+
+    Args:
+        rank_lists (list): Lists of items, each ordered from best to worst.
+        k (int): Damping constant; larger values flatten the head of each list.
+
+    Returns:
+        list: The distinct items, ordered by fused score. Ties keep the order of
+        first appearance.
+    """
+    scores = {}
+    for rank_list in rank_lists:
+        for rank, item in enumerate(rank_list or [], start=1):
+            scores[item] = scores.get(item, 0.0) + 1.0 / (k + rank)
+    return sorted(scores, key=lambda item: -scores[item])
+
+
+class LexicalIndex(object):
+    """Incremental BM25 index of short documents keyed by name."""
+
+    def __init__(self, k1=1.2, b=0.75):
+        """Create an empty index.
+
+        Args:
+            k1 (float): BM25 term frequency saturation.
+            b (float): BM25 document length normalization.
+        """
+        self.k1 = k1
+        self.b = b
+        self.texts = {}
+        self.doc_lens = {}
+        self.postings = defaultdict(dict)
+        self.total_len = 0
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __contains__(self, name):
+        return name in self.texts
+
+    def add(self, name, text):
+        """Index a document, replacing any previous version with the same name.
+
+        Args:
+            name (str): Document key, e.g. the oxy name.
+            text (str): Document text.
+        """
+        text = text or ""
+        if self.texts.get(name) == text:
+            return
+        self.remove(name)
+        term_freqs = defaultdict(int)
+        tokens = tokenize(text)
+        for token in tokens:
+            term_freqs[token] += 1
+        for token, tf in term_freqs.items():
+            self.postings[token][name] = tf
+        self.texts[name] = text
+        self.doc_lens[name] = len(tokens)
+        self.total_len += len(tokens)
+
+    def remove(self, name):
+        """Remove a document from the index if it is present."""
+        text = self.texts.pop(name, None)
+        if text is None:
+            return
+        for token in set(tokenize(text)):
+            docs = self.postings.get(token)
+            if docs is None:
+                continue
+            docs.pop(name, None)
+            if not docs:
+                del self.postings[token]
+        self.total_len -= self.doc_lens.pop(name)
+
+    def search(self, query, top_k=10, names=None):
+        """Rank documents against a query with BM25.
+
+        Args:
+            query (str): Query text.
+            top_k (int): Maximum number of names to return.
+            names (Iterable[str], optional): Restrict the search to these documents.
+
+        Returns:
+            list: Names of matching documents, best first. Documents sharing no term
+            with the query are not returned.
+        """
+        if not self.texts:
+            return []
+        allowed = None if names is None else set(names)
+        n_docs = len(self.texts)
+        avg_len = self.total_len / n_docs or 1.0
+        scores = defaultdict(float)
+        for token in set(tokenize(query)):
+            docs = self.postings.get(token)
+            if not docs:
+                continue
+            idf = math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            for name, tf in docs.items():
+                if allowed is not None and name not in allowed:
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lens[name] / avg_len)
+                scores[name] += idf * tf * (self.k1 + 1) / (tf + norm)
+        return sorted(scores, key=lambda name: -scores[name])[:top_k]
@@ -0,0 +1,428 @@
+"""local_vector_db.py In-process Vector Database Implementation Module.
+
+This file implements a NumPy-backed alternative to :class:`VearchDB` for development
+boxes and small deployments that do not run a Vearch cluster. Vectors are kept in a
+float32 matrix per space, filtered with boolean masks on the metadata columns, ranked
+with a vectorized top-k, and persisted to ``{cache_dir}/local_vector_db``. Larger
+spaces can optionally be searched through an IVF partitioning with product-quantized
+(PQ) scoring.
+
+Select it with ``"backend": "local"`` in the vearch config, e.g.::
+
+    Config.set_vearch_config(
+        {
+            "backend": "local",
+            "tool_space_name": "tool_space",
+            "embedding_model_url": "http://...",
+        }
+    )
+"""
+
+import io
+import json
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+from oxygent.config import Config
+from oxygent.databases.db_vector.base_vector_db import BaseVectorDB
+from oxygent.databases.db_vector.retrieval_cache import ToolRetrievalCache
+from oxygent.embedding_cache import EmbeddingCache
+from oxygent.utils.common_utils import get_md5
+
+logger = logging.getLogger(__name__)
+
+
+def _kmeans(x, k, n_iter=10, seed=0):
+    """Plain Lloyd's k-means, returning the ``(k, dim)`` centroids."""
+    rng = np.random.default_rng(seed)
+    centroids = x[rng.choice(len(x), size=k, replace=False)].copy()
+    for _ in range(n_iter):
+        # argmin ||x - c||^2 == argmax (x.c - ||c||^2 / 2)
+        assign = np.argmax(x @ centroids.T - (centroids**2).sum(1) / 2, axis=1)
+        for j in range(k):
+            members = x[assign == j]
+            if len(members):
+                centroids[j] = members.mean(0)
+    return centroids
+
+
+def _top_k(scores, k):
+    """Indices of the *k* highest *scores*, best first."""
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class LocalVectorSpace(object):
+    """A single space: a float32 matrix plus one metadata dict per row.
+
+    Inner-product scores are used, like the ``InnerProduct`` metric of the
+    Vearch tool space, so vectors are expected to be L2-normalised.
+    """
+
+    def __init__(self, ivf_min_size=10000, nprobe=8, pq_m=0):
+        """Create an empty space.
+
+        Args:
+            ivf_min_size (int): Number of rows from which searches go through
+                an IVF index instead of a full scan.
+            nprobe (int): Number of IVF lists scanned per query.
+            pq_m (int): Number of PQ sub-vectors used to score IVF candidates,
+                ``0`` scores them exactly. The dimension must be divisible by it.
+        """
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+        self.metas = []
+        self.columns = {}
+        self.ivf_min_size = ivf_min_size
+        self.nprobe = nprobe
+        self.pq_m = pq_m
+        self._ivf = None
+
+    def __len__(self):
+        return len(self.metas)
+
+    def add(self, vectors, metas):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if len(self.metas):
+            self.vectors = np.concatenate([self.vectors, vectors])
+        else:
+            self.vectors = vectors
+        self.metas.extend(metas)
+        self._on_change()
+
+    def delete(self, mask):
+        keep = ~mask
+        self.vectors = self.vectors[keep]
+        self.metas = [meta for meta, k in zip(self.metas, keep) if k]
+        self._on_change()
+
+    def _on_change(self):
+        # Metadata columns for vectorized filtering, and a stale IVF index
+        self.columns = {}
+        self._ivf = None
+
+    def get_mask(self, filter):
+        """Boolean mask of the rows matching every ``field == value`` of *filter*."""
+        mask = np.ones(len(self.metas), dtype=bool)
+        for field, value in (filter or {}).items():
+            if value is None:
+                continue
+            if field not in self.columns:
+                self.columns[field] = np.array(
+                    [meta.get(field) for meta in self.metas], dtype=object
+                )
+            mask &= self.columns[field] == value
+        return mask
+
+    def search(self, emb, top_k, filter=None):
+        """Return ``(rows, scores)`` of the *top_k* best rows matching *filter*."""
+        if not len(self.metas):
+            return np.array([], dtype=int), np.array([], dtype=np.float32)
+        emb = np.asarray(emb, dtype=np.float32).reshape(-1)
+        mask = self.get_mask(filter)
+        if len(self.metas) >= self.ivf_min_size:
+            candidates = self._ivf_candidates(emb, mask, top_k)
+        else:
+            candidates = np.flatnonzero(mask)
+        scores = self.vectors[candidates] @ emb
+        best = _top_k(scores, top_k)
+        return candidates[best], scores[best]
+
+    def _ivf_candidates(self, emb, mask, top_k):
+        if self._ivf is None:
+            self._ivf = self._build_ivf()
+        centroids, assign, pq = self._ivf
+        matches = np.flatnonzero(mask)
+        nprobe = min(self.nprobe, len(centroids))
+        # A selective filter leaves fewer rows than the probed lists hold:
+        # scanning them exactly is cheaper and cannot miss any
+        if len(matches) <= nprobe * len(assign) / len(centroids):
+            candidates = matches
+        else:
+            # Widen the probe until the filtered candidates can fill top_k
+            order = np.argsort(-(centroids @ emb))
+            while True:
+                candidates = np.flatnonzero(mask & np.isin(assign, order[:nprobe]))
+                if len(candidates) >= top_k or nprobe >= len(centroids):
+                    break
+                nprobe = min(nprobe * 2, len(centroids))
+        if pq is None or len(candidates) <= top_k:
+            return candidates
+        # Score with the PQ codes and keep a few times top_k for exact re-ranking
+        codebooks, codes = pq
+        sub_embs = emb.reshape(len(codebooks), -1)
+        lut = np.einsum("mkd,md->mk", codebooks, sub_embs)
+        approx = lut[np.arange(len(codebooks)), codes[candidates]].sum(1)
+        return candidates[_top_k(approx, top_k * 4)]
+
+    def _build_ivf(self):
+        n, dim = self.vectors.shape
+        centroids = _kmeans(self.vectors, int(np.sqrt(n)))
+        assign = np.argmax(
+            self.vectors @ centroids.T - (centroids**2).sum(1) / 2, axis=1
+        )
+        pq = None
+        if self.pq_m and dim % self.pq_m == 0:
+            sub_vectors = self.vectors.reshape(n, self.pq_m, -1)
+            codebooks = np.stack(
+                [
+                    _kmeans(sub_vectors[:, m], min(256, n), n_iter=5)
+                    for m in range(self.pq_m)
+                ]
+            )
+            codes = np.stack(
+                [
+                    np.argmax(
+                        sub_vectors[:, m] @ codebooks[m].T
+                        - (codebooks[m] ** 2).sum(1) / 2,
+                        axis=1,
+                    )
+                    for m in range(self.pq_m)
+                ],
+                axis=1,
+            ).astype(np.uint8)
+            pq = (codebooks, codes)
+        return centroids, assign, pq
+
+    def save(self, path):
+        buffer = io.BytesIO()
+        np.savez(
+            buffer, vectors=self.vectors, metas=np.array(json.dumps(self.metas))
+        )
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(buffer.getvalue())
+        os.replace(tmp_path, path)
+
+    def load(self, path):
+        with np.load(path, allow_pickle=False) as data:
+            self.vectors = data["vectors"].astype(np.float32)
+            self.metas = json.loads(str(data["metas"]))
+        self._on_change()
+
+
+class LocalVectorDB(BaseVectorDB):
+    """In-process vector database, a drop-in replacement of :class:`VearchDB`.
+
+    It implements the methods of :class:`VearchDB` that the framework calls, so
+    it can be assigned to ``MAS.vearch_client``. Query embeddings go through the
+    :class:`EmbeddingCache`, which calls ``embedding_model_url``.
+    """
+
+    def __init__(self, config):
+        """Initialize the local vector database.
+
+        Args:
+            config: The vearch config dict. ``tool_space_name`` names the tool
+                space; ``ivf_min_size``, ``nprobe`` and ``pq_m`` tune the
+                search of large spaces (see :class:`LocalVectorSpace`).
+        """
+        self.config = config
+        self.tool_space_name = config.get("tool_space_name", "tool_space")
+        self.data_dir = os.path.join(Config.get_cache_save_dir(), "local_vector_db")
+        os.makedirs(self.data_dir, exist_ok=True)
+        self.spaces = {}
+        self.embedding_cache = EmbeddingCache()
+        self.retrieval_cache = ToolRetrievalCache(
+            max_size=config.get("retrieval_cache_size", 1024),
+            ttl=config.get("retrieval_cache_ttl", 300),
+        )
+
+    def _space_path(self, space_name):
+        return os.path.join(self.data_dir, f"{space_name}.npz")
+
+    def _get_space(self, space_name):
+        if space_name not in self.spaces:
+            space = LocalVectorSpace(
+                ivf_min_size=self.config.get("ivf_min_size", 10000),
+                nprobe=self.config.get("nprobe", 8),
+                pq_m=self.config.get("pq_m", 0),
+            )
+            if os.path.exists(self._space_path(space_name)):
+                space.load(self._space_path(space_name))
+            self.spaces[space_name] = space
+        return self.spaces[space_name]
+
+    async def _embed(self, texts):
+        return await self.embedding_cache.get(list(texts))
+
+    async def _embed_query(self, query):
+        emb = self.retrieval_cache.get_embedding(query)
+        if emb is None:
+            emb = (await self._embed([query]))[0]
+            self.retrieval_cache.set_embedding(query, emb)
+        return emb
+
+    def _save_space(self, space_name):
+        self.spaces[space_name].save(self._space_path(space_name))
+        self.retrieval_cache.invalidate()
+
+    async def create_space(self, space_config):
+        """Create an empty space named ``space_config["name"]`` if it does not exist."""
+        self._get_space(space_config["name"])
+        return {"code": 0, "msg": "success"}
+
+    async def drop_space(self, space_name):
+        self.spaces.pop(space_name, None)
+        self.retrieval_cache.invalidate()
+        if os.path.exists(self._space_path(space_name)):
+            os.remove(self._space_path(space_name))
+        return {"code": 0, "msg": "success"}
+
+    async def check_space_exist(self, space_name):
+        return space_name in self.spaces or os.path.exists(
+            self._space_path(space_name)
+        )
+
+    async def insert(self, space_name, docs, vector_col):
+        """Embed ``doc[vector_col]`` of every doc and add the docs to a space.
+
+        Args:
+            space_name: Name of the target space
+            docs: List of metadata dicts
+            vector_col: Name of the field to generate embeddings from
+        """
+        if not docs:
+            return
+        space = self._get_space(space_name)
+        space.add(await self._embed([doc[vector_col] for doc in docs]), docs)
+        self._save_space(space_name)
+
+    async def query_search(
+        self, space_name, query, retrieval_nums, fields=[], threshold=None, filter={}
+    ):
+        """Perform semantic search based on text query with optional threshold
+        filtering.
+
+        Args:
+            space_name: Name of the space to search
+            query: Text query to search for
+            retrieval_nums: Maximum number of results to return
+            fields: List of fields to include in results, all if empty
+            threshold: Optional score threshold for filtering results
+            filter: Optional ``field -> value`` equality filter
+
+        Returns:
+            pd.DataFrame: pandas.DataFrame containing search results
+        """
+        space = self._get_space(space_name)
+        emb = await self._embed_query(query)
+        rows, scores = space.search(emb, retrieval_nums, filter)
+        records = []
+        for row, score in zip(rows, scores):
+            if threshold is not None and score <= threshold:
+                continue
+            meta = space.metas[row]
+            record = {k: meta.get(k) for k in fields} if fields else dict(meta)
+            record["_score"] = float(score)
+            records.append(record)
+        return pd.DataFrame(records)
+
+    ##
+    ## NOTE: System-level methods for tool management
+    ##
+    async def create_vearch_table_by_tool_list(self, tool_list):
+        """Synchronize the tool space with the tools of an application.
+
+        Like :meth:`VearchDB.create_vearch_table_by_tool_list`, the rows already
+        in the space, with the MD5 of their description, act as the manifest:
+        only added or changed tools are embedded and inserted, and tools that
+        disappeared or changed are deleted.
+
+        Args:
+            tool_list: List of tuples containing tool information
+                      Format: [('app_name', 'agent_name', 'tool_name', 'tool_desc'), ...]
+        """
+        unique_app_name = {tool[0] for tool in tool_list}
+        assert len(unique_app_name) == 1, "app_name must be unique"
+        app_name = unique_app_name.pop()
+        docs = {
+            (agent_name, tool_name): {
+                "app_name": app_name,
+                "agent_name": agent_name,
+                "tool_name": tool_name,
+                "tool_desc": tool_desc,
+                "remark": get_md5(tool_desc),
+            }
+            for _, agent_name, tool_name, tool_desc in tool_list
+        }
+
+        space = self._get_space(self.tool_space_name)
+        manifest = {
+            (meta["agent_name"], meta["tool_name"]): meta.get("remark")
+            for meta in space.metas
+            if meta["app_name"] == app_name
+        }
+        stale_mask = space.get_mask({"app_name": app_name}) & np.array(
+            [
+                docs.get((meta["agent_name"], meta["tool_name"]), {}).get("remark")
+                != meta.get("remark")
+                for meta in space.metas
+            ],
+            dtype=bool,
+        )
+        changed_docs = [
+            doc for key, doc in docs.items() if manifest.get(key) != doc["remark"]
+        ]
+        if stale_mask.any():
+            space.delete(stale_mask)
+            self._save_space(self.tool_space_name)
+        await self.insert(self.tool_space_name, changed_docs, "tool_desc")
+        logger.info(
+            f"Tool space of {app_name}: {len(changed_docs)} upserted, "
+            f"{len(set(manifest) - set(docs))} deleted, "
+            f"{len(docs) - len(changed_docs)} unchanged."
+        )
+
+    async def delete_by_appname(self, app_name):
+        space = self._get_space(self.tool_space_name)
+        mask = space.get_mask({"app_name": app_name})
+        if mask.any():
+            space.delete(mask)
+            self._save_space(self.tool_space_name)
+
+    async def tool_retrieval(
+        self,
+        query,
+        app_name=None,
+        agent_name=None,
+        top_k=5,
+        threshold=0.01,
+        *args,
+        **kwargs,
+    ):
+        """Retrieve relevant tools based on query with app and agent filtering.
+
+        Args:
+            query: Text description of the desired tool functionality
+            app_name: Filter by application name
+            agent_name: Filter by agent name
+            top_k: Maximum number of tools to return (default: 5)
+            threshold: Minimum similarity score threshold (default: 0.01)
+
+        Returns:
+            list: List of tool names that match the criteria
+        """
+        tools = self.retrieval_cache.get_result(
+            query, app_name, agent_name, top_k, threshold
+        )
+        if tools is not None:
+            return tools
+        res_df = await self.query_search(
+            self.tool_space_name,
+            query,
+            top_k,
+            fields=["tool_name"],
+            threshold=threshold,
+            filter={"app_name": app_name, "agent_name": agent_name},
+        )
+        tools = [] if res_df.empty else res_df["tool_name"].to_list()
+        self.retrieval_cache.set_result(
+            query, app_name, agent_name, top_k, threshold, tools
+        )
+        return tools
@@ -0,0 +1,54 @@
+"""retrieval_cache.py Tool Retrieval Cache Module.
+
+This file implements the in-memory cache used by the vector databases for
+``retrieve_tools``. It has two levels:
+
+* query text -> query embedding, which saves the call to the embedding service;
+* (query, app_name, agent_name, top_k, threshold) -> tool names, which saves the
+  vector search.
+
+The result level is cleared whenever the tool index is modified through the owning
+client, and entries also expire after ``ttl`` seconds to bound staleness when the
+index is shared with other processes. Query embeddings do not depend on the index
+and are kept until evicted.
+"""
+
+from ...utils.lru_cache import LRUCache
+
+
+class ToolRetrievalCache(object):
+    """Two-level cache of query embeddings and tool retrieval results."""
+
+    def __init__(self, max_size=1024, ttl=300):
+        """Create the cache.
+
+        Args:
+            max_size (int): Maximum number of entries of each level.
+            ttl (float): Seconds after which a retrieval result expires.
+        """
+        self.embeddings = LRUCache(max_size)
+        self.results = LRUCache(max_size, ttl)
+
+    def get_embedding(self, query):
+        return self.embeddings.get(query)
+
+    def set_embedding(self, query, emb):
+        self.embeddings.set(query, emb)
+
+    def get_result(self, query, app_name, agent_name, top_k, threshold):
+        tools = self.results.get((query, app_name, agent_name, top_k, threshold))
+        return None if tools is None else list(tools)
+
+    def set_result(self, query, app_name, agent_name, top_k, threshold, tools):
+        self.results.set((query, app_name, agent_name, top_k, threshold), list(tools))
+
+    def invalidate(self):
+        """Drop all retrieval results, called when the tool index changes."""
+        self.results.clear()
+
+    def get_stats(self):
+        """Return the size, hits, misses and hit rate of both levels."""
+        return {
+            "embedding": self.embeddings.get_stats(),
+            "result": self.results.get_stats(),
+        }
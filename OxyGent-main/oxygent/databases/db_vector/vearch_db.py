@@ -8,6 +8,7 @@ embedding support and advanced filtering capabilities.
 import asyncio
 import base64
 import json
+import logging
 import random
 
 import httpx
@@ -15,7 +16,16 @@ import numpy as np
 import pandas as pd
 
 from oxygent.databases.db_vector.base_vector_db import BaseVectorDB
+from oxygent.databases.db_vector.retrieval_cache import ToolRetrievalCache
 from oxygent.embedding_cache import EmbeddingCache
+from oxygent.utils.common_utils import get_md5
+
+logger = logging.getLogger(__name__)
+
+
+def get_tool_doc_id(app_name, agent_name, tool_name):
+    """Deterministic document id of a tool, so re-uploads overwrite in place."""
+    return get_md5(f"{app_name}\t{agent_name}\t{tool_name}")
 
 
 class VectorToolAsync(object):
@@ -23,14 +33,54 @@ class VectorToolAsync(object):
 
     This class provides HTTP-based communication with Vearch master and router nodes,
     handling database creation, space management, document operations, and search
-    queries. All operations are asynchronous and use httpx for HTTP communication.
+    queries. All operations are asynchronous and go through one pooled keep-alive
+    httpx client per node type, with bounded concurrency and retries.
     """
 
-    def __init__(self):
-        pass
+    def __init__(
+        self, max_connections=20, max_concurrency=16, retries=2, timeout=20.0
+    ):
+        """Create the pooled clients.
 
-    @staticmethod
-    async def create_db(master_url, db_name):
+        Args:
+            max_connections: Maximum open connections of each client
+            max_concurrency: Maximum number of requests in flight
+            retries: Extra attempts on transport errors and 5xx responses
+            timeout: Request timeout in seconds
+        """
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self.master_client = httpx.AsyncClient(limits=limits, timeout=timeout)
+        self.router_client = httpx.AsyncClient(limits=limits, timeout=timeout)
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.retries = retries
+
+    async def _request(self, client, method, url, content_factory=None, **kwargs):
+        """Send a request, retrying transport errors and 5xx responses.
+
+        A streamed body can only be sent once, so it is passed as
+        ``content_factory``, which is called again for every attempt.
+        """
+        for attempt in range(self.retries + 1):
+            if content_factory:
+                kwargs["content"] = content_factory()
+            try:
+                async with self.semaphore:
+                    response = await client.request(method, url, **kwargs)
+                if response.status_code < 500 or attempt == self.retries:
+                    return response
+            except httpx.TransportError:
+                if attempt == self.retries:
+                    raise
+            await asyncio.sleep(0.1 * 2**attempt)
+
+    async def close(self):
+        await self.master_client.aclose()
+        await self.router_client.aclose()
+
+    async def create_db(self, master_url, db_name):
         """Create a new database in Vearch.
 
         Args:
@@ -45,12 +95,10 @@ class VectorToolAsync(object):
         """
         url = f"{master_url}/db/_create"
         data = {"name": db_name}
-        async with httpx.AsyncClient() as client:
-            response = await client.put(url, json=data)
-            return response.json()
+        response = await self._request(self.master_client, "PUT", url, json=data)
+        return response.json()
 
-    @staticmethod
-    async def create_space(master_url, db_name, space_config):
+    async def create_space(self, master_url, db_name, space_config):
         """Create a new space (table) within a database.
 
         Args:
@@ -62,12 +110,12 @@ class VectorToolAsync(object):
             Dict[str, Any]: API Response
         """
         url = f"{master_url}/space/{db_name}/_create"
-        async with httpx.AsyncClient() as client:
-            response = await client.put(url, json=space_config)
-            return response.json()
+        response = await self._request(
+            self.master_client, "PUT", url, json=space_config
+        )
+        return response.json()
 
-    @staticmethod
-    async def drop_space(master_url, db_name, space_name):
+    async def drop_space(self, master_url, db_name, space_name):
         """Delete a space from the database.
 
         Args:
@@ -79,9 +127,8 @@ class VectorToolAsync(object):
             str: Text response from the Vearch API
         """
         url = f"{master_url}/space/{db_name}/{space_name}"
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(url)
-            return response.text
+        response = await self._request(self.master_client, "DELETE", url)
+        return response.text
 
     @staticmethod
     def generate_random_str(randomlength=10):
@@ -96,8 +143,7 @@ class VectorToolAsync(object):
         base_str = "ABCDEFGHIGKLMNOPQRSTUVWXYZabcdefghigklmnopqrstuvwxyz0123456789"
         return "".join(random.choices(base_str, k=randomlength))
 
-    @staticmethod
-    async def insert_batch(db_name, space_name, router_url, data_list):
+    async def insert_batch(self, db_name, space_name, router_url, data_list):
         """Insert multiple documents in batch using bulk API.
 
         Args:
@@ -110,12 +156,56 @@ class VectorToolAsync(object):
             str: Text response from the Vearch API
         """
         url = f"{router_url}/{db_name}/{space_name}/_bulk"
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, data=data_list)
+        response = await self._request(self.router_client, "POST", url, data=data_list)
+        return response.text
+
+    async def insert_bulk(
+        self, db_name, space_name, router_url, docs, chunk_size=500
+    ):
+        """Insert documents with the bulk API, in chunks of ``chunk_size``.
+
+        Each chunk is streamed as NDJSON while it is being serialized, instead
+        of building a single body for all documents. Chunks are sent
+        concurrently within the client's concurrency bound.
+
+        Args:
+            db_name: Name of the target database
+            space_name: Name of the target space
+            router_url: URL of the Vearch router node
+            docs: List of ``(doc_id, document)`` tuples
+            chunk_size: Number of documents per bulk request
+
+        Returns:
+            list: Text responses of the bulk requests
+        """
+        url = f"{router_url}/{db_name}/{space_name}/_bulk"
+
+        async def iter_ndjson(chunk):
+            for doc_id, doc in chunk:
+                yield (
+                    json.dumps({"index": {"_id": doc_id}})
+                    + "\n"
+                    + json.dumps(doc)
+                    + "\n"
+                ).encode("utf-8")
+
+        async def insert_chunk(chunk):
+            response = await self._request(
+                self.router_client,
+                "POST",
+                url,
+                content_factory=lambda: iter_ndjson(chunk),
+            )
             return response.text
 
-    @staticmethod
-    async def insert_single(db_name, space_name, router_url, data_list):
+        return await asyncio.gather(
+            *[
+                insert_chunk(docs[i : i + chunk_size])
+                for i in range(0, len(docs), chunk_size)
+            ]
+        )
+
+    async def insert_single(self, db_name, space_name, router_url, data_list):
         """Insert a single document.
 
         Args:
@@ -128,12 +218,10 @@ class VectorToolAsync(object):
             str: Text response from the Vearch API
         """
         url = f"{router_url}/{db_name}/{space_name}"
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, data=data_list)
-            return response.text
+        response = await self._request(self.router_client, "POST", url, data=data_list)
+        return response.text
 
-    @staticmethod
-    async def check_info(db_name, space_name, master_url):
+    async def check_info(self, db_name, space_name, master_url):
         """Check space information and status.
 
         Args:
@@ -145,12 +233,10 @@ class VectorToolAsync(object):
             Dict[str, Any]: JSON response containing space status
         """
         url = f"{master_url}/space/{db_name}/{space_name}"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            return response.json()
+        response = await self._request(self.master_client, "GET", url)
+        return response.json()
 
-    @staticmethod
-    async def get_cluster_health(master_url):
+    async def get_cluster_health(self, master_url):
         """Get cluster health information including document counts.
 
         Args:
@@ -160,12 +246,10 @@ class VectorToolAsync(object):
             Dict[str, Any]: JSON response containing cluster health data
         """
         url = f"{master_url}/_cluster/health"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            return response.json()
+        response = await self._request(self.master_client, "GET", url)
+        return response.json()
 
-    @staticmethod
-    async def check_doc_num(master_url, db_name, space_name):
+    async def check_doc_num(self, master_url, db_name, space_name):
         """Get the number of documents in a specific space.
 
         Args:
@@ -180,7 +264,7 @@ class VectorToolAsync(object):
             This assumes the response structure is a list;
             may need adjustment based on actual API response
         """
-        his = await VectorToolAsync.get_cluster_health(master_url)
+        his = await self.get_cluster_health(master_url)
         doc_num = -1
         for it in his:
             if it["db_name"] == db_name:
@@ -189,8 +273,7 @@ class VectorToolAsync(object):
                         return more_info["doc_num"]
         return doc_num
 
-    @staticmethod
-    async def search_by_filter(db_name, space_name, router_url, data_list):
+    async def search_by_filter(self, db_name, space_name, router_url, data_list):
         """Search documents using filter conditions only.
 
         Args:
@@ -203,12 +286,12 @@ class VectorToolAsync(object):
             Dict[str, Any]: JSON response containing search results
         """
         url = f"{router_url}/{db_name}/{space_name}/_search"
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=data_list)
-            return response.json()
+        response = await self._request(self.router_client, "POST", url, json=data_list)
+        return response.json()
 
-    @staticmethod
-    async def emb_search(db_name, space_name, router_url, emb, retrieval_nums, fields):
+    async def emb_search(
+        self, db_name, space_name, router_url, emb, retrieval_nums, fields
+    ):
         """Perform vector similarity search using embeddings.
 
         Args:
@@ -233,13 +316,20 @@ class VectorToolAsync(object):
             "is_brute_search": 1,
             "size": retrieval_nums,
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=search_query)
-            return response.json()
+        response = await self._request(
+            self.router_client, "POST", url, json=search_query
+        )
+        return response.json()
 
-    @staticmethod
     async def filter_and_emb_search(
-        db_name, space_name, router_url, emb, retrieval_nums, fields, filter={}
+        self,
+        db_name,
+        space_name,
+        router_url,
+        emb,
+        retrieval_nums,
+        fields,
+        filter={},
     ):
         """Perform hybrid search combining vector similarity and filter conditions.
 
@@ -270,12 +360,12 @@ class VectorToolAsync(object):
             "is_brute_search": 1,
             "size": retrieval_nums,
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=search_query)
-            return response.json()
+        response = await self._request(
+            self.router_client, "POST", url, json=search_query
+        )
+        return response.json()
 
-    @staticmethod
-    async def delete_by_docid(db_name, space_name, router_url, doc_id):
+    async def delete_by_docid(self, db_name, space_name, router_url, doc_id):
         """Delete a document by its ID.
 
         Args:
@@ -288,9 +378,8 @@ class VectorToolAsync(object):
             str: Text response from the Vearch API
         """
         url = f"{router_url}/{db_name}/{space_name}/{doc_id}"
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(url)
-            return response.text
+        response = await self._request(self.router_client, "DELETE", url)
+        return response.text
 
     @staticmethod
     def retrieval2df(res):
@@ -354,7 +443,12 @@ class VearchDB(BaseVectorDB):
             System usage must provide this configuration.
         """
         self.config = VearchConfig(config)
-        self.vearch_tools = VectorToolAsync()  # Initialize vector datebase tools
+        # Initialize vector datebase tools, owning the pooled HTTP clients
+        self.vearch_tools = VectorToolAsync(
+            max_connections=config.get("max_connections", 20),
+            max_concurrency=config.get("max_concurrency", 16),
+            retries=config.get("retries", 2),
+        )
         # Low level operations are not provided in this class
 
         if (
@@ -363,11 +457,23 @@ class VearchDB(BaseVectorDB):
             pass
 
         if "embedding_model_url" in config:  # Initalize  embedding function
-            emb_model = EmbeddingModel(url=self.config.embedding_model_url)
-            self.emb_func = emb_model.get_embeddings_async
+            self.emb_model = EmbeddingModel(url=self.config.embedding_model_url)
+            self.emb_func = self.emb_model.get_embeddings_async
         else:
+            self.emb_model = None
             self.emb_func = None
 
+        self.retrieval_cache = ToolRetrievalCache(
+            max_size=config.get("retrieval_cache_size", 1024),
+            ttl=config.get("retrieval_cache_ttl", 300),
+        )
+
+    async def close(self):
+        """Close the pooled HTTP clients."""
+        await self.vearch_tools.close()
+        if self.emb_model:
+            await self.emb_model.close()
+
     async def create_space(self, space_config):
         """Create a new space with custom configuration.
 
@@ -549,11 +655,14 @@ class VearchDB(BaseVectorDB):
     ## NOTE: System-level methods for tool management
     ##
     async def create_vearch_table_by_tool_list(self, tool_list):
-        """Initialize Vearch database with tool information for system use.
+        """Synchronize the tool space with the tools of an application.
 
-        This method creates and populates the system tool space with tool metadata
-        and embeddings for efficient retrieval. It handles the complete workflow
-        from space creation to data upload.
+        Each tool document has a deterministic id derived from
+        (app_name, agent_name, tool_name) and stores the MD5 of its description
+        in ``remark``. The ids and hashes already in the space act as the
+        manifest: only added or changed tools are embedded and upserted, and
+        tools that disappeared are deleted. An unchanged deployment therefore
+        costs a single filter search.
 
         Args:
             tool_list: List of tuples containing tool information
@@ -569,29 +678,45 @@ class VearchDB(BaseVectorDB):
         df = pd.DataFrame(
             tool_list, columns=["app_name", "agent_name", "tool_name", "tool_desc"]
         )
-        # print(df)
 
-        # 1. Generate embeddings for tool dscriptions
-        with EmbeddingCache() as embedding:
-            # Method 1: Individual embedding
-            # for app_name, agent_name, tool_name, tool_desc in tool_list:
-            #     tool_desc_embedding = embedding.get(tool_desc)
-            #     print(tool_desc_embedding)
-
-            # Method 2: Batch embedding
-            tool_desc_embeddings = await embedding.get(list(df["tool_desc"]))
-            df["tool_desc_embedding"] = list(tool_desc_embeddings)
-
-        # 2. Validate single app constraint
+        # 1. Validate single app constraint
         unique_app_name = df["app_name"].unique()
         assert len(unique_app_name) == 1, "app_name must be unique"
 
-        # 3. Clean existing data for this app
-        await self.delete_by_appname(unique_app_name[0])
+        # 2. Diff against the manifest stored in the space
+        df["_id"] = [
+            get_tool_doc_id(*row)
+            for row in df[["app_name", "agent_name", "tool_name"]].values
+        ]
+        df["remark"] = df["tool_desc"].map(get_md5)
+        manifest = await self.recall_manifest_by_appname(unique_app_name[0]) or {}
+        changed_df = df[df["_id"].map(manifest.get) != df["remark"]].copy()
+        removed_ids = set(manifest) - set(df["_id"])
+
+        # 3. Delete removed tools
+        if removed_ids:
+            self.retrieval_cache.invalidate()
+        for doc_id in removed_ids:
+            await self.vearch_tools.delete_by_docid(
+                self.config.db_name,
+                self.config.tool_space_name,
+                self.config.router_url,
+                doc_id,
+            )
 
-        # 4. Update new data
-        await self.upload_by_df(df)
+        # 4. Embed and upsert added or changed tools
+        if not changed_df.empty:
+            with EmbeddingCache(emb_func=self.emb_func) as embedding:
+                tool_desc_embeddings = await embedding.get(
+                    list(changed_df["tool_desc"])
+                )
+            changed_df["tool_desc_embedding"] = list(tool_desc_embeddings)
+            await self.upload_by_df(changed_df)
 
+        logger.info(
+            f"Tool space of {unique_app_name[0]}: {len(changed_df)} upserted, "
+            f"{len(removed_ids)} deleted, {len(df) - len(changed_df)} unchanged."
+        )
         return
 
     async def upload_by_df(self, df):
@@ -601,10 +726,11 @@ class VearchDB(BaseVectorDB):
             df: pandas.DataFrame containing tool information with embeddings
 
         Returns:
-            str: Response from bulk insert operation
+            list: Responses from the chunked bulk insert operation
         """
-        items = ""
+        docs = []
         for ind, row in df.iterrows():
+            doc_id = row.get("_id") or self.vearch_tools.generate_random_str()
             # Prepare document data
             data = {
                 "app_name": row["app_name"],
@@ -614,21 +740,17 @@ class VearchDB(BaseVectorDB):
                     "feature": [float(e) for e in list(row["tool_desc_embedding"])]
                 },
                 "tool_desc": row["tool_desc"],
-                "remark": "1",
+                "remark": row.get("remark") or "1",
             }
-            # Build NDJSON format for bulk insert
-            items += (
-                json.dumps({"index": {"_id": self.vearch_tools.generate_random_str()}})
-                + "\n"
-                + json.dumps(data)
-                + "\n"
-            )
+            docs.append((doc_id, data))
         # Perform bulk insert
-        res = await self.vearch_tools.insert_batch(
+        self.retrieval_cache.invalidate()
+        res = await self.vearch_tools.insert_bulk(
             self.config.db_name,
             self.config.tool_space_name,
             self.config.router_url,
-            items,
+            docs,
+            chunk_size=getattr(self.config, "bulk_chunk_size", 500),
         )
 
         return res
@@ -640,6 +762,7 @@ class VearchDB(BaseVectorDB):
             app_name: Name of the application whose tools should be deleted
         """
         ids = await self.recall_by_appname(app_name)
+        self.retrieval_cache.invalidate()
 
         # Delete each document individually
         for doc_id in ids:
@@ -682,6 +805,35 @@ class VearchDB(BaseVectorDB):
             ids = []
         return ids
 
+    async def recall_manifest_by_appname(self, app_name):
+        """Retrieve the document ids and description hashes of an app's tools.
+
+        Args:
+            app_name: Name of the application to search for
+
+        Returns:
+            dict: Mapping of document id to the ``remark`` (description MD5)
+        """
+        search_query = {
+            "query": {
+                "filter": [
+                    {"term": {"app_name": app_name}},
+                ]
+            },
+            "fields": ["remark"],
+            "size": 20000,  # Large number to get all documents
+        }
+        resp = await self.vearch_tools.search_by_filter(
+            self.config.db_name,
+            self.config.tool_space_name,
+            self.config.router_url,
+            search_query,
+        )
+        if not self.vearch_tools.check_search_result(resp):
+            return {}
+        res_df = self.vearch_tools.retrieval2df(resp)
+        return dict(zip(res_df["_id"], res_df["remark"]))
+
     async def tool_retrieval(
         self,
         query,
@@ -707,8 +859,16 @@ class VearchDB(BaseVectorDB):
         Returns:
             list: List of tool names that match the criteria
         """
+        tools = self.retrieval_cache.get_result(
+            query, app_name, agent_name, top_k, threshold
+        )
+        if tools is not None:
+            return tools
         filter = {"app_name": app_name, "agent_name": agent_name}
-        emb = await self.emb_func([query])
+        emb = self.retrieval_cache.get_embedding(query)
+        if emb is None:
+            emb = await self.emb_func([query])
+            self.retrieval_cache.set_embedding(query, emb)
         # Perform filtered similarity search
         resp = await self.vearch_tools.filter_and_emb_search(
             self.config.db_name,
@@ -724,9 +884,12 @@ class VearchDB(BaseVectorDB):
             res_df = self.vearch_tools.retrieval2df(resp)
             res_df = res_df.loc[res_df["_score"] > threshold]
             tools = res_df["tool_name"].to_list()
-            return tools
         else:
-            return []
+            tools = []
+        self.retrieval_cache.set_result(
+            query, app_name, agent_name, top_k, threshold, tools
+        )
+        return tools
 
     ##
     ## NOTE:Agent-level methods for table operations
@@ -862,8 +1025,19 @@ class EmbeddingModel(object):
     and proper error handling.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, max_connections=20):
         self.url = url
+        self.client = httpx.AsyncClient(
+            verify=False,  # Skip SSL verification if needed
+            timeout=60.0,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    async def close(self):
+        await self.client.aclose()
 
     async def get_embeddings_async(self, querys):
         """Generate embeddings for a batch of text queries asynchronously.
@@ -904,48 +1078,44 @@ class EmbeddingModel(object):
                 ],
                 "outputs": [{"name": "last_hidden_state_clip"}],
             }
-            # Make async HTTP request
-            async with httpx.AsyncClient(
-                verify=False,  # Skip SSL verification if needed
-                timeout=60.0,
-            ) as client:
-                response = await client.post(
-                    url,
-                    headers={
-                        "Accept-Encoding": "identity",
-                    },
-                    json=payload,
-                )
-                # Check HTTP status
-                if response.status_code != 200:
-                    # print(f"HTTP error: {response.status}")
-                    return None
-
-                # Parse JSON response
-                result = response.json()
-
-                # Parallel processing optimization for result decoding
-                decode_tasks = []
-
-                # Create async tasks for decoding each embedding
-                for item in result["outputs"][0]["data"]:
-                    task = asyncio.create_task(
-                        asyncio.to_thread(
-                            lambda x: np.array(
-                                json.loads(base64.b64decode(x).decode("utf-8"))
-                            ),
-                            item,
-                        )
+            # Make async HTTP request on the pooled keep-alive client
+            response = await self.client.post(
+                url,
+                headers={
+                    "Accept-Encoding": "identity",
+                },
+                json=payload,
+            )
+            # Check HTTP status
+            if response.status_code != 200:
+                # print(f"HTTP error: {response.status}")
+                return None
+
+            # Parse JSON response
+            result = response.json()
+
+            # Parallel processing optimization for result decoding
+            decode_tasks = []
+
+            # Create async tasks for decoding each embedding
+            for item in result["outputs"][0]["data"]:
+                task = asyncio.create_task(
+                    asyncio.to_thread(
+                        lambda x: np.array(
+                            json.loads(base64.b64decode(x).decode("utf-8"))
+                        ),
+                        item,
                     )
-                    decode_tasks.append(task)
-                # Wait for all decoding tasks to complete
-                decoded_data = await asyncio.gather(*decode_tasks)
-                # Combine results into single array
-                combined = np.concatenate(decoded_data)
-                # Normalize vectors for consistent similarity computation
-                norms = np.linalg.norm(combined, axis=1, keepdims=True)
-                normalized = combined / norms
-                return normalized
+                )
+                decode_tasks.append(task)
+            # Wait for all decoding tasks to complete
+            decoded_data = await asyncio.gather(*decode_tasks)
+            # Combine results into single array
+            combined = np.concatenate(decoded_data)
+            # Normalize vectors for consistent similarity computation
+            norms = np.linalg.norm(combined, axis=1, keepdims=True)
+            normalized = combined / norms
+            return normalized
         except httpx.HTTPError as e:
             raise ValueError(f"HTTP client error: {str(e)}")
             # print(f"HTTP client error: {str(e)}")
@@ -1,18 +1,32 @@
+import asyncio
 import base64
 import hashlib
 import json
 import logging
 import os
 import pickle
+import sqlite3
+import threading
 
 import httpx
 import numpy as np
 from tqdm import tqdm
 
 from .config import Config
+from .utils.common_utils import chunk_list
 
 logger = logging.getLogger(__name__)
 
+_http_client = None
+
+
+def _get_http_client():
+    """Return the module's pooled keep-alive client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=60.0)
+    return _http_client
+
 
 async def get_embedding(querys):
     """Retrieve L2-normalised embeddings for a batch of input texts.
@@ -55,11 +69,10 @@ async def get_embedding(querys):
         }
         headers = {"Accept-Encoding": "identity"}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url=Config.get_vearch_embedding_model_url(), headers=headers, json=data
-            )
-            result = response.json()
+        response = await _get_http_client().post(
+            url=Config.get_vearch_embedding_model_url(), headers=headers, json=data
+        )
+        result = response.json()
 
         # ------------------------------------------------------------------
         # The server returns a list whose elements are base64‑encoded strings
@@ -84,68 +97,311 @@ async def get_embedding(querys):
         logger.error(e)
 
 
+class EmbeddingStore:
+    """Append-only, memory-mapped storage for embedding vectors.
+
+    Vectors are rows of a contiguous matrix kept in a memory-mapped ``.npy``
+    file, and a SQLite table maps each key to its row. Opening the store only
+    maps the file and opens the database, so startup time and resident memory
+    do not grow with the number of cached embeddings.
+
+    Writers are serialized by the SQLite write lock of the directory
+    (``BEGIN IMMEDIATE``), which also holds across processes: rows are allocated
+    from the count stored in the database inside the write transaction, and the
+    matrix is remapped whenever another writer has created or grown its file.
+    Rows are written before the transaction that references them is committed,
+    so a crash can at worst leave unreferenced rows behind, which are
+    overwritten by the next insertion.
+
+    Use :func:`open_embedding_store` to share one store per directory within a
+    process.
+    """
+
+    def __init__(self, save_dir, dtype="float32", init_capacity=1024):
+        """Open (or create) the store under *save_dir*.
+
+        Args:
+            save_dir (str): Directory holding ``vectors.npy`` and ``index.db``.
+            dtype (str, optional): ``"float32"`` or ``"float16"``, used when the
+                matrix is created. An existing matrix keeps its dtype.
+            init_capacity (int, optional): Rows allocated for a new matrix; the
+                capacity doubles whenever it is exhausted.
+        """
+        os.makedirs(save_dir, exist_ok=True)
+        self.save_dir = save_dir
+        self.vector_file = os.path.join(save_dir, "vectors.npy")
+        self.dtype = np.dtype(dtype)
+        self.init_capacity = init_capacity
+        self.lock = threading.RLock()
+        # Autocommit mode: write transactions are opened explicitly
+        self.conn = sqlite3.connect(
+            os.path.join(save_dir, "index.db"),
+            timeout=60,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_index "
+            "(key TEXT PRIMARY KEY, row INTEGER NOT NULL)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER)"
+        )
+        self.vectors = None
+        self.vector_inode = None
+        self._refresh_vectors()
+
+    def _get_count(self):
+        row = self.conn.execute("SELECT value FROM meta WHERE name = 'count'").fetchone()
+        return row[0] if row else 0
+
+    def _refresh_vectors(self):
+        """Map the current matrix file if it differs from the mapped one."""
+        try:
+            inode = os.stat(self.vector_file).st_ino
+        except FileNotFoundError:
+            return
+        if inode == self.vector_inode and self.vectors is not None:
+            return
+        self.vectors = np.lib.format.open_memmap(self.vector_file, mode="r+")
+        self.vector_inode = inode
+        self.dtype = self.vectors.dtype
+
+    def __len__(self):
+        return self._get_count()
+
+    def __contains__(self, key):
+        return self.get_rows([key]).get(key) is not None
+
+    def get_rows(self, keys):
+        """Return a dict mapping the stored keys among *keys* to their rows."""
+        rows = {}
+        keys = list(dict.fromkeys(keys))
+        with self.lock:
+            # Stay below SQLite's default limit of host parameters per statement
+            for i in range(0, len(keys), 500):
+                batch = keys[i : i + 500]
+                cursor = self.conn.execute(
+                    "SELECT key, row FROM embedding_index WHERE key IN (%s)"
+                    % ",".join("?" * len(batch)),
+                    batch,
+                )
+                rows.update(cursor.fetchall())
+        return rows
+
+    def _read_rows(self, rows):
+        with self.lock:
+            self._refresh_vectors()
+            return np.asarray(self.vectors[rows], dtype=np.float32)
+
+    def get(self, key):
+        row = self.get_rows([key]).get(key)
+        if row is None:
+            return None
+        return self._read_rows(row)
+
+    def get_many(self, keys):
+        """Return the vectors of *keys* as a float32 matrix, in order.
+
+        Raises:
+            KeyError: If one of *keys* is not stored.
+        """
+        rows = self.get_rows(keys)
+        return self._read_rows([rows[k] for k in keys])
+
+    def put_many(self, keys, features):
+        """Append the vectors of the keys that are not stored yet."""
+        features = np.asarray(features)
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                stored = self.get_rows(keys)
+                new_items = {}
+                for key, feature in zip(keys, features):
+                    if key not in stored:
+                        new_items[key] = feature
+                if not new_items:
+                    self.conn.execute("COMMIT")
+                    return
+                start = self._get_count()
+                self._refresh_vectors()
+                self._ensure_capacity(start, start + len(new_items), features.shape[-1])
+                self.vectors[start : start + len(new_items)] = np.stack(
+                    list(new_items.values())
+                ).astype(self.dtype)
+                self.vectors.flush()
+                self.conn.executemany(
+                    "INSERT INTO embedding_index (key, row) VALUES (?, ?)",
+                    [(key, start + i) for i, key in enumerate(new_items)],
+                )
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('count', ?)",
+                    (start + len(new_items),),
+                )
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def _ensure_capacity(self, count, n_rows, dim):
+        """Make room for *n_rows* rows, keeping the first *count* ones.
+
+        Must be called inside the write transaction.
+        """
+        if self.vectors is None:
+            tmp_file = self.vector_file + ".tmp"
+            np.lib.format.open_memmap(
+                tmp_file,
+                mode="w+",
+                dtype=self.dtype,
+                shape=(max(self.init_capacity, n_rows), dim),
+            ).flush()
+            os.replace(tmp_file, self.vector_file)
+            self._refresh_vectors()
+            return
+        capacity = self.vectors.shape[0]
+        if n_rows <= capacity:
+            return
+        # Grow into a new file and swap it in, so the old matrix stays valid
+        # until the copy is complete; other stores remap it by its new inode
+        tmp_file = self.vector_file + ".tmp"
+        new_vectors = np.lib.format.open_memmap(
+            tmp_file,
+            mode="w+",
+            dtype=self.dtype,
+            shape=(max(capacity * 2, n_rows), self.vectors.shape[1]),
+        )
+        new_vectors[:count] = self.vectors[:count]
+        new_vectors.flush()
+        del new_vectors
+        self.vectors = None
+        os.replace(tmp_file, self.vector_file)
+        self._refresh_vectors()
+
+    def flush(self):
+        with self.lock:
+            if self.vectors is not None:
+                self.vectors.flush()
+
+    def close(self):
+        with self.lock:
+            self.flush()
+            self.vectors = None
+            self.conn.close()
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def open_embedding_store(save_dir, dtype="float32"):
+    """Return the store of *save_dir* shared within the process.
+
+    Each call must be paired with :func:`release_embedding_store`.
+    """
+    key = os.path.realpath(save_dir)
+    with _stores_lock:
+        entry = _stores.get(key)
+        if entry is None:
+            entry = _stores[key] = [EmbeddingStore(save_dir, dtype=dtype), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def release_embedding_store(store):
+    """Release a store of :func:`open_embedding_store`, closing it when unused."""
+    key = os.path.realpath(store.save_dir)
+    with _stores_lock:
+        entry = _stores.get(key)
+        if entry is None or entry[0] is not store:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del _stores[key]
+            store.close()
+
+
 class EmbeddingCache:
     """Lightweight, disk‑backed cache for text embeddings.
 
     The cache stores the MD5 hash of an input string as the key and its
-    corresponding embedding vector as the value.  Writing to disk is batched to
-    minimise I/O overhead.
+    corresponding embedding vector as the value, in a memory-mapped
+    :class:`EmbeddingStore` shared by all caches of the process.
 
     Example:
-        >>> async with EmbeddingCache() as cache:
+        >>> with EmbeddingCache() as cache:
         ...     vec = await cache.get("hello world")
     """
 
-    def __init__(self, save_batch=1000):
-        """Create a new cache instance and eagerly load any persisted data.
+    def __init__(
+        self, batch_size=None, max_concurrency=None, dtype=None, emb_func=None
+    ):
+        """Create a new cache instance backed by the on-disk store.
 
         Args:
-            save_batch (int, optional): Number of *new* embeddings that can
-                accumulate before the in‑memory cache is flushed to disk.
-                Defaults to ``1000``.
+            batch_size (int, optional): Number of texts sent per embedding
+                request. Defaults to ``Config.get_embedding_batch_size()``.
+            max_concurrency (int, optional): Maximum number of embedding
+                requests in flight. Defaults to
+                ``Config.get_embedding_max_concurrency()``.
+            dtype (str, optional): ``"float32"`` or ``"float16"`` storage of new
+                caches. Defaults to ``Config.get_embedding_dtype()``.
+            emb_func (callable, optional): Coroutine function embedding a list
+                of texts, e.g. the pooled ``EmbeddingModel`` of a ``VearchDB``.
+                Defaults to :func:`get_embedding`.
         """
-        self.file = os.path.join(Config.get_cache_save_dir(), "cache.pkl")
-        self.count = 0
-        self.save_batch = save_batch
-        self.data = self.load()
+        self.emb_func = emb_func or get_embedding
+        self.batch_size = batch_size or Config.get_embedding_batch_size()
+        self.max_concurrency = max_concurrency or Config.get_embedding_max_concurrency()
+        self.store = open_embedding_store(
+            os.path.join(Config.get_cache_save_dir(), "embedding_cache"),
+            dtype=dtype or Config.get_embedding_dtype(),
+        )
+        self.migrate_pickle(os.path.join(Config.get_cache_save_dir(), "cache.pkl"))
 
     @staticmethod
     def get_md5(key):
         """Return the 32‑character MD5 hex digest for *key*."""
         return hashlib.md5(key.encode("utf-8")).hexdigest()
 
-    def load(self):
-        """Load the on‑disk cache if it exists; otherwise, return an empty dict."""
-        if not os.path.exists(self.file):
-            return dict()
-        with open(self.file, "rb") as f:
-            return pickle.load(f)
+    def migrate_pickle(self, file):
+        """Import a legacy ``cache.pkl`` into an empty store, once."""
+        if len(self.store) or not os.path.exists(file):
+            return
+        try:
+            with open(file, "rb") as f:
+                data = pickle.load(f)
+            if data:
+                self.store.put_many(list(data.keys()), np.stack(list(data.values())))
+            os.replace(file, file + ".migrated")
+            logger.info(f"Migrated {len(data)} embeddings from {file}")
+        except Exception as e:
+            logger.error(f"Failed to migrate embedding cache {file}: {e}")
 
-    # TODO: save embeddings
     def save(self):
-        """Persist the in‑memory cache to disk (no‑op if nothing new)."""
-        if not self.count:
-            return
+        """Flush pending vector writes and index updates to disk."""
         try:
-            with open(self.file, "wb") as f:
-                pickle.dump(self.data, f)
-            self.count = 0
+            self.store.flush()
         except Exception as e:
-            logger.error("Failed to save embedding cache", e)
+            logger.error(f"Failed to save embedding cache: {e}")
+
+    def close(self):
+        """Save and release the store; the cache must not be used afterwards."""
+        if self.store is None:
+            return
+        self.save()
+        release_embedding_store(self.store)
+        self.store = None
 
     # ---------------------------------------------------------------------
     # Public API
     # ---------------------------------------------------------------------
 
     def is_in(self, key):
-        return self.get_md5(key) in self.data
+        return self.get_md5(key) in self.store
 
     def set(self, key, value):
-        self.data[self.get_md5(key)] = value
-        self.count += 1
-        if self.count % self.save_batch == 0:
-            self.save()
-            self.count = 0
+        self.store.put_many([self.get_md5(key)], [value])
 
     async def get(self, key):
         """Return cached or freshly computed embeddings."""
@@ -155,50 +411,58 @@ class EmbeddingCache:
             return await self._get_single(key)
 
     async def _get_multiple(self, keys):
-        feature_list = []
-        texts = []
+        """Embed *keys* in batches and return the features in input order.
 
-        for k in tqdm(keys, desc="embedding tools"):
-            feature = await self._get_or_queue(k, texts)
-            if feature is not None:
-                feature_list.append(feature)
-
-            # Send queued texts if any
-            if len(texts) >= 1:
-                features = await self._embed_and_cache(texts)
-                feature_list.extend(features)
-                texts.clear()
+        Cached and repeated texts are only looked up once; the remaining
+        texts are split into ``batch_size`` requests of which at most
+        ``max_concurrency`` run at the same time.
+        """
+        keys = list(keys)
+        key_md5s = [self.get_md5(k) for k in keys]
+        rows = self.store.get_rows(key_md5s)
+        texts = list(
+            {
+                key_md5: k
+                for k, key_md5 in zip(keys, key_md5s)
+                if key_md5 not in rows
+            }.values()
+        )
 
-        # Final flush for remaining texts
         if texts:
-            features = await self._embed_and_cache(texts)
-            feature_list.extend(features)
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            with tqdm(total=len(texts), desc="embedding tools") as pbar:
 
-        return np.array(feature_list)
+                async def embed_batch(batch):
+                    async with semaphore:
+                        await self._embed_and_cache(batch)
+                    pbar.update(len(batch))
+
+                await asyncio.gather(
+                    *[
+                        embed_batch(batch)
+                        for batch in chunk_list(texts, self.batch_size)
+                    ]
+                )
+
+        return self.store.get_many(key_md5s)
 
     async def _get_single(self, key):
-        key_md5 = self.get_md5(key)
-        if key_md5 in self.data:
-            return self.data[key_md5]
-        feature = (await get_embedding([key]))[0]
+        feature = self.store.get(self.get_md5(key))
+        if feature is not None:
+            return feature
+        feature = (await self.emb_func([key]))[0]
         self.set(key, feature)
         return feature
 
-    async def _get_or_queue(self, key, texts):
-        key_md5 = self.get_md5(key)
-        if key_md5 in self.data:
-            return self.data[key_md5]
-        texts.append(key)
-        return None
-
     async def _embed_and_cache(self, texts):
-        features = await get_embedding(texts)
-        for content, feature in zip(texts, features):
-            self.set(content, feature)
+        features = await self.emb_func(texts)
+        if features is None:
+            raise Exception(f"Failed to get embeddings for {len(texts)} texts.")
+        self.store.put_many([self.get_md5(text) for text in texts], features)
         return features
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):  # autosave on exit
-        self.save()
+        self.close()
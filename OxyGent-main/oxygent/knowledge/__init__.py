@@ -0,0 +1,9 @@
+from .knowledge_base import KnowledgeBase
+from .loaders import load_document
+from .text_splitter import split_text
+
+__all__ = [
+    "KnowledgeBase",
+    "load_document",
+    "split_text",
+]
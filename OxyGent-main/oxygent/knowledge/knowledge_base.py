@@ -0,0 +1,253 @@
+"""knowledge_base.py Local Knowledge Base Module.
+
+This file implements the document pipeline behind :class:`RAGAgent`: documents are
+streamed section by section through the loaders, split into chunks, embedded in
+batches through the :class:`EmbeddingCache`, and stored in a :class:`LocalVectorSpace`
+persisted to ``{cache_dir}/knowledge_base/{name}.npz``.
+
+Each chunk records the signature (path, size and modification time) of its source
+file, so re-ingesting an unchanged file is a no-op and a modified file replaces its
+previous chunks. Query results are kept in a small LRU cache that is cleared
+whenever the index changes.
+"""
+
+import asyncio
+import logging
+import os
+
+from oxygent.config import Config
+from oxygent.databases.db_vector.local_vector_db import LocalVectorSpace
+from oxygent.utils.lru_cache import LRUCache
+from oxygent.embedding_cache import EmbeddingCache
+from oxygent.knowledge.loaders import iter_document_paths, load_document
+from oxygent.knowledge.text_splitter import split_text
+from oxygent.utils.common_utils import get_md5
+
+logger = logging.getLogger(__name__)
+
+
+def get_file_signature(path):
+    stat = os.stat(path)
+    return get_md5(f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}")
+
+
+class KnowledgeBase(object):
+    """Persistent local index of document chunks.
+
+    Example:
+        >>> kb = KnowledgeBase("manuals")
+        >>> await kb.add_documents(["./docs"])
+        >>> chunks = await kb.search("how to reset the device", top_k=3)
+    """
+
+    def __init__(
+        self,
+        name="default",
+        chunk_size=None,
+        chunk_overlap=None,
+        top_k=None,
+        emb_func=None,
+        **space_kwargs,
+    ):
+        """Open the knowledge base, loading its index from disk if it exists.
+
+        Args:
+            name (str): Name of the knowledge base, used as the index file name.
+            chunk_size (int, optional): Maximum characters per chunk. Defaults to
+                ``Config.get_knowledge_chunk_size()``.
+            chunk_overlap (int, optional): Characters shared by consecutive chunks.
+                Defaults to ``Config.get_knowledge_chunk_overlap()``.
+            top_k (int, optional): Default number of chunks returned by
+                :meth:`search`. Defaults to ``Config.get_knowledge_top_k()``.
+            emb_func (callable, optional): Coroutine function embedding a list of
+                texts, passed to the :class:`EmbeddingCache`.
+            **space_kwargs: ``ivf_min_size``, ``nprobe`` and ``pq_m`` of the
+                :class:`LocalVectorSpace`.
+        """
+        self.name = name
+        self.chunk_size = chunk_size or Config.get_knowledge_chunk_size()
+        self.chunk_overlap = (
+            Config.get_knowledge_chunk_overlap()
+            if chunk_overlap is None
+            else chunk_overlap
+        )
+        self.top_k = top_k or Config.get_knowledge_top_k()
+        self.data_dir = os.path.join(Config.get_cache_save_dir(), "knowledge_base")
+        os.makedirs(self.data_dir, exist_ok=True)
+        self.path = os.path.join(self.data_dir, f"{name}.npz")
+        self.space = LocalVectorSpace(**space_kwargs)
+        if os.path.exists(self.path):
+            self.space.load(self.path)
+        self.embedding_cache = EmbeddingCache(emb_func=emb_func)
+        self.query_cache = LRUCache(
+            Config.get_knowledge_cache_size(), Config.get_knowledge_cache_ttl()
+        )
+        self.lock = asyncio.Lock()
+
+    def __len__(self):
+        return len(self.space)
+
+    def get_sources(self):
+        """Return ``{source path: file signature}`` of the indexed documents."""
+        return {meta["source"]: meta["signature"] for meta in self.space.metas}
+
+    def _save(self):
+        self.space.save(self.path)
+        self.embedding_cache.save()
+        self.query_cache.clear()
+
+    def _remove_source(self, source):
+        mask = self.space.get_mask({"source": source})
+        if mask.any():
+            self.space.delete(mask)
+            return True
+        return False
+
+    async def _embed_file(self, path, signature):
+        """Return the embeddings and metadata of the chunks of a file."""
+        texts, metas = [], []
+        for section in load_document(path):
+            for chunk in split_text(
+                section["text"], self.chunk_size, self.chunk_overlap
+            ):
+                texts.append(chunk)
+                metas.append(
+                    {
+                        "source": path,
+                        "signature": signature,
+                        "location": section["location"],
+                        "chunk_id": len(metas),
+                        "text": chunk,
+                    }
+                )
+        if not texts:
+            return None, metas
+        return await self.embedding_cache.get(texts), metas
+
+    async def add_documents(self, paths):
+        """Index files and directories, skipping files that have not changed.
+
+        Args:
+            paths (list): Files, or directories searched recursively for supported
+                files.
+
+        Returns:
+            int: Number of chunks added.
+        """
+        n_chunks = 0
+        async with self.lock:
+            sources = self.get_sources()
+            is_changed = False
+            for path in iter_document_paths(paths):
+                path = os.path.abspath(path)
+                signature = get_file_signature(path)
+                if sources.get(path) == signature:
+                    continue
+                try:
+                    embeddings, metas = await self._embed_file(path, signature)
+                except Exception as e:
+                    # The chunks of the previous version stay indexed
+                    logger.error(f"Failed to index {path}: {e}")
+                    continue
+                is_changed |= self._remove_source(path)
+                n_added = len(metas)
+                if n_added:
+                    self.space.add(embeddings, metas)
+                is_changed |= n_added > 0
+                n_chunks += n_added
+                logger.info(f"Indexed {n_added} chunks of {path} into {self.name}")
+            if is_changed:
+                self._save()
+        return n_chunks
+
+    async def remove_documents(self, paths):
+        """Remove files, or every file under a directory, from the index."""
+        async with self.lock:
+            prefixes = [os.path.abspath(path) for path in paths]
+            removed = [
+                source
+                for source in self.get_sources()
+                if any(
+                    source == prefix or source.startswith(prefix + os.sep)
+                    for prefix in prefixes
+                )
+            ]
+            for source in removed:
+                self._remove_source(source)
+            if removed:
+                self._save()
+        return len(removed)
+
+    async def remove_missing_documents(self, paths):
+        """Remove indexed files under ``paths`` that no longer exist there.
+
+        Args:
+            paths (list): Files or directories previously passed to
+                ``add_documents``.
+
+        Returns:
+            int: Number of files removed.
+        """
+        async with self.lock:
+            prefixes = [os.path.abspath(path) for path in paths]
+            existing = {os.path.abspath(path) for path in iter_document_paths(paths)}
+            removed = [
+                source
+                for source in self.get_sources()
+                if source not in existing
+                and any(
+                    source == prefix or source.startswith(prefix + os.sep)
+                    for prefix in prefixes
+                )
+            ]
+            for source in removed:
+                self._remove_source(source)
+                logger.info(f"Removed missing document {source} from {self.name}")
+            if removed:
+                self._save()
+        return len(removed)
+
+    async def search(self, query, top_k=None):
+        """Return the chunks most similar to a query.
+
+        Args:
+            query (str): Query text.
+            top_k (int, optional): Number of chunks. Defaults to ``self.top_k``.
+
+        Returns:
+            list: ``{"text", "source", "location", "score"}`` dicts, best first.
+        """
+        top_k = top_k or self.top_k
+        cached = self.query_cache.get((query, top_k))
+        if cached is not None:
+            return cached
+        if not len(self.space):
+            return []
+        emb = (await self.embedding_cache.get([query]))[0]
+        rows, scores = self.space.search(emb, top_k)
+        results = [
+            {
+                "text": self.space.metas[row]["text"],
+                "source": self.space.metas[row]["source"],
+                "location": self.space.metas[row]["location"],
+                "score": float(score),
+            }
+            for row, score in zip(rows, scores)
+        ]
+        self.query_cache.set((query, top_k), results)
+        return results
+
+    async def retrieve_knowledge(self, oxy_request):
+        """Default ``func_retrieve_knowledge`` of :class:`RAGAgent`.
+
+        Returns:
+            str: The top chunks of the request's query, each headed by its source.
+        """
+        results = await self.search(oxy_request.get_query())
+        return "\n\n".join(
+            "[{}]\n{}".format(
+                " ".join(filter(None, [os.path.basename(r["source"]), r["location"]])),
+                r["text"],
+            )
+            for r in results
+        )
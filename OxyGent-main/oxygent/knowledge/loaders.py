@@ -0,0 +1,179 @@
+"""loaders.py Document Loaders Module.
+
+This file turns documents into a stream of sections: one per PDF page, PPTX slide,
+block of spreadsheet rows or run of text paragraphs. Sections are yielded as they are
+read, so large files never have to be held in memory as a whole.
+
+PDF pages and PPTX slides are rendered with :func:`pdf_page_to_md` and
+:func:`pptx_slide_to_md`, which follow the renderers of the ``pdf_tools`` and
+``pptx_tools`` MCP servers; the servers run as standalone scripts and keep their own
+copies. The parsing libraries (PyMuPDF, python-pptx, openpyxl) are optional and only
+imported when a file of their type is loaded.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+TEXT_EXTENSIONS = {".txt", ".md", ".markdown", ".csv", ".json", ".log"}
+SUPPORTED_EXTENSIONS = TEXT_EXTENSIONS | {".pdf", ".pptx", ".xlsx"}
+
+
+def pdf_page_to_md(page, page_no):
+    """Render a PyMuPDF page as a Markdown section."""
+    text = page.get_text("text")
+    cleaned = text.strip() or "_No text._"
+    return f"## Page {page_no}\n{cleaned}"
+
+
+def pptx_slide_to_md(slide, index):
+    """Render the texts, tables and picture count of a slide as Markdown."""
+    lines = [f"## Slide {index}"]
+
+    text_chunks = []
+    table_chunks = []
+    pictures = 0
+
+    for shape in slide.shapes:
+        if hasattr(shape, "text") and shape.text.strip():
+            text_chunks.append(shape.text.strip())
+        if shape.has_table:
+            rows = []
+            for row in shape.table.rows:
+                rows.append(" | ".join(cell.text.strip() for cell in row.cells))
+            table_chunks.append("\n".join(rows))
+        if shape.shape_type == 13:  # MSO_SHAPE_TYPE.PICTURE
+            pictures += 1
+
+    if text_chunks:
+        lines.append("\n".join(text_chunks))
+    if table_chunks:
+        lines.append("\n\n".join(f"表格:\n{tbl}" for tbl in table_chunks))
+    if pictures:
+        lines.append(f"*Images:* {pictures}")
+
+    if len(lines) == 1:
+        lines.append("_No textual content on this slide._")
+    return "\n\n".join(lines)
+
+
+def load_text(path, section_size=4000):
+    """Yield runs of whole paragraphs of about ``section_size`` characters."""
+    buffer = []
+    buffer_len = 0
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            buffer.append(line)
+            buffer_len += len(line)
+            if buffer_len >= section_size and not line.strip():
+                yield {"text": "".join(buffer), "location": ""}
+                buffer = []
+                buffer_len = 0
+            elif buffer_len >= section_size * 4:
+                # No paragraph break for a long time
+                yield {"text": "".join(buffer), "location": ""}
+                buffer = []
+                buffer_len = 0
+    if buffer:
+        yield {"text": "".join(buffer), "location": ""}
+
+
+def load_pdf(path):
+    """Yield one section per PDF page."""
+    import fitz
+
+    with fitz.open(path) as doc:
+        for idx, page in enumerate(doc):
+            yield {"text": pdf_page_to_md(page, idx + 1), "location": f"page {idx + 1}"}
+
+
+def load_pptx(path):
+    """Yield one section per slide."""
+    from pptx import Presentation
+
+    prs = Presentation(path)
+    for idx, slide in enumerate(prs.slides, 1):
+        yield {"text": pptx_slide_to_md(slide, idx), "location": f"slide {idx}"}
+
+
+def load_xlsx(path, rows_per_section=50):
+    """Yield blocks of ``rows_per_section`` rows of every sheet.
+
+    Rows are rendered as ``header: value`` pairs so that each chunk is readable
+    without the header row.
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for sheet in workbook.worksheets:
+            header = None
+            lines = []
+            first_row = row_no = 0
+            for row_no, row in enumerate(sheet.iter_rows(values_only=True), 1):
+                if header is None:
+                    header = [str(c) if c is not None else "" for c in row]
+                    first_row = row_no + 1
+                    continue
+                cells = [
+                    f"{key or i}: {value}"
+                    for i, (key, value) in enumerate(zip(header, row))
+                    if value is not None
+                ]
+                if cells:
+                    lines.append("; ".join(cells))
+                if len(lines) >= rows_per_section:
+                    yield {
+                        "text": f"## {sheet.title}\n" + "\n".join(lines),
+                        "location": f"{sheet.title}!{first_row}-{row_no}",
+                    }
+                    lines = []
+                    first_row = row_no + 1
+            if lines:
+                yield {
+                    "text": f"## {sheet.title}\n" + "\n".join(lines),
+                    "location": f"{sheet.title}!{first_row}-{row_no}",
+                }
+    finally:
+        workbook.close()
+
+
+def load_document(path):
+    """Return an iterator over the sections of a document, by extension.
+
+    Args:
+        path (str): Path of a ``.txt``/``.md``-like, ``.pdf``, ``.pptx`` or ``.xlsx``
+            file.
+
+    Returns:
+        Iterator[dict]: ``{"text": ..., "location": ...}`` items, where ``location``
+        names the page, slide or row range of the section.
+
+    Raises:
+        ValueError: If the extension is not supported.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in TEXT_EXTENSIONS:
+        return load_text(path)
+    if ext == ".pdf":
+        return load_pdf(path)
+    if ext == ".pptx":
+        return load_pptx(path)
+    if ext == ".xlsx":
+        return load_xlsx(path)
+    raise ValueError(f"Unsupported document type: {path}")
+
+
+def iter_document_paths(paths):
+    """Expand files and directories into the supported files they contain."""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for file in sorted(files):
+                    if os.path.splitext(file)[1].lower() in SUPPORTED_EXTENSIONS:
+                        yield os.path.join(root, file)
+        elif os.path.exists(path):
+            yield path
+        else:
+            logger.warning(f"Document not found: {path}")
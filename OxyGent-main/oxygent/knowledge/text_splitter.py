@@ -0,0 +1,68 @@
+"""text_splitter.py Text Chunking Module.
+
+This file splits document sections into chunks of bounded length for embedding. Text
+is first cut at the coarsest separator that exists in it (paragraphs, then lines,
+then sentences, then words), pieces that are still too long are cut at the next
+separator, and the pieces are then packed back into chunks of at most
+``chunk_size`` characters. Consecutive chunks share up to ``chunk_overlap``
+characters so that a sentence cut at a chunk boundary stays retrievable.
+"""
+
+DEFAULT_SEPARATORS = ("\n\n", "\n", "。", "！", "？", ". ", "; ", "；", " ", "")
+
+
+def _split_recursive(text, chunk_size, separators):
+    if len(text) <= chunk_size:
+        return [text]
+    for i, separator in enumerate(separators):
+        if separator == "":
+            return [text[j : j + chunk_size] for j in range(0, len(text), chunk_size)]
+        if separator not in text:
+            continue
+        parts = text.split(separator)
+        # Keep the separator at the end of each piece
+        pieces = [part + separator for part in parts[:-1]] + [parts[-1]]
+        result = []
+        for piece in pieces:
+            if not piece:
+                continue
+            if len(piece) <= chunk_size:
+                result.append(piece)
+            else:
+                result.extend(_split_recursive(piece, chunk_size, separators[i + 1 :]))
+        return result
+    return [text]
+
+
+def split_text(text, chunk_size=500, chunk_overlap=50, separators=DEFAULT_SEPARATORS):
+    """Split text into chunks of at most ``chunk_size`` characters.
+
+    Args:
+        text (str): Text to split.
+        chunk_size (int): Maximum length of a chunk.
+        chunk_overlap (int): Maximum length shared by consecutive chunks; must be
+            smaller than ``chunk_size``.
+        separators (Sequence[str]): Separators from coarsest to finest. ``""`` cuts
+            at exact character positions.
+
+    Returns:
+        list: Non-empty, stripped chunks in document order.
+    """
+    if chunk_overlap >= chunk_size:
+        raise ValueError("chunk_overlap must be smaller than chunk_size.")
+    chunks = []
+    current = []
+    current_len = 0
+    for piece in _split_recursive(text, chunk_size, separators):
+        if current and current_len + len(piece) > chunk_size:
+            chunks.append("".join(current))
+            # Carry over the tail of the chunk, whole pieces only
+            while current and (
+                current_len > chunk_overlap or current_len + len(piece) > chunk_size
+            ):
+                current_len -= len(current.pop(0))
+        current.append(piece)
+        current_len += len(piece)
+    if current:
+        chunks.append("".join(current))
+    return [chunk.strip() for chunk in chunks if chunk.strip()]
@@ -12,6 +12,7 @@ NOTE: This module contains the following parts:
     - master_agent_name: Name of the master agent (instance of BaseAgent)
     - active_tasks: Dictionary to manage active tasks, for SSE and other async operations
     - es_client / redis_client / vearch_client: Database clients for Elasticsearch, Redis, and Vearch
+    - blob_client: Content-addressed store for the large fields of node inputs
     - agent_organization: Dictionary representing the organization structure of agents
     - lock: Boolean to control task execution flow
 """
@@ -22,6 +23,7 @@ import json
 import os
 import traceback
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
 
 import msgpack
@@ -29,9 +31,11 @@ from elasticsearch import AsyncElasticsearch
 from pydantic import BaseModel, ConfigDict, Field
 
 from .config import Config
+from .databases.db_blob import BaseBlob, EsBlob, LocalBlob
 from .databases.db_es import JesEs, LocalEs
+from .databases.db_es.index_lifecycle import PARTITIONED_INDEX_TYPES
 from .databases.db_redis import JimdbApRedis, LocalRedis
-from .databases.db_vector import VearchDB
+from .databases.db_vector import BaseVectorDB, LexicalIndex, LocalVectorDB, VearchDB
 from .db_factory import DBFactory
 from .log_setup import setup_logging
 from .oxy import Oxy
@@ -50,6 +54,9 @@ from .utils.common_utils import (
     print_tree,
     to_json,
 )
+from .utils.http_client import close_http_client
+from .utils.process_pool import ToolProcessPool
+from .utils.python_sandbox import close_sandbox_pool
 
 logger = None
 
@@ -75,13 +82,22 @@ class MAS(BaseModel):
 
     agent_organization: dict = Field(default_factory=list)
 
-    vearch_client: Optional[VearchDB] = Field(None)
+    vearch_client: Optional[BaseVectorDB] = Field(None)
+    tool_lexical_index: LexicalIndex = Field(
+        default_factory=LexicalIndex,
+        exclude=True,
+        description="BM25 index of desc_for_llm used by retrieve_tools.",
+    )
     es_client: Optional[AsyncElasticsearch] = Field(None)
     redis_client: Optional[JimdbApRedis] = Field(None)
+    blob_client: Optional[BaseBlob] = Field(None)
 
     lock: bool = Field(False)
     active_tasks: dict = Field(default_factory=dict)
     background_tasks: set = Field(default_factory=set)
+    index_janitor_task: Optional[asyncio.Task] = Field(None, exclude=True)
+    thread_executor: Optional[ThreadPoolExecutor] = Field(None, exclude=True)
+    process_executor: Optional[ToolProcessPool] = Field(None, exclude=True)
     event_dict: dict = Field(default_factory=dict)
 
     message_prefix: str = Field("oxygent")
@@ -124,13 +140,20 @@ class MAS(BaseModel):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.index_janitor_task:
+            self.index_janitor_task.cancel()
         await asyncio.gather(*self.background_tasks)
         logger.info("=" * 64)
         logger.info("🪂 OxyGent MAS Application Exit")
         logger.info("=" * 64)
         await self.es_client.close()
         await self.redis_client.close()
+        if self.vearch_client:
+            await self.vearch_client.close()
         await self.cleanup_servers()
+        self.shutdown_executors()
+        await close_sandbox_pool()
+        await close_http_client()
 
     @classmethod
     async def create(cls, **kwargs):
@@ -172,6 +195,8 @@ class MAS(BaseModel):
         if oxy.name in self.oxy_name_to_oxy:
             raise Exception(f"oxy [{oxy.name}] already exists.")
         self.oxy_name_to_oxy[oxy.name] = oxy
+        if not isinstance(oxy, BaseLLM):
+            self.tool_lexical_index.add(oxy.name, oxy.desc_for_llm)
 
     def add_oxy_list(self, oxy_list: list[Oxy]):
         """Register a list of Oxy objects.
@@ -239,6 +264,10 @@ class MAS(BaseModel):
         {app_name}_trace: trace_id: record trace of each call
         {app_name}_node: node_id: record log of each node
         {app_name}_history: history_id: record history of read and write operations
+        {app_name}_blob: sha256 of content: large fields of node inputs
+
+        With ``es_lifecycle`` enabled, the trace, message, node and history tables
+        are split into daily or weekly partitions behind a read alias.
         """
 
         # es
@@ -352,6 +381,18 @@ class MAS(BaseModel):
             },
         )
 
+        # delete expired partitions of the time-partitioned tables
+        if Config.get_es_lifecycle_is_enabled():
+            self.index_janitor_task = asyncio.create_task(self.run_index_janitor())
+
+        # blob table, holding the large fields of node inputs
+        if Config.get_blob_is_enabled():
+            if Config.get_es_config():
+                self.blob_client = EsBlob(self.es_client)
+                await self.blob_client.create_index()
+            else:
+                self.blob_client = LocalBlob()
+
         # init redis client
         redis_config = Config.get_redis_config()
         if redis_config:
@@ -365,6 +406,24 @@ class MAS(BaseModel):
         else:
             self.redis_client = LocalRedis()
 
+    async def run_index_janitor(self):
+        """Periodically delete the index partitions that exceeded retention.
+
+        Runs as a background task while ``es_lifecycle`` is enabled and is
+        cancelled on exit.
+        """
+        index_names = [
+            Config.get_app_name() + "_" + index_type
+            for index_type in PARTITIONED_INDEX_TYPES
+        ]
+        while True:
+            for index_name in index_names:
+                try:
+                    await self.es_client.purge_expired_partitions(index_name)
+                except Exception as e:
+                    logger.warning(f"Failed to purge partitions of {index_name}: {e}")
+            await asyncio.sleep(Config.get_es_lifecycle_janitor_interval())
+
     async def batch_init_oxy(self, *class_type):
         """Batch initialize oxy objects of specified types asynchronously.
 
@@ -475,26 +534,86 @@ class MAS(BaseModel):
     # Optional Vearch integration
     # ------------------------------------------------------------------
 
+    def get_retrievable_tool_names(self, agent_name):
+        """Return the tools of an agent that are selected by ``retrieve_tools``.
+
+        ``retrieve_tools`` itself is excluded, and so are sub-agents when the agent
+        keeps them in its toolset permanently.
+        """
+        agent = self.oxy_name_to_oxy[agent_name]
+        return [
+            tool_name
+            for tool_name in agent.permitted_tool_name_list
+            if tool_name != "retrieve_tools"
+            and not (agent.is_retain_subagent_in_toolset and self.is_agent(tool_name))
+        ]
+
     async def create_vearch_table(self):
         """Link to the vearch database and create tables for tools."""
         tool_list = []
         for tool_name, tool in self.oxy_name_to_oxy.items():
             if not self.is_agent(tool_name):
                 continue
-            for permitted_tool_name in tool.permitted_tool_name_list:
+            for permitted_tool_name in self.get_retrievable_tool_names(tool_name):
                 tool_desc = self.oxy_name_to_oxy[permitted_tool_name].desc_for_llm
-                if permitted_tool_name in ["retrieve_tools"]:
-                    continue
-                if tool.is_retain_subagent_in_toolset and self.is_agent(
-                    permitted_tool_name
-                ):
-                    continue
+                # desc_for_llm may have been rebuilt by init()
+                self.tool_lexical_index.add(permitted_tool_name, tool_desc)
                 tool_list.append((self.name, tool_name, permitted_tool_name, tool_desc))
         if tool_list:
-            # vearch
-            self.vearch_client = VearchDB(Config.get_vearch_config())
+            # vearch, or the in-process index with "backend": "local"
+            if Config.get_vearch_config().get("backend") == "local":
+                self.vearch_client = LocalVectorDB(Config.get_vearch_config())
+            else:
+                self.vearch_client = VearchDB(Config.get_vearch_config())
             await self.vearch_client.create_vearch_table_by_tool_list(tool_list)
 
+    # ------------------------------------------------------------------
+    # Executors of synchronous tools
+    # ------------------------------------------------------------------
+
+    def get_executor(self, execution_mode):
+        """Return the pool of ``thread`` or ``process`` tools, creating it lazily."""
+        if execution_mode == "thread":
+            if self.thread_executor is None:
+                self.thread_executor = ThreadPoolExecutor(
+                    max_workers=Config.get_tool_thread_pool_size(),
+                    thread_name_prefix=f"{self.name}_tool",
+                )
+            return self.thread_executor
+        if execution_mode == "process":
+            if self.process_executor is None:
+                self.process_executor = ToolProcessPool(
+                    max_workers=Config.get_tool_process_pool_size() or None
+                )
+            return self.process_executor
+        raise ValueError(f"Unknown execution mode: {execution_mode}")
+
+    async def run_in_executor(self, execution_mode, func, *args):
+        """Run ``func(*args)`` in the thread or process pool.
+
+        If the awaiting task is cancelled, e.g. by the tool timeout, a call that has
+        not started yet is dropped. A call already running in a process is stopped
+        by killing its own worker, the other calls are not affected; a call running
+        in a thread cannot be interrupted and runs to completion.
+        """
+        if execution_mode == "process":
+            return await self.get_executor("process").run(func, *args)
+        future = self.get_executor(execution_mode).submit(func, *args)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if not future.cancel():
+                logger.warning(f"Cancelled tool keeps running in thread: {func}")
+            raise
+
+    def shutdown_executors(self):
+        if self.thread_executor is not None:
+            self.thread_executor.shutdown(wait=False, cancel_futures=True)
+        if self.process_executor is not None:
+            self.process_executor.shutdown()
+        self.thread_executor = None
+        self.process_executor = None
+
     # ------------------------------------------------------------------
     # Misc. public helpers
     # ------------------------------------------------------------------
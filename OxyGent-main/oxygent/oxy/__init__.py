@@ -14,6 +14,7 @@ from .flows import (
     Reflexion,
     Workflow,
 )
+from .function_tools.batch_function_tool import BatchFunctionTool
 from .function_tools.function_hub import FunctionHub
 from .function_tools.function_tool import FunctionTool
 from .llms import HttpLLM, OpenAILLM
@@ -36,6 +37,7 @@ __all__ = [
     "SSEMCPClient",
     "FunctionHub",
     "FunctionTool",
+    "BatchFunctionTool",
     "Workflow",
     "PlanAndSolve",
     "Reflexion",
@@ -25,6 +25,9 @@ from .base_agent import BaseAgent
 
 logger = logging.getLogger(__name__)
 
+# ${name} placeholders of prompt templates
+_PROMPT_VARIABLE_PATTERN = re.compile(r"\$\{(\w+)\}")
+
 
 class LocalAgent(BaseAgent):
     """Local agent with tool management and memory capabilities.
@@ -250,6 +253,7 @@ class LocalAgent(BaseAgent):
                     "size": self.short_memory_size,
                     "sort": [{"create_time": {"order": "desc"}}],
                 },
+                lookback_days=Config.get_es_lifecycle_history_lookback(),
             )
             historys = es_response["hits"]["hits"][::-1]
             for history in historys:
@@ -258,8 +262,10 @@ class LocalAgent(BaseAgent):
                 short_memory.add_message(Message.assistant_message(memory["answer"]))
         return short_memory
 
-    async def _get_llm_tool_desc_list(self, oxy_request: OxyRequest, query: str) -> str:
-        """Get tool descriptions for LLM context based on configuration and query.
+    async def _get_llm_tool_name_list(
+        self, oxy_request: OxyRequest, query: str
+    ) -> list:
+        """Select the tools shown to the LLM based on configuration and query.
 
         This method handles different tool retrieval strategies:
         - Direct tool listing when vector search is disabled
@@ -272,44 +278,37 @@ class LocalAgent(BaseAgent):
             query (str): The user query for tool retrieval.
 
         Returns:
-            str: Concatenated tool descriptions for LLM context.
+            list: Names of the selected tools.
         """
-        # Build tool description list for LLM instruction
         self.permitted_tool_name_list.sort()
-        # Create instruction
-        llm_tool_desc_list = []
+        llm_tool_name_list = []
         if not Config.get_vearch_config():
             # TODO: Modify tool description list - not all permitted tools are callable
             # (e.g., Reflexion Agent is a special case)
-            for tool_name in self.permitted_tool_name_list:
-                tool_desc = oxy_request.get_oxy(tool_name).desc_for_llm
-                llm_tool_desc_list.append(tool_desc)
-            return llm_tool_desc_list
+            return list(self.permitted_tool_name_list)
 
         # Add sub-agents if they should be retained in toolset
         if self.is_retain_subagent_in_toolset:
             for tool_name in self.permitted_tool_name_list:
-                tool_desc = oxy_request.get_oxy(tool_name).desc_for_llm
                 if self.mas.is_agent(tool_name):
-                    llm_tool_desc_list.append(tool_desc)
+                    llm_tool_name_list.append(tool_name)
 
         if self.is_sourcing_tools:
             # Enable autonomous tool retrieval
             # TODO: Start with initial tools, then retrieve based on query
-            tool_desc = oxy_request.get_oxy("retrieve_tools").desc_for_llm
-            llm_tool_desc_list.append(tool_desc)
+            llm_tool_name_list.append("retrieve_tools")
         else:
             # Calculate current agent's tool count, excluding sub-agents if configured
             tool_number = len(self.permitted_tool_name_list)
             if self.is_retain_subagent_in_toolset:
                 # TODO: Consider tool description ordering (sub-agents first, then tools)
-                pure_tool_desc_list = []
-                for tool_name in self.permitted_tool_name_list:
-                    tool_desc = oxy_request.get_oxy(tool_name).desc_for_llm
-                    if self.mas.is_agent(tool_name):
-                        continue
-                    pure_tool_desc_list.append(tool_desc)
-                tool_number = len(pure_tool_desc_list)
+                tool_number = len(
+                    [
+                        tool_name
+                        for tool_name in self.permitted_tool_name_list
+                        if not self.mas.is_agent(tool_name)
+                    ]
+                )
 
             # Handle tool retrieval based on availability
             if (
@@ -318,23 +317,27 @@ class LocalAgent(BaseAgent):
             ):
                 # When tool count is low, provide all tools without retrieval
                 for tool_name in self.permitted_tool_name_list:
-                    tool_desc = oxy_request.get_oxy(tool_name).desc_for_llm
                     if tool_name in ["retrieve_tools"]:
                         continue
                     if self.is_retain_subagent_in_toolset and self.mas.is_agent(
                         tool_name
                     ):
                         continue
-                    llm_tool_desc_list.append(tool_desc)
+                    llm_tool_name_list.append(tool_name)
             else:
                 # Retrieve tools based on current query relevance
                 oxy_response = await oxy_request.call(
                     callee="retrieve_tools", arguments={"query": query}
                 )
-                if oxy_response.output:
-                    # Append multiple tools connected with \n\n
-                    llm_tool_desc_list.append(oxy_response.output)
-        return llm_tool_desc_list
+                llm_tool_name_list.extend(oxy_response.extra.get("tool_names", []))
+        return llm_tool_name_list
+
+    async def _get_llm_tool_desc_list(self, oxy_request: OxyRequest, query: str) -> list:
+        """Get descriptions of the tools selected by :meth:`_get_llm_tool_name_list`."""
+        return [
+            oxy_request.get_oxy(tool_name).desc_for_llm
+            for tool_name in await self._get_llm_tool_name_list(oxy_request, query)
+        ]
 
     def _build_instruction(self, arguments) -> str:
         """Build instruction prompt by substituting template variables.
@@ -345,13 +348,12 @@ class LocalAgent(BaseAgent):
         Returns:
             str: The formatted instruction string with variables substituted.
         """
-        pattern = re.compile(r"\$\{(\w+)\}")
 
         def replacer(match):
             key = match.group(1)
             return str(arguments.get(key, match.group(0)))
 
-        return pattern.sub(replacer, self.prompt.strip())
+        return _PROMPT_VARIABLE_PATTERN.sub(replacer, self.prompt.strip())
 
     async def _pre_process(self, oxy_request: OxyRequest) -> OxyRequest:
         """Pre-process request to load conversation history if needed.
@@ -385,7 +387,8 @@ class LocalAgent(BaseAgent):
             oxy_request (OxyRequest): The request to prepare.
 
         Returns:
-            OxyRequest: The request with tools_description added to arguments.
+            OxyRequest: The request with llm_tool_names and tools_description added
+                to arguments.
         """
         oxy_request = await super()._before_execute(oxy_request)
         # get multimodal input
@@ -397,15 +400,19 @@ class LocalAgent(BaseAgent):
                     "short_memory": oxy_request.get_short_memory(),
                 },
             )
-            llm_tool_desc_list = await self._get_llm_tool_desc_list(
+            llm_tool_name_list = await self._get_llm_tool_name_list(
                 oxy_request, oxy_response.output
             )
         else:
-            llm_tool_desc_list = await self._get_llm_tool_desc_list(
+            llm_tool_name_list = await self._get_llm_tool_name_list(
                 oxy_request, oxy_request.get_query()
             )
         oxy_request.arguments["additional_prompt"] = self.additional_prompt
-        oxy_request.arguments["tools_description"] = "\n\n".join(llm_tool_desc_list)
+        oxy_request.arguments["llm_tool_names"] = llm_tool_name_list
+        oxy_request.arguments["tools_description"] = "\n\n".join(
+            oxy_request.get_oxy(tool_name).desc_for_llm
+            for tool_name in llm_tool_name_list
+        )
 
         return oxy_request
 
@@ -5,10 +5,11 @@ by managing conversation memory, processing user queries, and coordinating with
 models to generate responses.
 """
 
-from typing import Callable
+from typing import Any, Callable, Optional
 
 from pydantic import Field, model_validator
 
+from ...knowledge import KnowledgeBase
 from ...schemas.oxy import OxyRequest
 from .chat_agent import ChatAgent
 
@@ -18,8 +19,21 @@ class RAGAgent(ChatAgent):
 
     knowledge_placeholder: str = Field("knowledge")
 
-    func_retrieve_knowledge: Callable = Field(
-        exclude=True, description="Retrieve knowledge function"
+    func_retrieve_knowledge: Optional[Callable] = Field(
+        None,
+        exclude=True,
+        description="Retrieve knowledge function, defaults to a search of knowledge_paths",
+    )
+
+    knowledge_paths: list = Field(
+        default_factory=list,
+        description="Files or directories indexed into the agent's knowledge base",
+    )
+    knowledge_top_k: Optional[int] = Field(
+        None, description="Chunks retrieved per query, see Config.get_knowledge_top_k"
+    )
+    knowledge_base: Optional[Any] = Field(
+        None, exclude=True, description="The KnowledgeBase built from knowledge_paths"
     )
 
     def __init__(self, **kwargs):
@@ -36,6 +50,29 @@ class RAGAgent(ChatAgent):
             )
         return self
 
+    @model_validator(mode="after")
+    def check_knowledge_source(self):
+        if self.func_retrieve_knowledge is None and not self.knowledge_paths:
+            raise ValueError(
+                f"RAGAgent [{self.name}] needs func_retrieve_knowledge or knowledge_paths."
+            )
+        return self
+
+    async def init(self):
+        """Index ``knowledge_paths`` and use it as the default knowledge source.
+
+        The index is persisted under the agent's name, so only new or modified
+        files are embedded on later starts, and files deleted since then are
+        dropped from the index.
+        """
+        await super().init()
+        if self.knowledge_paths:
+            self.knowledge_base = KnowledgeBase(self.name, top_k=self.knowledge_top_k)
+            await self.knowledge_base.add_documents(self.knowledge_paths)
+            await self.knowledge_base.remove_missing_documents(self.knowledge_paths)
+            if self.func_retrieve_knowledge is None:
+                self.func_retrieve_knowledge = self.knowledge_base.retrieve_knowledge
+
     async def _pre_process(self, oxy_request: OxyRequest) -> OxyRequest:
         oxy_request = await super()._pre_process(oxy_request)
         knowledge = await self.func_retrieve_knowledge(oxy_request)
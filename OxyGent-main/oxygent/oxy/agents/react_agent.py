@@ -13,19 +13,30 @@ from typing import Callable, Optional
 from pydantic import Field
 
 from ...config import Config
-from ...prompts import SYSTEM_PROMPT, SYSTEM_PROMPT_RETRIEVAL
+from ...prompts import (
+    SYSTEM_PROMPT,
+    SYSTEM_PROMPT_FUNCTION_CALLING,
+    SYSTEM_PROMPT_RETRIEVAL,
+)
 from ...schemas import (
     ExecResult,
     LLMResponse,
     LLMState,
     Memory,
     Message,
+    MessageBuffer,
     Observation,
     OxyRequest,
     OxyResponse,
     OxyState,
 )
-from ...utils.common_utils import chunk_list, extract_first_json, generate_uuid
+from ...utils.common_utils import (
+    chunk_list,
+    extract_first_json,
+    generate_uuid,
+    to_json,
+)
+from ...utils.token_counter import get_token_counter
 from .local_agent import LocalAgent
 
 logger = logging.getLogger(__name__)
@@ -52,11 +63,25 @@ class ReActAgent(LocalAgent):
             is_sourcing_tools = True
             top_k_tools = N
 
+    Tool Call Modes:
+        Default: The LLM writes a JSON tool call in its text, which is parsed.
+
+        Function Calling: The schemas of the tools selected by the retrieval mode
+        are sent as ``tools`` of an OpenAI-compatible API, and the LLM returns
+        structured, possibly parallel, tool calls. Tools found by retrieve_tools
+        are added to ``tools`` for the following rounds
+            is_function_calling = True
+
     Attributes:
         max_react_rounds (int): Maximum number of reasoning-acting iterations.
         is_discard_react_memory (bool): Whether to discard detailed ReAct memory.
         memory_max_tokens (int): Maximum tokens for memory management.
+        max_prompt_tokens (int): Token ceiling of each prompt of the ReAct loop.
+        is_summarize_react_memory (bool): Whether to summarize old ReAct rounds
+            with the LLM instead of dropping them when over the ceiling.
         trust_mode (bool): Whether to enable trust mode for direct tool results.
+        is_function_calling (bool): Whether to call tools through the tools API of
+            the LLM instead of parsing JSON from its text.
 
     TODO:
         - LLM model: Support both service URLs and weight files for training
@@ -74,11 +99,26 @@ class ReActAgent(LocalAgent):
     memory_max_tokens: int = Field(
         24800, description="Maximum tokens supported by memory"
     )
+    max_prompt_tokens: int = Field(
+        default_factory=Config.get_agent_max_prompt_tokens,
+        description="Token ceiling of each ReAct prompt, 0 for unlimited",
+    )
+    is_summarize_react_memory: bool = Field(
+        False, description="Whether to summarize old react rounds over the ceiling"
+    )
+    func_count_tokens: Optional[Callable[[str], int]] = Field(
+        None, exclude=True, description="Function to count the tokens of a text"
+    )
     weight_short_memory: int = Field(5, description="Weight for short_memory")
     weight_react_memory: int = Field(1, description="Weight for react_memory")
 
     trust_mode: bool = Field(False, description="Enable trust mode for direct results")
 
+    is_function_calling: bool = Field(
+        default_factory=Config.get_agent_is_function_calling,
+        description="Whether to call tools through the tools API of the LLM",
+    )
+
     func_parse_llm_response: Optional[Callable[[str, OxyRequest], LLMResponse]] = Field(
         None, exclude=True, description="Function to parse LLM output"
     )
@@ -92,15 +132,21 @@ class ReActAgent(LocalAgent):
         super().__init__(**kwargs)
 
         if not self.prompt:
-            self.prompt = (
-                SYSTEM_PROMPT_RETRIEVAL if self.is_sourcing_tools else SYSTEM_PROMPT
-            )
+            if self.is_function_calling:
+                self.prompt = SYSTEM_PROMPT_FUNCTION_CALLING
+            else:
+                self.prompt = (
+                    SYSTEM_PROMPT_RETRIEVAL if self.is_sourcing_tools else SYSTEM_PROMPT
+                )
         if self.func_parse_llm_response is None:
             self.func_parse_llm_response = self._parse_llm_response
 
         if self.func_reflexion is None:
             self.func_reflexion = self._default_reflexion
 
+        if self.func_count_tokens is None:
+            self.func_count_tokens = get_token_counter()
+
         # Add retrieve_tools if vector search is conf igured
         if Config.get_vearch_config():
             self.tools.append("retrieve_tools")
@@ -161,6 +207,7 @@ class ReActAgent(LocalAgent):
                 "size": self.short_memory_size,
                 "sort": [{"create_time": {"order": "desc"}}],
             },
+            lookback_days=Config.get_es_lifecycle_history_lookback(),
         )
         historys = es_response["hits"]["hits"][::-1]
         if self.is_discard_react_memory:
@@ -204,8 +251,8 @@ class ReActAgent(LocalAgent):
             retained_index = set()
             for index in sorted_scores:
                 q, a, short_i, memory_type = qa_list[index]
-                count_token += len(q)
-                count_token += len(a)
+                count_token += self.func_count_tokens(q)
+                count_token += self.func_count_tokens(a)
                 if count_token > self.memory_max_tokens:
                     break
                 retained_index.add(index)
@@ -292,6 +339,180 @@ class ReActAgent(LocalAgent):
                 state=LLMState.ERROR_PARSE, output=e, ori_response=ori_response
             )
 
+    def _parse_tool_calls(
+        self, oxy_response: OxyResponse, oxy_request: OxyRequest
+    ) -> LLMResponse:
+        """Parse the structured tool calls of an LLM response.
+
+        Responses without tool calls are parsed by ``func_parse_llm_response``.
+        """
+        tool_calls = oxy_response.extra.get("tool_calls")
+        if not tool_calls:
+            return self.func_parse_llm_response(oxy_response.output, oxy_request)
+        return LLMResponse(
+            state=LLMState.TOOL_CALL,
+            output=[
+                {
+                    "tool_name": tool_call["function"]["name"],
+                    "arguments": tool_call["function"]["arguments"],
+                    "id": tool_call["id"],
+                }
+                for tool_call in tool_calls
+            ],
+            ori_response=oxy_response.output or "",
+        )
+
+    @staticmethod
+    def _get_tool_arguments(oxy_request: OxyRequest, tool_names: list) -> dict:
+        """Return the ``tools`` LLM argument of the given tools."""
+        tool_schemas = [
+            oxy_request.get_oxy(tool_name).get_tool_schema()
+            for tool_name in tool_names
+            if oxy_request.has_oxy(tool_name)
+        ]
+        return {"tools": tool_schemas} if tool_schemas else {}
+
+    @staticmethod
+    async def _call_tool(
+        oxy_request: OxyRequest, tool_call_dict: dict, parallel_id: str
+    ) -> OxyResponse:
+        arguments = tool_call_dict.get("arguments", {})
+        if isinstance(arguments, str):
+            try:
+                arguments = json.loads(arguments or "{}")
+            except json.JSONDecodeError as e:
+                arguments = e
+        if not isinstance(arguments, dict):
+            return OxyResponse(
+                state=OxyState.FAILED,
+                output=f"Arguments of tool {tool_call_dict['tool_name']} must be "
+                f"a JSON object: {arguments}",
+            )
+        return await oxy_request.call(
+            callee=tool_call_dict["tool_name"],
+            arguments=arguments,
+            parallel_id=parallel_id,
+        )
+
+    @staticmethod
+    def _add_react_turn(react_memory, message_buffer, *messages):
+        for message in messages:
+            react_memory.add_message(message)
+            message_buffer.add_message(message)
+
+    @staticmethod
+    def _add_tool_call_turn(react_memory, message_buffer, llm_response, observation):
+        """Add a function calling round: the buffer gets the assistant tool calls and
+        one tool message per call, the react memory a text turn as in JSON mode."""
+        tool_call_dict_list = llm_response.output
+        message_buffer.add_message(
+            Message(
+                role="assistant",
+                content=llm_response.ori_response or None,
+                tool_calls=[
+                    {
+                        "id": tool_call_dict["id"],
+                        "type": "function",
+                        "function": {
+                            "name": tool_call_dict["tool_name"],
+                            "arguments": tool_call_dict["arguments"],
+                        },
+                    }
+                    for tool_call_dict in tool_call_dict_list
+                ],
+            )
+        )
+        for tool_call_dict, exec_result in zip(
+            tool_call_dict_list, observation.exec_results
+        ):
+            message_buffer.add_message(
+                Message.tool_message(
+                    Observation(exec_results=[exec_result]).to_str(),
+                    tool_call_dict["tool_name"],
+                    tool_call_dict["id"],
+                )
+            )
+        react_memory.add_message(
+            Message.assistant_message(
+                llm_response.ori_response
+                or to_json(
+                    [
+                        {
+                            "tool_name": tool_call_dict["tool_name"],
+                            "arguments": tool_call_dict["arguments"],
+                        }
+                        for tool_call_dict in tool_call_dict_list
+                    ]
+                )
+            )
+        )
+        react_memory.add_message(Message.user_message(observation.to_str()))
+
+    async def _summarize_react_memory(
+        self, oxy_request: OxyRequest, message_buffer: MessageBuffer
+    ) -> None:
+        """Replace the old react rounds of the buffer with an LLM summary.
+
+        The latest round is kept as is. If the summary fails, the rounds are left
+        for budget trimming.
+        """
+        react_messages = message_buffer.get_react_messages()
+        # Summarize up to the start of the latest turn
+        turn_starts = [
+            i
+            for i, message in enumerate(react_messages)
+            if message["role"] == "assistant"
+        ]
+        n_summarized = turn_starts[-1] if turn_starts else 0
+        if n_summarized < 2:
+            return
+        steps = MessageBuffer(count_tokens=self.func_count_tokens)
+        steps.mark_prefix()
+        for message in react_messages[:n_summarized]:
+            steps.add_message(message)
+        steps_text = "\n\n".join(
+            f"[{message['role']}] {message.get('content') or ''}"
+            + (
+                f" {to_json(message['tool_calls'])}"
+                if message.get("tool_calls")
+                else ""
+            )
+            for message in steps.to_dict_list(
+                short_memory_size=n_summarized, max_tokens=self.max_prompt_tokens // 2
+            )
+        )
+        temp_messages = [
+            Message.system_message(
+                "Summarize the following tool calls and their results concisely. "
+                "Keep every fact, value and error needed to answer the user's question."
+            ),
+            Message.user_message(
+                f"User question: {oxy_request.get_query()}\n---\nSteps: {steps_text}"
+            ),
+        ]
+        oxy_response = await oxy_request.call(
+            callee=self.llm_model,
+            arguments={"messages": [msg.to_dict() for msg in temp_messages]},
+        )
+        if oxy_response.state is not OxyState.COMPLETED or not oxy_response.output:
+            logger.warning(
+                "Failed to summarize react memory, trimming it instead.",
+                extra={
+                    "trace_id": oxy_request.current_trace_id,
+                    "node_id": oxy_request.node_id,
+                },
+            )
+            return
+        message_buffer.replace_react_messages(
+            n_summarized,
+            [
+                Message.assistant_message(
+                    f"Summary of my previous tool calls: {oxy_response.output}"
+                ).to_dict(),
+                Message.user_message("Continue based on the summary.").to_dict(),
+            ],
+        )
+
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         """Execute the ReAct reasoning and acting loop.
 
@@ -306,28 +527,38 @@ class ReActAgent(LocalAgent):
             OxyResponse: Final response with answer and ReAct memory trace.
         """
         react_memory = Memory()
+        # Message context: instruction + short memory + query, built once, then the
+        # react memory of each round is appended in place
+        message_buffer = MessageBuffer(count_tokens=self.func_count_tokens)
+        message_buffer.add_message(
+            Message.system_message(self._build_instruction(oxy_request.arguments))
+        )
+        message_buffer.add_dict_list(oxy_request.get_short_memory())
+        message_buffer.add_message(Message.user_message(oxy_request.get_query()))
+        message_buffer.mark_prefix()
+        # Function calling: the tools selected for the prompt, plus those found by
+        # retrieve_tools in later rounds
+        llm_tool_names = list(
+            oxy_request.arguments.get("llm_tool_names", self.permitted_tool_name_list)
+        )
+        llm_arguments = {}
+        if self.is_function_calling:
+            llm_arguments = self._get_tool_arguments(oxy_request, llm_tool_names)
         for current_round in range(self.max_react_rounds + 1):
-            # Build complete message context: instruction + short memory + query + react memory
-            temp_memory = Memory()
-            temp_memory.add_message(
-                Message.system_message(self._build_instruction(oxy_request.arguments))
-            )
-            temp_memory.add_messages(
-                Message.dict_list_to_messages(oxy_request.get_short_memory())
-            )
-            # Add current query and ReAct history
-            temp_memory.add_message(Message.user_message(oxy_request.get_query()))
-            temp_memory.add_messages(react_memory.messages)
-
-            full_memory = temp_memory.to_dict_list()
+            if (
+                self.is_summarize_react_memory
+                and self.max_prompt_tokens
+                and message_buffer.get_token_count() > self.max_prompt_tokens
+            ):
+                await self._summarize_react_memory(oxy_request, message_buffer)
+            full_memory = message_buffer.to_dict_list(max_tokens=self.max_prompt_tokens)
             oxy_response = await oxy_request.call(
                 callee=self.llm_model,
-                arguments={"messages": full_memory},
+                arguments={"messages": full_memory, **llm_arguments},
             )
             oxy_request.arguments["full_memory"] = full_memory
-            llm_response = self.func_parse_llm_response(
-                oxy_response.output, oxy_request
-            )
+            llm_response = self._parse_tool_calls(oxy_response, oxy_request)
+            is_function_call = bool(oxy_response.extra.get("tool_calls"))
 
             # Execute based on LLM decision
             if llm_response.state is LLMState.ANSWER:
@@ -350,11 +581,7 @@ class ReActAgent(LocalAgent):
                 parallel_id = generate_uuid()
                 oxy_responses = await asyncio.gather(
                     *[
-                        oxy_request.call(
-                            callee=tool_call_dict["tool_name"],
-                            arguments=tool_call_dict["arguments"],
-                            parallel_id=parallel_id,
-                        )
+                        self._call_tool(oxy_request, tool_call_dict, parallel_id)
                         for tool_call_dict in tool_call_dict_list
                     ]
                 )
@@ -370,6 +597,14 @@ class ReActAgent(LocalAgent):
                             oxy_response=oxy_response,
                         )
                     )
+                    if self.is_function_calling:
+                        for tool_name in oxy_response.extra.get("tool_names", []):
+                            if tool_name not in llm_tool_names:
+                                llm_tool_names.append(tool_name)
+                if self.is_function_calling:
+                    llm_arguments = self._get_tool_arguments(
+                        oxy_request, llm_tool_names
+                    )
 
                 # When trust_mode == 1, write in short_memory，return observation
                 if isinstance(llm_response.output, dict):
@@ -385,10 +620,17 @@ class ReActAgent(LocalAgent):
                         )
 
                 # Add to ReAct memory for next iteration
-                react_memory.add_message(
-                    Message.assistant_message(llm_response.ori_response)
-                )
-                react_memory.add_message(Message.user_message(observation.to_str()))
+                if is_function_call:
+                    self._add_tool_call_turn(
+                        react_memory, message_buffer, llm_response, observation
+                    )
+                else:
+                    self._add_react_turn(
+                        react_memory,
+                        message_buffer,
+                        Message.assistant_message(llm_response.ori_response),
+                        Message.user_message(observation.to_str()),
+                    )
             else:
                 # Parsing error - add to memory for correction
                 logger.info(
@@ -398,10 +640,12 @@ class ReActAgent(LocalAgent):
                         "node_id": oxy_request.node_id,
                     },
                 )
-                react_memory.add_message(
-                    Message.assistant_message(llm_response.ori_response)
+                self._add_react_turn(
+                    react_memory,
+                    message_buffer,
+                    Message.assistant_message(llm_response.ori_response),
+                    Message.user_message(llm_response.output),
                 )
-                react_memory.add_message(Message.user_message(llm_response.output))
 
         # Fallback mechanism when max rounds reached
         # Extract tool call results for final summary
@@ -2,15 +2,20 @@
 
 This module provides the HttpTool class, which enables making HTTP requests to external
 APIs and services. It supports configurable methods, headers, and parameters with proper
-timeout handling.
+timeout handling. Requests share a pooled client and GET responses go through the
+HTTP cache of :mod:`oxygent.utils.http_client`.
 """
 
-import httpx
 from pydantic import Field
 
+from ...config import Config
 from ...schemas import OxyRequest, OxyResponse, OxyState
+from ...utils import http_client
 from ..base_tool import BaseTool
 
+# Methods whose arguments are sent as query parameters instead of a body
+_QUERY_METHODS = ("GET", "HEAD", "DELETE", "OPTIONS")
+
 
 class HttpTool(BaseTool):
     """Tool for making HTTP requests to external APIs and services.
@@ -21,6 +26,9 @@ class HttpTool(BaseTool):
         headers (dict): HTTP headers to include in the request.
         default_params (dict): Default parameters that will be merged with
             request arguments.
+        body_type (str): How arguments are sent by POST, PUT and PATCH: ``"json"``
+            or ``"form"``. Other methods send them as query parameters.
+        is_cached (bool): Whether GET responses may be served from the HTTP cache.
     """
 
     method: str = Field("GET", description="HTTP method to use")
@@ -29,6 +37,11 @@ class HttpTool(BaseTool):
     default_params: dict = Field(
         default_factory=dict, description="Default request parameters"
     )
+    body_type: str = Field("json", description="json or form body of POST/PUT/PATCH")
+    is_cached: bool = Field(
+        default_factory=Config.get_http_is_cache,
+        description="Whether GET responses may be served from the HTTP cache",
+    )
 
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         """Execute the HTTP request."""
@@ -36,9 +49,20 @@ class HttpTool(BaseTool):
         params = self.default_params.copy()
         params.update(oxy_request.arguments)
 
-        # Make HTTP request with timeout handling
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            http_response = await client.get(
-                self.url, params=params, headers=self.headers
-            )
-            return OxyResponse(state=OxyState.COMPLETED, output=http_response.text)
+        method = self.method.upper()
+        kwargs = {}
+        if method in _QUERY_METHODS:
+            kwargs["params"] = params
+        elif self.body_type == "form":
+            kwargs["data"] = params
+        else:
+            kwargs["json_data"] = params
+        http_response = await http_client.request(
+            method,
+            self.url,
+            headers=self.headers,
+            timeout=self.timeout,
+            is_cached=self.is_cached,
+            **kwargs,
+        )
+        return OxyResponse(state=OxyState.COMPLETED, output=http_response.text)
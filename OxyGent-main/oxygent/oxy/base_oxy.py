@@ -51,6 +51,24 @@ def ensure_async(func: Callable) -> Callable:
     return async_wrapper
 
 
+# Python annotation names of FunctionTool schemas mapped to JSON schema types
+_JSON_SCHEMA_TYPES = {
+    "str": "string",
+    "int": "integer",
+    "float": "number",
+    "bool": "boolean",
+    "list": "array",
+    "tuple": "array",
+    "dict": "object",
+    "string": "string",
+    "integer": "integer",
+    "number": "number",
+    "boolean": "boolean",
+    "array": "array",
+    "object": "object",
+}
+
+
 async def default_async_identity(x):
     """Default async identity function that returns input unchanged."""
     return x
@@ -219,6 +237,36 @@ class Oxy(BaseModel, ABC):
             {chr(10).join(args_desc)}
             """
 
+    def get_tool_schema(self) -> dict:
+        """Return the OpenAI-compatible ``tools`` entry built from the input schema."""
+        properties = {}
+        for param_name, param_info in self.input_schema.get("properties", {}).items():
+            if param_info.get("description", "No description") == "SystemArg":
+                continue
+            param_schema = {
+                k: v for k, v in param_info.items() if k not in ("type", "title")
+            }
+            param_type = _JSON_SCHEMA_TYPES.get(param_info.get("type"))
+            if param_type:
+                param_schema["type"] = param_type
+            properties[param_name] = param_schema
+        return {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.desc,
+                "parameters": {
+                    "type": "object",
+                    "properties": properties,
+                    "required": [
+                        name
+                        for name in self.input_schema.get("required", [])
+                        if name in properties
+                    ],
+                },
+            },
+        }
+
     async def init(self):
         self._set_desc_for_llm()
 
@@ -421,6 +469,11 @@ class Oxy(BaseModel, ABC):
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         pass
 
+    async def _call_execute(self, oxy_request: OxyRequest) -> OxyResponse:
+        if self.func_execute:
+            return await self.func_execute(oxy_request)
+        return await self._execute(oxy_request)
+
     async def _handle_exception(self, e):
         pass
 
@@ -457,6 +510,15 @@ class Oxy(BaseModel, ABC):
         callee_name = oxy_request.callee
         callee_cat = oxy_request.callee_category
         if self.mas and self.mas.es_client:
+            # Move large arguments (messages, full_memory, ...) to the blob store
+            # so that only references are stored in the node table
+            if self.mas.blob_client:
+                oxy_input["arguments"] = (
+                    await self.mas.blob_client.offload(
+                        oxy_request.arguments, Config.get_blob_threshold()
+                    )
+                    or oxy_request.arguments
+                )
             # save shared_data
             shared_data_schema = Config.get_es_schema_shared_data().get(
                 "properties", {}
@@ -606,10 +668,7 @@ class Oxy(BaseModel, ABC):
                                 output=error_message,
                             )
                             break
-                    if self.func_execute:
-                        oxy_response = await self.func_execute(oxy_request)
-                    else:
-                        oxy_response = await self._execute(oxy_request)
+                    oxy_response = await self._call_execute(oxy_request)
                     break
                 except asyncio.CancelledError:
                     # if the task is cancelled, log and return a canceled response
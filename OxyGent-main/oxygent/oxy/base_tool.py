@@ -5,11 +5,16 @@ tools in the OxyGent system. Tools are specialized Oxy instances that typically
 permissions and have shorter timeout periods.
 """
 
+import asyncio
+import logging
+
 from pydantic import Field
 
-from ..schemas import OxyRequest, OxyResponse
+from ..schemas import OxyRequest, OxyResponse, OxyState
 from .base_oxy import Oxy
 
+logger = logging.getLogger(__name__)
+
 
 class BaseTool(Oxy):
     """Abstract base class for all tools in the OxyGent system.
@@ -19,6 +24,8 @@ class BaseTool(Oxy):
             this tool. Defaults to True for security.
         category (str): Tool category identifier. Always "tool".
         timeout (float): Execution timeout in seconds. Defaults to 60 seconds.
+        is_idempotent (bool): Whether the tool is pure, so that repeated calls with
+            the same arguments within a request reuse the first completed result.
     """
 
     is_permission_required: bool = Field(
@@ -26,6 +33,57 @@ class BaseTool(Oxy):
     )
     category: str = Field("tool", description="Tool category identifier")
     timeout: float = Field(60, description="Timeout in seconds.")
+    is_idempotent: bool = Field(
+        False, description="Whether equal calls in a request may reuse the result"
+    )
+
+    async def _call_execute(self, oxy_request: OxyRequest) -> OxyResponse:
+        """Execute the tool, memoizing completed results of idempotent tools.
+
+        Results are kept in ``oxy_request.memo_data`` under ``(name, input_md5)``.
+        A call equal to one still running waits for it instead of executing again.
+        """
+        if not self.is_idempotent:
+            return await super()._call_execute(oxy_request)
+
+        memo_data = oxy_request.memo_data
+        memo_key = (self.name, oxy_request.input_md5)
+        future = memo_data.get(memo_key)
+        if future is not None:
+            memo = await asyncio.shield(future)
+            if memo is not None:
+                memo_response, memo_node_id = memo
+                logger.info(
+                    f"{self.name} reuses the result of node {memo_node_id}",
+                    extra={
+                        "trace_id": oxy_request.current_trace_id,
+                        "node_id": oxy_request.node_id,
+                    },
+                )
+                return OxyResponse(
+                    state=memo_response.state,
+                    output=memo_response.output,
+                    extra={
+                        **memo_response.extra,
+                        "memo_hit": True,
+                        "memo_node_id": memo_node_id,
+                    },
+                )
+
+        future = asyncio.get_running_loop().create_future()
+        memo_data[memo_key] = future
+        oxy_response = None
+        try:
+            oxy_response = await super()._call_execute(oxy_request)
+            return oxy_response
+        finally:
+            if oxy_response is not None and oxy_response.state is OxyState.COMPLETED:
+                future.set_result((oxy_response, oxy_request.node_id))
+            else:
+                # Waiting calls execute by themselves
+                if memo_data.get(memo_key) is future:
+                    del memo_data[memo_key]
+                future.set_result(None)
 
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         raise NotImplementedError("This method is not yet implemented")
@@ -1,7 +1,9 @@
+from .batch_function_tool import BatchFunctionTool
 from .function_hub import FunctionHub
 from .function_tool import FunctionTool
 
 __all__ = [
+    "BatchFunctionTool",
     "FunctionHub",
     "FunctionTool",
 ]
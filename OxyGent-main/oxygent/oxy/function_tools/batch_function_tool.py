@@ -0,0 +1,132 @@
+"""Batch function tool module for merging concurrent calls into one invocation.
+
+This module provides the BatchFunctionTool class, which wraps a function that takes a
+list of argument dicts and returns a list of results. Concurrent executions of the
+tool, e.g. from the parallel tool calls of a ReAct agent or from a ParallelFlow, are
+collected for up to ``batch_window`` seconds or ``max_batch_size`` calls, passed to
+the function in one invocation, and each result is returned to its own caller. This
+lets lookups, embeddings or classifiers use their vectorized or bulk paths.
+"""
+
+import asyncio
+import functools
+import logging
+
+from pydantic import Field
+
+from ...config import Config
+from ...schemas import OxyRequest, OxyResponse, OxyState
+from .function_tool import FunctionTool
+
+logger = logging.getLogger(__name__)
+
+
+class BatchFunctionTool(FunctionTool):
+    """Function tool whose concurrent calls are executed as one batch.
+
+    The wrapped function is called as ``func(batch)``, where ``batch`` is the list of
+    argument dicts of the collected calls, and must return a list of the same length.
+    A result that is an Exception instance fails only its own call. The parameters of
+    a single call are given by ``input_schema``, in the format FunctionTool extracts
+    from signatures.
+
+    Attributes:
+        max_batch_size (int): Calls after which a batch is run without waiting.
+        batch_window (float): Seconds the first call of a batch waits for others.
+    """
+
+    max_batch_size: int = Field(
+        default_factory=Config.get_tool_batch_max_size,
+        description="Calls after which a batch is run without waiting",
+    )
+    batch_window: float = Field(
+        default_factory=Config.get_tool_batch_window,
+        description="Seconds the first call of a batch waits for others",
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.execution_mode == "process":
+            raise ValueError(f"Batch tool [{self.name}] cannot run in a process pool.")
+        self._pending = []
+        self._flush_handle = None
+        self._batch_tasks = set()
+
+    def _extract_input_schema(self, func):
+        # The function takes a list of argument dicts, so the schema of a single
+        # call cannot come from its signature
+        if "properties" not in self.input_schema:
+            raise ValueError(f"Batch tool [{self.name}] needs an input_schema.")
+        return self.input_schema
+
+    def _compile_arg_binder(self, func):
+        return [(name, False, None, None) for name in self.input_schema["properties"]]
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch):
+        # Calls whose callers were cancelled, e.g. by their timeout, are dropped
+        batch = [(kwargs, future) for kwargs, future in batch if not future.done()]
+        if not batch:
+            return
+        kwargs_list = [kwargs for kwargs, _ in batch]
+        try:
+            if self.execution_mode == "thread":
+                results = await self.mas.run_in_executor(
+                    "thread", functools.partial(self._sync_func, kwargs_list)
+                )
+            else:
+                results = await self.func_process(kwargs_list)
+            if not isinstance(results, (list, tuple)):
+                raise TypeError(
+                    f"Batch tool {self.name} returned {type(results).__name__}, "
+                    "expected a list"
+                )
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Batch tool {self.name} returned {len(results)} results "
+                    f"for {len(batch)} calls"
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result((result, len(batch)))
+
+    async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
+        """Queue the call into the current batch and wait for its result."""
+        try:
+            func_kwargs = self.bind_arguments(oxy_request)
+            future = asyncio.get_running_loop().create_future()
+            self._pending.append((func_kwargs, future))
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    self.batch_window, self._flush
+                )
+            result, batch_size = await future
+            return OxyResponse(
+                state=OxyState.COMPLETED,
+                output=result,
+                extra={"batch_size": batch_size},
+            )
+        except Exception as e:
+            logger.error(f"Error in batch function tool {self.name}: {e}")
+            return OxyResponse(state=OxyState.FAILED, output=str(e))
@@ -10,7 +10,9 @@ import functools
 
 from pydantic import Field
 
+from ...config import Config
 from ..base_tool import BaseTool
+from .batch_function_tool import BatchFunctionTool
 from .function_tool import FunctionTool
 
 
@@ -23,11 +25,17 @@ class FunctionHub(BaseTool):
     Attributes:
         func_dict (dict): Dictionary mapping function names to their descriptions
             and execution functions. Format: {name: (description, async_func)}
+        func_options (dict): Extra FunctionTool arguments of each function, such as
+            its execution_mode, and the tool class under ``"tool_class"``.
+            Format: {name: {arg: value}}
     """
 
     func_dict: dict = Field(
         default_factory=dict, description="Registry of functions and their metadata"
     )
+    func_options: dict = Field(
+        default_factory=dict, description="FunctionTool arguments of each function"
+    )
 
     async def init(self):
         """Initialize the hub by creating FunctionTool instances for all registered
@@ -37,25 +45,41 @@ class FunctionHub(BaseTool):
         instances and registers them with the MAS (Multi-Agent System).
         """
         await super().init()
-        params = self.model_dump(exclude={"func_dict", "name", "desc"})
+        params = self.model_dump(exclude={"func_dict", "func_options", "name", "desc"})
 
         # Create FunctionTool instances for each registered function
         for tool_name, (tool_desc, tool_func) in self.func_dict.items():
-            function_tool = FunctionTool(
-                name=tool_name, desc=tool_desc, func_process=tool_func, **params
+            options = {**params, **self.func_options.get(tool_name, {})}
+            tool_class = options.pop("tool_class", FunctionTool)
+            function_tool = tool_class(
+                name=tool_name,
+                desc=tool_desc,
+                func_process=tool_func,
+                **options,
             )
             function_tool.set_mas(self.mas)
             self.mas.add_oxy(function_tool)
 
-    def tool(self, description):
+    def tool(self, description, execution_mode=None, is_idempotent=None):
         """Decorator for registering functions as tools.
 
         This decorator automatically converts both synchronous and asynchronous
         functions into async functions and registers them in the function hub.
-        Synchronous functions are wrapped to run asynchronously.
+        Synchronous functions are wrapped to run asynchronously; a blocking one
+        should use ``execution_mode="thread"`` or ``"process"``, or set
+        ``Config.set_tool_sync_execution_mode``, so that it does not block the event
+        loop.
 
         Args:
             description (str): Human-readable description of the tool's functionality.
+            execution_mode (str, optional): ``"inline"`` to run on the event loop,
+                ``"thread"`` or ``"process"`` to run a synchronous function in the
+                MAS thread or process pool. Process-mode functions must be defined
+                at module level. Defaults to ``"inline"`` for async functions and
+                ``Config.get_tool_sync_execution_mode()`` for synchronous ones.
+            is_idempotent (bool, optional): Whether repeated calls with the same
+                arguments within a request reuse the first result. Defaults to the
+                ``is_idempotent`` of the hub.
 
         Returns:
             Callable: Decorator function that registers and returns the async version
@@ -63,18 +87,79 @@ class FunctionHub(BaseTool):
         """
 
         def decorator(func):
-            # Check if function is already asynchronous
-            if asyncio.iscoroutinefunction(func):
-                async_func = func
-            else:
-                # Wrap synchronous function to make it asynchronous
-                @functools.wraps(func)
-                async def async_func(*args, **kwargs):
-                    # TODO: Use thread pool for blocking synchronous operations
-                    return func(*args, **kwargs)
+            async_func, mode = self._to_async(func, execution_mode)
 
             # Register function in the hub's dictionary
             self.func_dict[func.__name__] = (description, async_func)
+            self.func_options[func.__name__] = {"execution_mode": mode}
+            if is_idempotent is not None:
+                self.func_options[func.__name__]["is_idempotent"] = is_idempotent
             return async_func  # Return the async version
 
         return decorator
+
+    def batch_tool(
+        self,
+        description,
+        input_schema,
+        max_batch_size=None,
+        batch_window=None,
+        execution_mode=None,
+    ):
+        """Decorator for registering batch functions as tools.
+
+        The decorated function takes a list of argument dicts, one per call, and
+        returns the list of their results. Concurrent calls of the tool are merged
+        into one invocation, see :class:`BatchFunctionTool`.
+
+        Args:
+            description (str): Human-readable description of the tool's functionality.
+            input_schema (dict): Parameters of a single call, as
+                ``{"properties": {name: {"description", "type"}}, "required": [...]}``.
+            max_batch_size (int, optional): Calls after which a batch runs without
+                waiting. Defaults to ``Config.get_tool_batch_max_size()``.
+            batch_window (float, optional): Seconds the first call of a batch waits
+                for others. Defaults to ``Config.get_tool_batch_window()``.
+            execution_mode (str, optional): ``"inline"`` or ``"thread"``, with the
+                same defaults as :meth:`tool`.
+
+        Example:
+            >>> @hub.batch_tool(
+            ...     "Get the population of a city",
+            ...     {"properties": {"city": {"description": "City name", "type": "str"}},
+            ...      "required": ["city"]},
+            ... )
+            ... def get_population(batch):
+            ...     return lookup_populations([args["city"] for args in batch])
+        """
+
+        def decorator(func):
+            async_func, mode = self._to_async(func, execution_mode)
+            options = {
+                "tool_class": BatchFunctionTool,
+                "execution_mode": mode,
+                "input_schema": input_schema,
+            }
+            if max_batch_size is not None:
+                options["max_batch_size"] = max_batch_size
+            if batch_window is not None:
+                options["batch_window"] = batch_window
+
+            self.func_dict[func.__name__] = (description, async_func)
+            self.func_options[func.__name__] = options
+            return async_func
+
+        return decorator
+
+    @staticmethod
+    def _to_async(func, execution_mode):
+        # Check if function is already asynchronous
+        if asyncio.iscoroutinefunction(func):
+            return func, execution_mode or "inline"
+
+        # Wrap synchronous function to make it asynchronous
+        @functools.wraps(func)
+        async def async_func(*args, **kwargs):
+            return func(*args, **kwargs)
+
+        return async_func, execution_mode or Config.get_tool_sync_execution_mode()
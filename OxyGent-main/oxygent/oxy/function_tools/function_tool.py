@@ -5,20 +5,37 @@ executable within the OxyGent system. It automatically extracts input schemas fr
 function signatures and handles execution with proper error handling.
 """
 
+import asyncio
+import functools
+import importlib
 import logging
 from inspect import Parameter, signature
-from typing import Callable, Optional
+from typing import Callable, Literal, Optional
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter, ValidationError
 from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefined
 
+from ...config import Config
 from ...schemas import OxyRequest, OxyResponse, OxyState
 from ..base_tool import BaseTool
 
 logger = logging.getLogger(__name__)
 
 
+def _call_by_reference(module_name, qualname, kwargs):
+    """Run a tool function in a worker process.
+
+    The function is looked up by name because the module attribute is the async
+    wrapper created by ``FunctionHub.tool``, so the function itself cannot be pickled.
+    """
+    func = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        func = getattr(func, attr)
+    func = getattr(func, "__wrapped__", func)
+    return func(**kwargs)
+
+
 class FunctionTool(BaseTool):
     """Tool that wraps Python functions for execution within the OxyGent system.
 
@@ -37,13 +54,35 @@ class FunctionTool(BaseTool):
     needs_oxy_request: bool = Field(
         False, description="Whether this tool needs oxy_request parameter"
     )
+    execution_mode: Literal["inline", "thread", "process"] = Field(
+        "inline",
+        description="Run on the event loop, or run the synchronous function in the "
+        "thread or process pool of the MAS",
+    )
+    is_validate_arguments: bool = Field(
+        default_factory=Config.get_tool_is_validate_arguments,
+        description="Validate and coerce arguments against the parameter annotations",
+    )
 
     def __init__(self, **kwargs):
         """Initialize the function tool and extract input schema from function
         signature."""
         super().__init__(**kwargs)
         self.input_schema = self._extract_input_schema(self.func_process)
+        self._arg_binder = self._compile_arg_binder(self.func_process)
         self._set_desc_for_llm()
+        self._sync_func = None
+        if self.execution_mode != "inline":
+            sync_func = getattr(self.func_process, "__wrapped__", self.func_process)
+            if asyncio.iscoroutinefunction(sync_func):
+                raise ValueError(
+                    f"Tool [{self.name}] is async and cannot run in a {self.execution_mode} pool."
+                )
+            if self.execution_mode == "process" and self.needs_oxy_request:
+                raise ValueError(
+                    f"Tool [{self.name}] needs oxy_request and cannot run in a process pool."
+                )
+            self._sync_func = sync_func
 
     def _extract_input_schema(self, func):
         """Extract input schema from function signature.
@@ -92,41 +131,92 @@ class FunctionTool(BaseTool):
 
         return schema
 
+    def _compile_arg_binder(self, func):
+        """Precompute how each parameter of ``func`` gets its value.
+
+        Returns:
+            list: ``(name, is_oxy_request, default, adapter)`` tuples, where
+                ``adapter`` is a TypeAdapter of the annotation when
+                ``is_validate_arguments`` is set, and None otherwise.
+        """
+        binder = []
+        for name, param in signature(func).parameters.items():
+            param_type = param.annotation
+            if param_type is not Parameter.empty:
+                type_name = getattr(param_type, "__name__", str(param_type))
+                if type_name == "OxyRequest":
+                    binder.append((name, True, None, None))
+                    continue
+
+            # Missing arguments use the parameter default if available, else None
+            if isinstance(param.default, FieldInfo):
+                default = (
+                    param.default.default
+                    if param.default.default is not PydanticUndefined
+                    else None
+                )
+            elif param.default is not Parameter.empty:
+                default = param.default
+            else:
+                default = None
+
+            adapter = None
+            if self.is_validate_arguments and param_type is not Parameter.empty:
+                try:
+                    adapter = TypeAdapter(param_type)
+                except Exception as e:
+                    logger.warning(
+                        f"Arguments of {self.name}.{name} are not validated: {e}"
+                    )
+            binder.append((name, False, default, adapter))
+        return binder
+
+    def bind_arguments(self, oxy_request: OxyRequest) -> dict:
+        """Build the keyword arguments of the function from the request.
+
+        Raises:
+            ValidationError: If ``is_validate_arguments`` is set and an argument does
+                not match its annotation.
+        """
+        arguments = oxy_request.arguments
+        func_kwargs = {}
+        for name, is_oxy_request, default, adapter in self._arg_binder:
+            if is_oxy_request:
+                func_kwargs[name] = oxy_request
+            elif name in arguments:
+                value = arguments[name]
+                func_kwargs[name] = (
+                    value if adapter is None else adapter.validate_python(value)
+                )
+            else:
+                func_kwargs[name] = default
+        return func_kwargs
+
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         """Execute the wrapped function with provided arguments."""
         try:
-            func_kwargs = {}
-            sig = signature(self.func_process)
-
-            for param_name, param in sig.parameters.items():
-                param_type = param.annotation
-                
-                # Get type name, handling empty annotations
-                if param_type is Parameter.empty:
-                    type_name = None
-                else:
-                    type_name = getattr(param_type, "__name__", str(param_type))
-                    # Handle OxyRequest parameters
-                    if type_name == "OxyRequest":
-                        func_kwargs[param_name] = oxy_request
-                        continue
-
-                # Process parameter value based on availability in arguments
-                if param_name in oxy_request.arguments:
-                    func_kwargs[param_name] = oxy_request.arguments[param_name]
-                else:
-                    # Handle missing arguments - use parameter default if available
-                    if isinstance(param.default, FieldInfo):
-                        func_kwargs[param_name] = (
-                            param.default.default if param.default.default is not PydanticUndefined else None
-                        )
-                    elif param.default is not Parameter.empty:
-                        func_kwargs[param_name] = param.default
-                    else:
-                        # No default value available, pass None
-                        func_kwargs[param_name] = None
-
-            result = await self.func_process(**func_kwargs)
+            try:
+                func_kwargs = self.bind_arguments(oxy_request)
+            except ValidationError as e:
+                return OxyResponse(
+                    state=OxyState.FAILED,
+                    output=f"Invalid arguments of tool {self.name}: {e}",
+                )
+
+            if self.execution_mode == "inline":
+                result = await self.func_process(**func_kwargs)
+            elif self.execution_mode == "thread":
+                result = await self.mas.run_in_executor(
+                    "thread", functools.partial(self._sync_func, **func_kwargs)
+                )
+            else:
+                result = await self.mas.run_in_executor(
+                    "process",
+                    _call_by_reference,
+                    self._sync_func.__module__,
+                    self._sync_func.__qualname__,
+                    func_kwargs,
+                )
             return OxyResponse(state=OxyState.COMPLETED, output=result)
         except Exception as e:
             import traceback
@@ -15,9 +15,10 @@ import aiofiles
 from pydantic import Field
 
 from ...config import Config
-from ...schemas import OxyRequest, OxyResponse
+from ...schemas import OxyRequest, OxyResponse, OxyState
 from ...utils.common_utils import (
     extract_first_json,
+    generate_uuid,
     image_to_base64,
     parse_mixed_string,
     video_to_base64,
@@ -27,6 +28,55 @@ from ..base_oxy import Oxy
 logger = logging.getLogger(__name__)
 
 
+def normalize_tool_calls(tool_calls):
+    """Convert tool calls of an OpenAI-compatible or Ollama response to OpenAI dicts.
+
+    Arguments are returned as a JSON string, and missing call ids are generated.
+    """
+    normalized = []
+    for tool_call in tool_calls or []:
+        function = tool_call.get("function") or {}
+        arguments = function.get("arguments")
+        if not arguments:
+            arguments = "{}"
+        elif not isinstance(arguments, str):
+            arguments = json.dumps(arguments, ensure_ascii=False)
+        normalized.append(
+            {
+                "id": tool_call.get("id") or "call_" + generate_uuid(),
+                "type": "function",
+                "function": {"name": function.get("name", ""), "arguments": arguments},
+            }
+        )
+    return normalized
+
+
+def merge_tool_call_deltas(tool_calls, deltas):
+    """Accumulate the ``tool_calls`` deltas of a streamed chunk into ``tool_calls``.
+
+    Args:
+        tool_calls (dict): Partial tool calls by their index, updated in place.
+        deltas (list): The ``delta.tool_calls`` of a chunk, as dicts.
+    """
+    for position, delta in enumerate(deltas or []):
+        index = delta.get("index")
+        if index is None:
+            index = len(tool_calls) + position
+        tool_call = tool_calls.setdefault(
+            index, {"id": "", "function": {"name": "", "arguments": ""}}
+        )
+        if delta.get("id"):
+            tool_call["id"] = delta["id"]
+        function = delta.get("function") or {}
+        if function.get("name"):
+            tool_call["function"]["name"] += function["name"]
+        arguments = function.get("arguments")
+        if isinstance(arguments, str):
+            tool_call["function"]["arguments"] += arguments
+        elif arguments is not None:
+            tool_call["function"]["arguments"] = arguments
+
+
 class BaseLLM(Oxy):
     """Base class for Large Language Model implementations.
 
@@ -88,7 +138,7 @@ class BaseLLM(Oxy):
         messages_processed = copy.deepcopy(oxy_request.arguments["messages"])
         messages_temp = []
         for message in messages_processed:
-            role, content = message["role"], message["content"]
+            role, content = message["role"], message.get("content")
             if role == "user":
                 # 如果不是str类型则不做处理
                 if not isinstance(content, str):
@@ -138,7 +188,7 @@ class BaseLLM(Oxy):
                             )
                         else:
                             pass
-            messages_temp.append({"role": role, "content": content})
+            messages_temp.append({**message, "content": content})
         messages_processed = messages_temp
 
         # hold url
@@ -174,6 +224,16 @@ class BaseLLM(Oxy):
 
         return messages_processed
 
+    def _build_response(self, output, tool_calls=None) -> OxyResponse:
+        """Wrap a completion, carrying its tool calls in ``extra["tool_calls"]``."""
+        if not tool_calls:
+            return OxyResponse(state=OxyState.COMPLETED, output=output)
+        return OxyResponse(
+            state=OxyState.COMPLETED,
+            output=output or "",
+            extra={"tool_calls": normalize_tool_calls(tool_calls)},
+        )
+
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         """Execute the LLM request."""
         raise NotImplementedError("This method is not yet implemented")
@@ -191,7 +251,7 @@ class BaseLLM(Oxy):
         await super()._post_send_message(oxy_response)
         # Send thinking process to frontend
         oxy_request = oxy_response.oxy_request
-        if self.is_send_think:
+        if self.is_send_think and oxy_response.output:
             try:
                 msg = ""
                 if "</think>" in oxy_response.output:
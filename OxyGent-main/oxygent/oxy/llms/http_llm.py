@@ -11,7 +11,8 @@ import logging
 import httpx
 
 from ...config import Config
-from ...schemas import OxyRequest, OxyResponse, OxyState
+from ...schemas import OxyRequest, OxyResponse
+from .base_llm import merge_tool_call_deltas
 from .remote_llm import RemoteLLM
 
 logger = logging.getLogger(__name__)
@@ -22,7 +23,8 @@ class HttpLLM(RemoteLLM):
 
     This class provides a concrete implementation of RemoteLLM for communicating
     with remote LLM APIs over HTTP. It handles API authentication, request
-    formatting, and response parsing for OpenAI-compatible APIs.
+    formatting, and response parsing for OpenAI-compatible APIs. Tool calls
+    requested through ``tools`` are returned in ``extra["tool_calls"]``.
     """
 
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
@@ -74,7 +76,15 @@ class HttpLLM(RemoteLLM):
             payload: dict = {"contents": contents}
             payload.update(self.llm_params)
             for k, v in oxy_request.arguments.items():
-                if k != "messages":
+                if k in ("tools", "tool_choice"):
+                    logger.warning(
+                        "Function calling is not supported for Gemini, ignoring tools.",
+                        extra={
+                            "trace_id": oxy_request.current_trace_id,
+                            "node_id": oxy_request.node_id,
+                        },
+                    )
+                elif k != "messages":
                     payload[k] = v
         else:
             llm_config = {
@@ -104,6 +114,7 @@ class HttpLLM(RemoteLLM):
 
         if payload.get("stream", False) and (use_openai or not is_gemini):
             result_parts: list[str] = []
+            tool_calls: dict = {}
             async with httpx.AsyncClient(timeout=None) as client:
                 async with client.stream(
                     "POST", url, headers=headers, json=payload
@@ -128,15 +139,23 @@ class HttpLLM(RemoteLLM):
                                 },
                             )
                         if use_openai:
+                            if not chunk.get("choices"):
+                                continue
                             delta = chunk["choices"][0]["delta"].get(
                                 "content", ""
                             ) or chunk["choices"][0]["delta"].get(
                                 "reasoning_content", ""
                             )
+                            merge_tool_call_deltas(
+                                tool_calls, chunk["choices"][0]["delta"].get("tool_calls")
+                            )
                         else:
                             delta = chunk.get("message", {}).get(
                                 "content", ""
                             ) or chunk.get("message", {}).get("reasoning_content", "")
+                            merge_tool_call_deltas(
+                                tool_calls, chunk.get("message", {}).get("tool_calls")
+                            )
                         if delta:
                             result_parts.append(delta)
                             await oxy_request.send_message(
@@ -147,8 +166,11 @@ class HttpLLM(RemoteLLM):
                                 }
                             )
             result = "".join(result_parts)
-            return OxyResponse(state=OxyState.COMPLETED, output=result)
+            return self._build_response(
+                result, [tool_calls[index] for index in sorted(tool_calls)]
+            )
 
+        tool_calls = None
         async with httpx.AsyncClient(timeout=self.timeout) as client:
             http_response = await client.post(url, headers=headers, json=payload)
             http_response.raise_for_status()
@@ -167,7 +189,9 @@ class HttpLLM(RemoteLLM):
                 result = response_message.get("content") or response_message.get(
                     "reasoning_content"
                 )
+                tool_calls = response_message.get("tool_calls")
             else:  # ollama
                 result = data["message"]["content"]
+                tool_calls = data["message"].get("tool_calls")
 
-            return OxyResponse(state=OxyState.COMPLETED, output=result)
+            return self._build_response(result, tool_calls)
@@ -10,7 +10,8 @@ import logging
 from openai import AsyncOpenAI
 
 from ...config import Config
-from ...schemas import OxyRequest, OxyResponse, OxyState
+from ...schemas import OxyRequest, OxyResponse
+from .base_llm import merge_tool_call_deltas
 from .remote_llm import RemoteLLM
 
 logger = logging.getLogger(__name__)
@@ -21,7 +22,8 @@ class OpenAILLM(RemoteLLM):
 
     This class provides a concrete implementation of RemoteLLM specifically designed
     for OpenAI's language models. It uses the official AsyncOpenAI client for
-    optimal performance and compatibility with OpenAI's API standards.
+    optimal performance and compatibility with OpenAI's API standards. Tool calls
+    requested through ``tools`` are returned in ``extra["tool_calls"]``.
     """
 
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
@@ -70,9 +72,21 @@ class OpenAILLM(RemoteLLM):
         completion = await client.chat.completions.create(**payload)
         if payload["stream"]:
             answer = ""
+            tool_calls = {}
             think_start = True
             think_end = False
             async for chunk in completion:
+                if not chunk.choices:
+                    continue
+                char = None
+                if chunk.choices[0].delta.tool_calls:
+                    merge_tool_call_deltas(
+                        tool_calls,
+                        [
+                            tool_call.model_dump()
+                            for tool_call in chunk.choices[0].delta.tool_calls
+                        ],
+                    )
                 if hasattr(chunk.choices[0].delta, "reasoning_content"):
                     if think_start:
                         await oxy_request.send_message(
@@ -107,8 +121,12 @@ class OpenAILLM(RemoteLLM):
                             "_is_stored": False,
                         }
                     )
-            return OxyResponse(state=OxyState.COMPLETED, output=answer)
+            return self._build_response(
+                answer, [tool_calls[index] for index in sorted(tool_calls)]
+            )
         else:
-            return OxyResponse(
-                state=OxyState.COMPLETED, output=completion.choices[0].message.content
+            message = completion.choices[0].message
+            return self._build_response(
+                message.content,
+                [tool_call.model_dump() for tool_call in message.tool_calls or []],
             )
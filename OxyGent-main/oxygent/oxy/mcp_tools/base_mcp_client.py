@@ -17,7 +17,14 @@ from pydantic import Field
 from ...config import Config
 from ...schemas import OxyRequest, OxyResponse, OxyState
 from ..base_tool import BaseTool
+from .manifest_cache import (
+    get_manifest_key,
+    load_manifest,
+    save_manifest,
+    tools_to_manifest,
+)
 from .mcp_tool import MCPTool
+from .session_pool import MCPSessionPool
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +47,18 @@ class BaseMCPClient(BaseTool):
     is_dynamic_headers: bool = Field(False, description="is dynamic headers")
     is_inherit_headers: bool = Field(False, description="is inherit headers")
     is_keep_alive: bool = Field(default_factory=Config.get_tool_mcp_is_keep_alive)
+    session_pool_size: int = Field(
+        default_factory=Config.get_tool_mcp_session_pool_size,
+        description="Max warm sessions kept for dynamic headers or without keep-alive",
+    )
+    session_idle_timeout: float = Field(
+        default_factory=Config.get_tool_mcp_session_idle_timeout,
+        description="Seconds after which an unused pooled session is closed",
+    )
+    is_manifest_cached: bool = Field(
+        default_factory=Config.get_tool_mcp_is_manifest_cached,
+        description="Register tools from the cached manifest and connect in background",
+    )
 
     def __init__(self, **kwargs):
         """Initialize the MCP client with necessary resources.
@@ -52,6 +71,83 @@ class BaseMCPClient(BaseTool):
         self._cleanup_lock: asyncio.Lock = asyncio.Lock()
         self._exit_stack: AsyncExitStack = AsyncExitStack()
         self._stdio_context: Any = Field(None)
+        self._connect_task: asyncio.Task = None
+        self._session_pool: MCPSessionPool = MCPSessionPool(
+            self.name,
+            self._open_session,
+            max_size=self.session_pool_size,
+            idle_timeout=self.session_idle_timeout,
+            health_check_interval=Config.get_tool_mcp_session_health_check_interval(),
+        )
+
+    def get_manifest_identity(self) -> dict:
+        """Describe how the server is reached, to key its cached manifest."""
+        return {}
+
+    async def init(self, is_fetch_tools=True) -> None:
+        """Connect to the MCP server and register its tools.
+
+        With ``is_manifest_cached``, tools are registered right away from the manifest
+        cached by a previous run, and the connection is made in the background. The
+        tools listed by the server then replace the cached ones, and calls made in
+        the meantime wait for the connection.
+        """
+        if is_fetch_tools and self.is_manifest_cached:
+            manifest = load_manifest(self.get_manifest_key())
+            if manifest is not None:
+                self.register_tools(manifest)
+                self._connect_task = asyncio.create_task(self.connect())
+                self._connect_task.add_done_callback(self._on_connected)
+                return
+        await self.connect(is_fetch_tools)
+
+    async def connect(self, is_fetch_tools=True) -> None:
+        """Open the connection to the MCP server and list its tools."""
+        raise NotImplementedError("This method is not yet implemented")
+
+    def get_manifest_key(self):
+        return get_manifest_key(
+            {
+                "class": type(self).__name__,
+                "name": self.name,
+                **self.get_manifest_identity(),
+            }
+        )
+
+    def _on_connected(self, task):
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.error(
+                f"Background connection to MCP server {self.name} failed, "
+                f"retrying on the next call: {task.exception()}"
+            )
+
+    async def _ensure_connected(self):
+        """Wait for the background connection, retrying it if it failed."""
+        task = self._connect_task
+        if task is None:
+            return
+        if task.done() and (task.cancelled() or task.exception() is not None):
+            logger.warning(f"Reconnecting to MCP server {self.name}")
+            task = self._connect_task = asyncio.create_task(self.connect())
+        await asyncio.shield(task)
+
+    async def _open_session(self, exit_stack, headers) -> ClientSession:
+        """Enter a transport and an initialized session into ``exit_stack``.
+
+        Args:
+            exit_stack: The AsyncExitStack that owns the connection.
+            headers: HTTP headers of the connection, if the transport has any.
+
+        Returns:
+            ClientSession: The initialized session.
+        """
+        raise NotImplementedError("This method is not yet implemented")
+
+    async def call_tool(self, tool_name, arguments, headers=None):
+        """Call a tool on the warm session pooled for ``headers``."""
+        return await self._session_pool.call_tool(tool_name, arguments, headers)
 
     async def list_tools(self) -> None:
         """Discover and register tools from the MCP server.
@@ -69,6 +165,21 @@ class BaseMCPClient(BaseTool):
         dynamically creates MCPTool instances for each discovered tool. These tools are
         then registered with the MAS for use by agents.
         """
+        manifest = tools_to_manifest(tools_response)
+        self.register_tools(manifest)
+        if self.is_manifest_cached:
+            try:
+                save_manifest(self.get_manifest_key(), manifest)
+            except Exception as e:
+                logger.warning(f"Failed to cache MCP manifest of {self.name}: {e}")
+
+    def register_tools(self, manifest) -> None:
+        """Create or update the MCPTool proxies of the tools in ``manifest``.
+
+        Tools registered before, e.g. from a cached manifest, get the listed
+        description and schema. New tools are also permitted to the agents that
+        use this client, and tools the server no longer lists are reported.
+        """
         params = self.model_dump(
             exclude={
                 "sse_url",
@@ -83,27 +194,64 @@ class BaseMCPClient(BaseTool):
                 "input_schema",
             }
         )
-        for item in tools_response:
-            if isinstance(item, tuple) and item[0] == "tools":
-                for tool in item[1]:
-                    self.included_tool_name_list.append(tool.name)
-
-                    mcp_tool = MCPTool(
-                        name=tool.name,
-                        desc=tool.description,
-                        mcp_client=self,
-                        server_name=self.name,
-                        input_schema=tool.inputSchema,
-                        func_process_input=self.func_process_input,
-                        func_process_output=self.func_process_output,
-                        func_format_input=self.func_format_input,
-                        func_format_output=self.func_format_output,
-                        func_execute=self.func_execute,
-                        func_interceptor=self.func_interceptor,
-                        **params,
+        is_update = bool(self.included_tool_name_list)
+        for tool in manifest:
+            if tool["name"] in self.included_tool_name_list:
+                mcp_tool = self.mas.oxy_name_to_oxy[tool["name"]]
+                if (
+                    mcp_tool.desc != tool["description"]
+                    or mcp_tool.input_schema != tool["inputSchema"]
+                ):
+                    mcp_tool.desc = tool["description"]
+                    mcp_tool.input_schema = tool["inputSchema"]
+                    mcp_tool._set_desc_for_llm()
+                    self.mas.tool_lexical_index.add(
+                        mcp_tool.name, mcp_tool.desc_for_llm
                     )
-                    mcp_tool.set_mas(self.mas)
-                    self.mas.add_oxy(mcp_tool)
+                continue
+            self.included_tool_name_list.append(tool["name"])
+
+            mcp_tool = MCPTool(
+                name=tool["name"],
+                desc=tool["description"],
+                mcp_client=self,
+                server_name=self.name,
+                input_schema=tool["inputSchema"],
+                func_process_input=self.func_process_input,
+                func_process_output=self.func_process_output,
+                func_format_input=self.func_format_input,
+                func_format_output=self.func_format_output,
+                func_execute=self.func_execute,
+                func_interceptor=self.func_interceptor,
+                **params,
+            )
+            mcp_tool.set_mas(self.mas)
+            self.mas.add_oxy(mcp_tool)
+            if is_update:
+                self._permit_new_tool(tool["name"])
+        removed = set(self.included_tool_name_list) - {t["name"] for t in manifest}
+        if removed:
+            logger.warning(
+                f"MCP server {self.name} no longer lists tools {sorted(removed)}"
+            )
+
+    def _permit_new_tool(self, tool_name):
+        for oxy in list(self.mas.oxy_name_to_oxy.values()):
+            if self.name in (getattr(oxy, "tools", None) or []) and tool_name not in (
+                getattr(oxy, "except_tools", None) or []
+            ):
+                oxy.add_permitted_tool(tool_name)
+
+    async def call_keep_alive_tool(self, tool_name, arguments):
+        """Call a tool on the keep-alive session, reconnecting if it was closed."""
+        if not self._session:
+            raise RuntimeError(f"Server {self.name} not initialized")
+
+        try:
+            return await self._session.call_tool(tool_name, arguments)
+        except anyio.ClosedResourceError:
+            await self.init(is_fetch_tools=False)  # TODO: refetch tools
+            return await self._session.call_tool(tool_name, arguments)
 
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         """Execute a tool call through the MCP server.
@@ -113,20 +261,12 @@ class BaseMCPClient(BaseTool):
         the MCP protocol.
         """
         tool_name = oxy_request.callee
+        await self._ensure_connected()
 
         if not self.is_dynamic_headers and self.is_keep_alive:
-            if not self._session:
-                raise RuntimeError(f"Server {self.name} not initialized")
-
-            try:
-                mcp_response = await self._session.call_tool(
-                    tool_name, oxy_request.arguments
-                )
-            except anyio.ClosedResourceError:
-                await self.init(is_fetch_tools=False)  # TODO: refetch tools
-                mcp_response = await self._session.call_tool(
-                    tool_name, oxy_request.arguments
-                )
+            mcp_response = await self.call_keep_alive_tool(
+                tool_name, oxy_request.arguments
+            )
         else:
             if self.is_dynamic_headers:
                 _headers = (
@@ -160,8 +300,12 @@ class BaseMCPClient(BaseTool):
         cleanup lock to prevent concurrent cleanup operations and handles cancellation
         and other exceptions gracefully.
         """
+        task = self._connect_task
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
         async with self._cleanup_lock:
             try:
+                await self._session_pool.close()
                 await self._exit_stack.aclose()
             except asyncio.CancelledError:
                 # TODO cleanup(): Operation was cancelled
@@ -0,0 +1,73 @@
+"""Persistent cache of MCP tool manifests.
+
+A manifest is the list of ``{"name", "description", "inputSchema"}`` entries that an
+MCP server returns from ``list_tools()``. Manifests are stored as JSON files under
+``{cache_dir}/mcp_manifest``, one per server, keyed by a hash of how the server is
+reached (command and args, or URL) and of the version of its source files, so that
+MCP clients can register their tools at startup before the server is connected.
+"""
+
+import json
+import logging
+import os
+
+from ...config import Config
+from ...utils.common_utils import get_md5
+
+logger = logging.getLogger(__name__)
+
+
+def get_manifest_key(identity):
+    """Hash a JSON-serializable description of an MCP server into a cache key."""
+    return get_md5(json.dumps(identity, sort_keys=True, default=str))
+
+
+def get_file_version(path):
+    """Return a version string of a local file, or ``None`` if it does not exist."""
+    if not isinstance(path, str) or not os.path.isfile(path):
+        return None
+    stat = os.stat(path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _get_manifest_path(key):
+    return os.path.join(Config.get_cache_save_dir(), "mcp_manifest", f"{key}.json")
+
+
+def tools_to_manifest(tools_response):
+    """Convert a ``list_tools()`` response into a manifest."""
+    manifest = []
+    for item in tools_response:
+        if isinstance(item, tuple) and item[0] == "tools":
+            for tool in item[1]:
+                manifest.append(
+                    {
+                        "name": tool.name,
+                        "description": tool.description,
+                        "inputSchema": tool.inputSchema,
+                    }
+                )
+    return manifest
+
+
+def load_manifest(key):
+    """Return the cached manifest of ``key``, or ``None`` if there is none."""
+    path = _get_manifest_path(key)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)["tools"]
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable MCP manifest {path}: {e}")
+        return None
+
+
+def save_manifest(key, manifest):
+    """Atomically write the manifest of ``key``."""
+    path = _get_manifest_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"tools": manifest}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
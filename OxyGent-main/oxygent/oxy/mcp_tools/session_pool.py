@@ -0,0 +1,231 @@
+"""Pool of warm MCP client sessions.
+
+This module provides the MCPSessionPool class, used by MCP clients whose calls cannot
+share the single keep-alive session: clients with per-request headers, or with
+``is_keep_alive`` turned off. Instead of opening a transport and running
+``initialize()`` for every call, sessions are kept per (server, headers) key and
+reused, since one ClientSession can carry concurrent requests.
+
+Each pooled session lives in its own background task, because the anyio transports
+of the MCP SDK must be entered and exited by the same task. Sessions that stay idle
+for ``idle_timeout`` seconds are closed, sessions idle for more than
+``health_check_interval`` seconds are pinged and dropped if the ping fails, and the
+least recently used idle session is evicted when the pool is full. If every pooled
+session is busy, the call gets a one-off session that is closed afterwards.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+_CONNECTION_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+)
+
+
+class _PooledSession(object):
+    def __init__(self, key, open_session, headers):
+        self.key = key
+        self.open_session = open_session
+        self.headers = headers
+        self.session = None
+        self.error = None
+        self.in_use = 0
+        self.last_used = time.monotonic()
+        self.last_checked = self.last_used
+        self.ready = asyncio.Event()
+        self.closing = asyncio.Event()
+        self.task = None
+
+    @property
+    def is_alive(self):
+        return self.session is not None and not self.task.done()
+
+    async def start(self):
+        if self.task is None:
+            self.task = asyncio.create_task(self._run())
+        await self.ready.wait()
+        if self.session is None:
+            raise self.error or RuntimeError(f"MCP session {self.key} closed")
+
+    async def _run(self):
+        try:
+            async with AsyncExitStack() as stack:
+                self.session = await self.open_session(stack, self.headers)
+                self.ready.set()
+                await self.closing.wait()
+        except Exception as e:
+            self.error = e
+            if self.ready.is_set():
+                logger.warning(f"MCP session {self.key} lost: {e}")
+        finally:
+            self.session = None
+            self.ready.set()
+
+    async def close(self):
+        self.closing.set()
+        if self.task is not None:
+            await asyncio.wait([self.task], timeout=10)
+
+
+class MCPSessionPool(object):
+    """Warm MCP sessions keyed by (server name, headers hash)."""
+
+    def __init__(
+        self,
+        server_name,
+        open_session,
+        max_size=16,
+        idle_timeout=300,
+        health_check_interval=60,
+    ):
+        """Create an empty pool.
+
+        Args:
+            server_name (str): Name of the MCP client, part of every key.
+            open_session (callable): ``open_session(exit_stack, headers)`` coroutine
+                that enters the transport and an initialized ``ClientSession`` into
+                the exit stack and returns the session.
+            max_size (int): Maximum number of pooled sessions.
+            idle_timeout (float): Seconds after which an unused session is closed.
+            health_check_interval (float): Seconds between health checks.
+        """
+        self.server_name = server_name
+        self.open_session = open_session
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.entries = {}
+        self._lock = asyncio.Lock()
+        self._janitor_task = None
+        self._closing_tasks = set()
+
+    def get_key(self, headers):
+        headers_str = json.dumps(headers or {}, sort_keys=True)
+        return (self.server_name, hashlib.md5(headers_str.encode()).hexdigest())
+
+    async def _get_entry(self, headers):
+        key = self.get_key(headers)
+        async with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry.ready.is_set() and not entry.is_alive:
+                del self.entries[key]
+                entry = None
+            if entry is None:
+                if len(self.entries) >= self.max_size and not self._evict_idle():
+                    return None
+                entry = _PooledSession(key, self.open_session, headers)
+                self.entries[key] = entry
+            if self._janitor_task is None or self._janitor_task.done():
+                self._janitor_task = asyncio.create_task(self._run_janitor())
+        try:
+            await entry.start()
+        except Exception:
+            self.entries.pop(key, None)
+            raise
+        return entry
+
+    def _evict_idle(self):
+        idle = [entry for entry in self.entries.values() if not entry.in_use]
+        if not idle:
+            return False
+        entry = min(idle, key=lambda e: e.last_used)
+        del self.entries[entry.key]
+        task = asyncio.create_task(entry.close())
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+        return True
+
+    async def _discard(self, entry):
+        if self.entries.get(entry.key) is entry:
+            del self.entries[entry.key]
+        await entry.close()
+
+    @asynccontextmanager
+    async def session(self, headers=None):
+        """Borrow the warm session for *headers*, opening it if needed."""
+        entry = await self._get_entry(headers)
+        if entry is None:
+            logger.debug(f"MCP session pool of {self.server_name} is full")
+            async with AsyncExitStack() as stack:
+                yield await self.open_session(stack, headers)
+            return
+        entry.in_use += 1
+        try:
+            yield entry.session
+        except _CONNECTION_ERRORS:
+            await self._discard(entry)
+            raise
+        except Exception:
+            if not entry.is_alive:
+                await self._discard(entry)
+            raise
+        finally:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+
+    async def call_tool(self, tool_name, arguments, headers=None):
+        """Call a tool on a pooled session, reconnecting once if it was lost."""
+        try:
+            async with self.session(headers) as session:
+                return await session.call_tool(tool_name, arguments)
+        except _CONNECTION_ERRORS as e:
+            logger.warning(f"Reconnecting to MCP server {self.server_name}: {e}")
+            async with self.session(headers) as session:
+                return await session.call_tool(tool_name, arguments)
+
+    async def list_tools(self, headers=None):
+        async with self.session(headers) as session:
+            return await session.list_tools()
+
+    async def _check(self, entry):
+        try:
+            await asyncio.wait_for(entry.session.send_ping(), timeout=10)
+            entry.last_checked = time.monotonic()
+        except Exception as e:
+            logger.warning(f"Health check of MCP session {entry.key} failed: {e}")
+            await self._discard(entry)
+
+    async def _run_janitor(self):
+        while self.entries:
+            await asyncio.sleep(self.health_check_interval)
+            now = time.monotonic()
+            checks = []
+            for entry in list(self.entries.values()):
+                if entry.in_use or not entry.ready.is_set():
+                    continue
+                if not entry.is_alive or now - entry.last_used >= self.idle_timeout:
+                    checks.append(self._discard(entry))
+                elif (
+                    now - max(entry.last_used, entry.last_checked)
+                    >= self.health_check_interval
+                ):
+                    checks.append(self._check(entry))
+            await asyncio.gather(*checks, return_exceptions=True)
+
+    def get_stats(self):
+        return {
+            "size": len(self.entries),
+            "in_use": sum(entry.in_use for entry in self.entries.values()),
+        }
+
+    async def close(self):
+        """Close every pooled session and stop the janitor."""
+        if self._janitor_task is not None:
+            self._janitor_task.cancel()
+            self._janitor_task = None
+        entries = list(self.entries.values())
+        self.entries.clear()
+        await asyncio.gather(
+            *[entry.close() for entry in entries], return_exceptions=True
+        )
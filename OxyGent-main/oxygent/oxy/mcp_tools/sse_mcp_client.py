@@ -31,52 +31,47 @@ class SSEMCPClient(BaseMCPClient):
         default_factory=list, description="Client-side MCP middlewares"
     )
 
-    async def init(self, is_fetch_tools=True) -> None:
+    async def _open_session(self, exit_stack, headers) -> ClientSession:
+        read, write = await exit_stack.enter_async_context(
+            sse_client(build_url(self.sse_url), headers=headers)
+        )
+        session = await exit_stack.enter_async_context(ClientSession(read, write))
+        # middlewares(optional)
+        for mw in self.middlewares:
+            if hasattr(session, "add_middleware"):
+                session.add_middleware(mw)
+            else:
+                logger.warning(
+                    "Current MCP client does not expose add_middleware(); "
+                    "middleware %s ignored",
+                    mw,
+                )
+        await session.initialize()
+        return session
+
+    def get_manifest_identity(self) -> dict:
+        return {"url": str(self.sse_url)}
+
+    async def connect(self, is_fetch_tools=True) -> None:
         """Initialize the SSE connection to the MCP server.
 
         Establishes a Server-Sent Events connection to the MCP server, creates a client
         session, initializes the MCP protocol, and discovers available tools from the
-        server.
+        server. Without keep-alive, the tools are listed on a pooled session that later
+        calls with the same headers reuse.
         """
         try:
             if not self.is_dynamic_headers and self.is_keep_alive:
                 # header
-                sse_transport = await self._exit_stack.enter_async_context(
-                    sse_client(build_url(self.sse_url), headers=self.headers)
+                self._session = await self._open_session(
+                    self._exit_stack, self.headers
                 )
-                read, write = sse_transport
-                self._session = await self._exit_stack.enter_async_context(
-                    ClientSession(read, write)
-                )
-                # middlewares(optional)
-                for mw in self.middlewares:
-                    if hasattr(self._session, "add_middleware"):
-                        self._session.add_middleware(mw)
-                    else:
-                        logger.warning(
-                            "Current MCP client does not expose add_middleware(); "
-                            "middleware %s ignored",
-                            mw,
-                        )
-
-                await self._session.initialize()
                 if is_fetch_tools:
                     await self.list_tools()
             else:
-                async with sse_client(
-                    build_url(self.sse_url), headers=self.headers
-                ) as streams:
-                    async with ClientSession(*streams) as session:
-                        await session.initialize()
-                        tools_response = await session.list_tools()
-                        self.add_tools(tools_response)
+                tools_response = await self._session_pool.list_tools(self.headers)
+                self.add_tools(tools_response)
         except Exception as e:
             logger.error(f"Error initializing server {self.name}: {e}")
             await self.cleanup()
             raise Exception(f"Server {self.name} error")
-
-    async def call_tool(self, tool_name, arguments, headers=None):
-        async with sse_client(build_url(self.sse_url), headers=headers) as streams:
-            async with ClientSession(*streams) as session:
-                await session.initialize()
-                return await session.call_tool(tool_name, arguments)
@@ -6,9 +6,11 @@ communication, allowing MCP servers to run as separate processes that communicat
 through stdin/stdout pipes.
 """
 
+import asyncio
 import logging
 import os
 import shutil
+import time
 from typing import Any
 
 from mcp import ClientSession, StdioServerParameters
@@ -16,6 +18,8 @@ from mcp.client.stdio import stdio_client
 from pydantic import Field
 
 from .base_mcp_client import BaseMCPClient
+from .manifest_cache import get_file_version
+from .session_pool import _CONNECTION_ERRORS, _PooledSession
 
 logger = logging.getLogger(__name__)
 
@@ -27,11 +31,26 @@ class StdioMCPClient(BaseMCPClient):
     It spawns and manages external processes (like Node.js scripts) that act
     as MCP servers, communicating through standard input/output streams.
 
+    With ``pool_size`` > 1, that many server processes are started and keep-alive
+    calls go to the worker with the fewest calls in flight. Workers whose process
+    exits are restarted, and tools are listed from the first worker only.
+
     Attributes:
         params: Configuration parameters including command, arguments, and environment variables.
+        pool_size: Number of server processes.
     """
 
     params: dict[str, Any] = Field(default_factory=dict)
+    pool_size: int = Field(1, description="Number of server processes")
+    worker_restart_delay: float = Field(
+        5.0, description="Minimum seconds between restarts of the same worker"
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._workers: list = []
+        self._worker_start_times: dict = {}
+        self._worker_tasks: set = set()
 
     async def _ensure_directories_exist(self, args: list[str]) -> None:
         """Ensure required directories exist before starting MCP server."""
@@ -49,7 +68,17 @@ class StdioMCPClient(BaseMCPClient):
             if not os.path.exists(mcp_tool_file):
                 raise FileNotFoundError(f"{mcp_tool_file} does not exist.")
 
-    async def init(self, is_fetch_tools=True) -> None:
+    def get_manifest_identity(self) -> dict:
+        args = self.params.get("args", [])
+        return {
+            "command": self.params.get("command"),
+            "args": args,
+            "env": self.params.get("env"),
+            # Server scripts among the args, so that code changes refresh the cache
+            "versions": [get_file_version(arg) for arg in args],
+        }
+
+    async def connect(self, is_fetch_tools=True) -> None:
         """Initialize the stdio connection to the MCP server process.
 
         Spawns an external process (such as a Node.js script) that acts as an MCP server,
@@ -64,15 +93,12 @@ class StdioMCPClient(BaseMCPClient):
         """
 
         try:
-            server_params = await self.get_server_params()
-            stdio_transport = await self._exit_stack.enter_async_context(
-                stdio_client(server_params)
-            )
-            read, write = stdio_transport
-            self._session = await self._exit_stack.enter_async_context(
-                ClientSession(read, write)
-            )
-            await self._session.initialize()
+            if self.pool_size > 1:
+                self._workers = [self._new_worker(i) for i in range(self.pool_size)]
+                await asyncio.gather(*[worker.start() for worker in self._workers])
+                self._session = self._workers[0].session
+            else:
+                self._session = await self._open_session(self._exit_stack, None)
             if is_fetch_tools:
                 await self.list_tools()
         except FileNotFoundError as e:
@@ -85,12 +111,78 @@ class StdioMCPClient(BaseMCPClient):
             await self.cleanup()
             raise Exception(f"Server {self.name} error")
 
-    async def call_tool(self, tool_name, arguments, headers=None):
+    def _new_worker(self, index):
+        self._worker_start_times[index] = time.monotonic()
+        return _PooledSession((self.name, index), self._open_session, None)
+
+    async def _start_worker(self, index, worker):
+        try:
+            await worker.start()
+            logger.info(f"Restarted worker {index} of MCP server {self.name}")
+        except Exception as e:
+            logger.error(f"Failed to restart worker {index} of {self.name}: {e}")
+
+    async def _get_worker(self):
+        """Return the live worker with the fewest calls in flight.
+
+        Workers whose process has exited are restarted in the background, at most
+        once per ``worker_restart_delay`` seconds each.
+        """
+        now = time.monotonic()
+        for i, worker in enumerate(self._workers):
+            if (
+                worker.ready.is_set()
+                and not worker.is_alive
+                and now - self._worker_start_times[i] >= self.worker_restart_delay
+            ):
+                logger.warning(f"Worker {i} of MCP server {self.name} exited")
+                self._workers[i] = self._new_worker(i)
+                task = asyncio.create_task(self._start_worker(i, self._workers[i]))
+                self._worker_tasks.add(task)
+                task.add_done_callback(self._worker_tasks.discard)
+        alive = [w for w in self._workers if w.ready.is_set() and w.is_alive]
+        if alive:
+            return min(alive, key=lambda w: w.in_use)
+        # Every worker is down or starting, wait for the first one
+        await self._workers[0].start()
+        return self._workers[0]
+
+    async def call_keep_alive_tool(self, tool_name, arguments):
+        if self.pool_size <= 1:
+            return await super().call_keep_alive_tool(tool_name, arguments)
+        if not self._workers:
+            raise RuntimeError(f"Server {self.name} not initialized")
+
+        for attempt in range(2):
+            worker = await self._get_worker()
+            worker.in_use += 1
+            try:
+                return await worker.session.call_tool(tool_name, arguments)
+            except _CONNECTION_ERRORS as e:
+                if attempt:
+                    raise
+                logger.warning(f"Worker {worker.key} of {self.name} failed: {e}")
+                await worker.close()
+            finally:
+                worker.in_use -= 1
+
+    async def cleanup(self) -> None:
+        workers, self._workers = self._workers, []
+        await asyncio.gather(
+            *[worker.close() for worker in workers], return_exceptions=True
+        )
+        await super().cleanup()
+
+    async def _open_session(self, exit_stack, headers) -> ClientSession:
         server_params = await self.get_server_params()
-        async with stdio_client(server_params) as streams:
-            async with ClientSession(*streams) as session:
-                await session.initialize()
-                return await session.call_tool(tool_name, arguments)
+        read, write = await exit_stack.enter_async_context(stdio_client(server_params))
+        session = await exit_stack.enter_async_context(ClientSession(read, write))
+        await session.initialize()
+        return session
+
+    async def call_tool(self, tool_name, arguments, headers=None):
+        """Call a tool on a warm server process; headers do not apply to stdio."""
+        return await self._session_pool.call_tool(tool_name, arguments)
 
     async def get_server_params(self):
         command = (
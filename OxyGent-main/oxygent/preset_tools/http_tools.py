@@ -1,8 +1,8 @@
 import json
 from typing import Optional, Dict, Any
 from pydantic import Field
-import httpx
 from oxygent.oxy import FunctionHub
+from oxygent.utils import http_client
 import asyncio
 
 http_tools = FunctionHub(name="http_tools")
@@ -11,7 +11,7 @@ http_tools = FunctionHub(name="http_tools")
 @http_tools.tool(
     description="Make a GET request to a specified URL with optional headers and parameters"
 )
-def http_get(
+async def http_get(
         url: str,
         headers: Optional[Dict[str, str]] = None,
         params: Optional[Dict[str, Any]] = None,
@@ -20,15 +20,14 @@ def http_get(
     发送HTTP GET请求
     """
     try:
-        # 使用同步客户端
-        with httpx.Client() as client:
-            response = client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            return json.dumps({
-                "status_code": response.status_code,
-                "headers": dict(response.headers),
-                "content": response.text
-            }, ensure_ascii=False)
+        # 使用共享连接池与HTTP缓存
+        response = await http_client.request("GET", url, params=params, headers=headers)
+        response.raise_for_status()
+        return json.dumps({
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "content": response.text
+        }, ensure_ascii=False)
     except Exception as e:
         return json.dumps({"error": str(e)}, ensure_ascii=False)
 
@@ -36,7 +35,7 @@ def http_get(
 @http_tools.tool(
     description="Make a POST request to a specified URL with optional headers and JSON data"
 )
-def http_post(
+async def http_post(
         url: str,
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
@@ -51,15 +50,14 @@ def http_post(
         if "Content-Type" not in headers:
             headers["Content-Type"] = "application/json"
 
-        # 使用同步客户端
-        with httpx.Client() as client:
-            response = client.post(url, json=data, headers=headers)
-            response.raise_for_status()
-            return json.dumps({
-                "status_code": response.status_code,
-                "headers": dict(response.headers),
-                "content": response.text
-            }, ensure_ascii=False)
+        # 使用共享连接池
+        response = await http_client.request("POST", url, json_data=data, headers=headers)
+        response.raise_for_status()
+        return json.dumps({
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "content": response.text
+        }, ensure_ascii=False)
     except Exception as e:
         return json.dumps({"error": str(e)}, ensure_ascii=False)
 
@@ -2,38 +2,37 @@ import logging
 from typing import Optional
 
 from oxygent.oxy import FunctionHub
+from oxygent.utils.python_sandbox import get_sandbox_pool
 
 logger = logging.getLogger(__name__)
 python_tools = FunctionHub(name="python_tools")
 
 
 @python_tools.tool(
-    description="Runs Python code in the current environment."
+    description="Runs Python code in an isolated Python process and returns its printed output."
 )
-def run_python_code(
+async def run_python_code(
     code: str,
     variable_to_return: Optional[str] = None,
     safe_globals: Optional[dict] = None,
     safe_locals: Optional[dict] = None
 ) -> str:
-    try:
-        logger.debug(f"Running code:\n\n{code}\n\n")
-        if not safe_globals:
-            safe_globals = globals()
-        if not safe_locals:
-            safe_locals = locals()
-
-        exec(code, safe_globals, safe_locals)
-
-        if variable_to_return:
-            variable_value = safe_locals.get(variable_to_return)
-            if variable_value is None:
-                return f"Variable {variable_to_return} not found"
-            logger.debug(
-                f"Variable {variable_to_return} value: {variable_value}")
-            return str(variable_value)
+    logger.debug(f"Running code:\n\n{code}\n\n")
+    # Warm worker processes shared by every call, started on the first one
+    result = await get_sandbox_pool().run(
+        code, variable_to_return, safe_globals, safe_locals
+    )
+    if result["error"]:
+        logger.error(f"Error running python code: {result['error']}")
+        output = f"Error running python code: {result['error']}"
+    elif variable_to_return:
+        if result["value"] is None:
+            output = f"Variable {variable_to_return} not found"
         else:
-            return "successfully run python code"
-    except Exception as e:
-        logger.error(f"Error running python code: {e}")
-        return f"Error running python code: {e}"
+            logger.debug(f"Variable {variable_to_return} value: {result['value']}")
+            output = result["value"]
+    else:
+        output = "successfully run python code"
+    if result["stdout"]:
+        output = f"{result['stdout'].rstrip()}\n{output}"
+    return output
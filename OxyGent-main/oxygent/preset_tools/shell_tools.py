@@ -1,37 +1,166 @@
+import asyncio
 import logging
-import subprocess
+import os
+import signal
+import sys
+from collections import deque
 from typing import List, Optional
 
+from oxygent.config import Config
 from oxygent.oxy import FunctionHub
+from oxygent.schemas import OxyRequest
 from pydantic import Field
 
 logger = logging.getLogger(__name__)
 shell_tools = FunctionHub(name="shell_tools")
 
+# Caps the shell commands running at the same time across all agents
+_semaphore = None
+
+
+def _get_semaphore():
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(Config.get_shell_max_concurrency())
+    return _semaphore
+
+
+class _HeadTailBuffer:
+    """Keeps the first ``head`` and the last ``tail`` lines of an output."""
+
+    def __init__(self, head, tail):
+        self.head_size = head
+        self.head = []
+        self.tail = deque(maxlen=max(tail, 0))
+        self.n_lines = 0
+
+    def append(self, line):
+        self.n_lines += 1
+        if len(self.head) < self.head_size:
+            self.head.append(line)
+        else:
+            self.tail.append(line)
+
+    def getvalue(self):
+        n_omitted = self.n_lines - len(self.head) - len(self.tail)
+        lines = list(self.head)
+        if n_omitted > 0:
+            lines.append(f"... [{n_omitted} lines omitted] ...")
+        lines.extend(self.tail)
+        return "\n".join(lines)
+
+
+def _get_timeout(oxy_request):
+    """Return the shell timeout, cut to end before the timeout of the tool.
+
+    Otherwise the tool timeout cancels the command first and its partial output is
+    lost.
+    """
+    timeout = Config.get_shell_timeout()
+    if oxy_request.has_oxy(oxy_request.callee):
+        tool_timeout = oxy_request.get_oxy(oxy_request.callee).timeout
+        timeout = min(timeout, max(tool_timeout - 1, tool_timeout / 2))
+    return timeout
+
+
+def _kill_process_group(process):
+    if process.returncode is not None:
+        return
+    try:
+        if sys.platform == "win32":
+            process.kill()
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+async def _read_lines(stream, buffer, oxy_request=None):
+    max_line_chars = Config.get_shell_max_line_chars()
+    while True:
+        try:
+            line = await stream.readline()
+        except ValueError:
+            # The line overran the stream limit and was dropped by the reader
+            line = b"...[line too long]\n"
+        if not line:
+            return
+        line = line.decode("utf8", errors="replace").rstrip("\n")
+        if len(line) > max_line_chars:
+            line = line[:max_line_chars] + "...[line truncated]"
+        buffer.append(line)
+        if oxy_request is not None:
+            await oxy_request.send_message(
+                {
+                    "type": "tool_stream",
+                    "content": {
+                        "node_id": oxy_request.node_id,
+                        "callee": oxy_request.callee,
+                        "delta": line + "\n",
+                    },
+                    "_is_stored": False,
+                }
+            )
+
 
 @shell_tools.tool(
     description="Run a shell command and return the output or error."
 )
-def run_shell_command(
+async def run_shell_command(
+    oxy_request: OxyRequest,
     args: List[str] = Field(description="command arguments"),
     tail: int = 10,
     base_dir: Optional[str] = None
 ) -> str:
-    """Runs a shell command and returns the output or error."""
+    """Runs a shell command and returns the output or error.
 
-    try:
-        logger.info(f"Running shell command: {args}")
-        result = subprocess.run(
-            args,
-            capture_output=True,
-            encoding="utf8",
-            shell=True,
-            text=True,
-            cwd=base_dir
-        )
-        if result.returncode != 0:
-            return f"Error: {result.stderr}"
-        return "\n".join(result.stdout.split("\n")[-tail:])
-    except Exception as e:
-        logger.warning(f"Failed to run shell command: {e}")
-        return f"Error: {e}"
+    Output lines are streamed to the frontend as they are produced, and only the first
+    ``Config.get_shell_head_lines()`` and the last ``tail`` lines are kept. The whole
+    process group is killed after ``Config.get_shell_timeout()`` seconds, or shortly
+    before the timeout of the tool if that comes first.
+    """
+    # Elements are joined as written, so an element may hold several shell words
+    command = " ".join(args)
+    timeout = _get_timeout(oxy_request)
+    async with _get_semaphore():
+        try:
+            logger.info(f"Running shell command: {args}")
+            process = await asyncio.create_subprocess_shell(
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=base_dir,
+                start_new_session=sys.platform != "win32",
+            )
+        except Exception as e:
+            logger.warning(f"Failed to run shell command: {e}")
+            return f"Error: {e}"
+
+        stdout = _HeadTailBuffer(Config.get_shell_head_lines(), tail)
+        stderr = _HeadTailBuffer(Config.get_shell_head_lines(), tail)
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    _read_lines(
+                        process.stdout,
+                        stdout,
+                        oxy_request if Config.get_shell_is_stream() else None,
+                    ),
+                    _read_lines(process.stderr, stderr),
+                    process.wait(),
+                ),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            _kill_process_group(process)
+            await process.wait()
+            return (
+                f"Error: command timed out after {timeout} seconds\n"
+                f"{stdout.getvalue()}\n{stderr.getvalue()}"
+            ).rstrip()
+        except BaseException:
+            _kill_process_group(process)
+            raise
+        if process.returncode != 0:
+            return f"Error: {stderr.getvalue()}"
+        return stdout.getvalue()
@@ -1,12 +1,16 @@
+import asyncio
 import json
 import logging
 import os
-from typing import Optional
+import re
+from typing import Any, Optional
 
+from oxygent.config import Config
 from oxygent.oxy import FunctionHub
+from oxygent.utils.lru_cache import LRUCache
 
 try:
-    from sqlalchemy import Engine, create_engine
+    from sqlalchemy import create_engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, sessionmaker
     from sqlalchemy.sql.expression import text
@@ -15,10 +19,80 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Statements whose results may be cached; anything else clears the caches
+_READ_ONLY_PATTERN = re.compile(
+    r"^\s*(select|show|describe|desc|explain|with|pragma)\b", re.IGNORECASE
+)
+# A keyword followed by "(" is a function call, such as REPLACE(name, 'a', 'b')
+_WRITE_PATTERN = re.compile(
+    r"\b(insert|update|delete|merge|replace|create|alter|drop|truncate|grant|revoke|"
+    r"into)\b(?!\s*\()",
+    re.IGNORECASE,
+)
+# String literals, quoted identifiers and comments, which may contain any keyword
+_LITERAL_PATTERN = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|`[^`]*`|--[^\n]*|/\*.*?\*/", re.DOTALL
+)
+
+
+def is_read_only(sql):
+    sql = _LITERAL_PATTERN.sub(" ", sql)
+    return bool(_READ_ONLY_PATTERN.match(sql)) and not _WRITE_PATTERN.search(sql)
+
+
+def encode_result(columns, rows, is_truncated=False):
+    """Encode rows compactly as a column header plus positional rows."""
+    result = {
+        "columns": list(columns),
+        "rows": rows,
+        "row_count": len(rows),
+    }
+    if is_truncated:
+        result["truncated"] = True
+    return json.dumps(result, ensure_ascii=False, default=str)
+
+
+class _RowCollector(object):
+    """Collects rows until the row or byte cap is reached."""
+
+    def __init__(self, max_rows, max_bytes):
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.rows = []
+        self.n_bytes = 0
+        self.is_truncated = False
+
+    def add(self, partition):
+        """Add a partition of rows, returning False once a cap is reached."""
+        for row in partition:
+            row = list(row)
+            n_bytes = len(json.dumps(row, ensure_ascii=False, default=str))
+            if (
+                len(self.rows) >= self.max_rows
+                or self.n_bytes + n_bytes > self.max_bytes
+            ):
+                self.is_truncated = True
+                return False
+            self.rows.append(row)
+            self.n_bytes += n_bytes
+        return True
+
 
 class SQLFunctionHub(FunctionHub):
-    db_engine: Optional[Engine] = None
+    """FunctionHub of SQL tools over the database of ``SQL_TOOLS_DB_URL``.
+
+    With ``Config.get_sql_is_async()`` the URL must name an async driver (e.g.
+    ``mysql+aiomysql`` or ``postgresql+asyncpg``) and an AsyncEngine is used;
+    otherwise the blocking engine runs in the thread pool of the MAS. Query results
+    are read through server-side cursors and capped by ``max_rows`` and
+    ``max_bytes``. Table lists, table schemas and read-only queries are cached for
+    ``cache_ttl`` seconds, and any other statement clears the caches.
+    """
+
+    db_engine: Optional[Any] = None
     Session: Optional[sessionmaker[Session]] = None
+    is_async: bool = False
+    query_cache: Optional[Any] = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -33,9 +107,118 @@ class SQLFunctionHub(FunctionHub):
         if not db_url:
             raise ValueError("Could not find the db_url from environ")
 
-        engine = create_engine(db_url)
-        self.db_engine = engine
-        self.Session = sessionmaker(bind=engine)
+        engine_kwargs = {"pool_pre_ping": True}
+        if not db_url.startswith("sqlite"):
+            engine_kwargs["pool_size"] = Config.get_sql_pool_size()
+            engine_kwargs["max_overflow"] = Config.get_sql_max_overflow()
+            engine_kwargs["pool_recycle"] = Config.get_sql_pool_recycle()
+        self.is_async = Config.get_sql_is_async()
+        if self.is_async:
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            self.db_engine = create_async_engine(db_url, **engine_kwargs)
+        else:
+            engine = create_engine(db_url, **engine_kwargs)
+            self.db_engine = engine
+            self.Session = sessionmaker(bind=engine)
+        self.query_cache = LRUCache(
+            Config.get_sql_cache_size(), Config.get_sql_cache_ttl()
+        )
+
+    async def _run_sync(self, func):
+        if self.mas is not None:
+            return await self.mas.run_in_executor("thread", func)
+        return await asyncio.to_thread(func)
+
+    async def _inspect(self, func):
+        """Run ``func(inspector)`` on a pooled connection."""
+        if self.is_async:
+            async with self.db_engine.connect() as conn:
+                return await conn.run_sync(lambda sync_conn: func(inspect(sync_conn)))
+
+        def run():
+            with self.db_engine.connect() as conn:
+                return func(inspect(conn))
+
+        return await self._run_sync(run)
+
+    async def get_cached(self, key, func):
+        result = self.query_cache.get(key)
+        if result is None:
+            result = await func()
+            self.query_cache.set(key, result)
+        return result
+
+    async def get_table_names(self):
+        return await self.get_cached(
+            ("list_tables",),
+            lambda: self._inspect(lambda inspector: inspector.get_table_names()),
+        )
+
+    async def get_columns(self, table_name):
+        return await self.get_cached(
+            ("describe_tables", table_name),
+            lambda: self._inspect(lambda inspector: inspector.get_columns(table_name)),
+        )
+
+    async def _query(self, sql, max_rows):
+        """Stream a read-only query, stopping at the row and byte caps."""
+        collector = _RowCollector(max_rows, Config.get_sql_max_bytes())
+        partition_size = min(max_rows, 1000)
+        if self.is_async:
+            async with self.db_engine.connect() as conn:
+                result = await conn.stream(text(sql))
+                columns = list(result.keys())
+                async for partition in result.partitions(partition_size):
+                    if not collector.add(partition):
+                        break
+                await result.close()
+        else:
+
+            def run():
+                with self.db_engine.connect() as conn:
+                    result = conn.execution_options(
+                        stream_results=True, max_row_buffer=partition_size
+                    ).execute(text(sql))
+                    columns = list(result.keys())
+                    for partition in result.partitions(partition_size):
+                        if not collector.add(partition):
+                            break
+                    result.close()
+                    return columns
+
+            columns = await self._run_sync(run)
+        return encode_result(columns, collector.rows, collector.is_truncated)
+
+    async def _execute_write(self, sql, max_rows):
+        def collect(result):
+            if not result.returns_rows:
+                return json.dumps({"row_count": result.rowcount})
+            collector = _RowCollector(max_rows, Config.get_sql_max_bytes())
+            collector.add(result.fetchmany(max_rows + 1))
+            return encode_result(result.keys(), collector.rows, collector.is_truncated)
+
+        self.query_cache.clear()
+        if self.is_async:
+            async with self.db_engine.begin() as conn:
+                return await conn.run_sync(
+                    lambda sync_conn: collect(sync_conn.execute(text(sql)))
+                )
+
+        def run():
+            with self.db_engine.begin() as conn:
+                return collect(conn.execute(text(sql)))
+
+        return await self._run_sync(run)
+
+    async def execute(self, sql, limit=None):
+        """Run a statement, returning its rows in the columnar encoding."""
+        max_rows = min(limit or Config.get_sql_max_rows(), Config.get_sql_max_rows())
+        if not is_read_only(sql):
+            return await self._execute_write(sql, max_rows)
+        return await self.get_cached(
+            ("run_sql", sql, max_rows), lambda: self._query(sql, max_rows)
+        )
 
 
 sql_tools = SQLFunctionHub(name="sql_tools")
@@ -44,10 +227,9 @@ sql_tools = SQLFunctionHub(name="sql_tools")
 @sql_tools.tool(
     description="Use this function to get a list of table names in the database"
 )
-def list_tables() -> str:
+async def list_tables() -> str:
     try:
-        inspector = inspect(sql_tools.db_engine)
-        table_names = inspector.get_table_names()
+        table_names = await sql_tools.get_table_names()
         logger.debug(f"get the tables: {table_names}")
         return json.dumps(table_names)
     except Exception as e:
@@ -57,22 +239,14 @@ def list_tables() -> str:
 
 
 @sql_tools.tool(
-    description="run a sql query and return the result"
+    description="run a sql query and return the result as column names and rows; "
+    "large results are truncated"
 )
-def run_sql(sql: str, limit: Optional[int] = None) -> str:
+async def run_sql(sql: str, limit: Optional[int] = None) -> str:
     logger.debug(f"Running sql |\n{sql}")
 
     try:
-        with sql_tools.Session() as sess:
-            result = sess.execute(text(sql))
-            if limit:
-                rows = result.fetchmany(limit)
-            else:
-                rows = result.fetchall()
-            return json.dumps(
-                [row._asdict() for row in rows],
-                ensure_ascii=False
-            )
+        return await sql_tools.execute(sql, limit)
     except Exception as e:
         error_msg = f"Error running query: {e}"
         logger.error(error_msg)
@@ -82,11 +256,10 @@ def run_sql(sql: str, limit: Optional[int] = None) -> str:
 @sql_tools.tool(
     description="describe the given table"
 )
-def describe_tables(table_name: str) -> str:
+async def describe_tables(table_name: str) -> str:
     try:
         logger.debug(f"Describing table: {table_name}")
-        inspector = inspect(sql_tools.db_engine)
-        table_schema = inspector.get_columns(table_name)
+        table_schema = await sql_tools.get_columns(table_name)
         result = [
             {"name": column["name"], "type": str(column["type"]),
              "nullable": column["nullable"]}
@@ -1,14 +1,53 @@
+import os
 import re
 import json
-import datetime
-import requests
+import time
+import asyncio
+import logging
+import httpx
 from pydantic import BaseModel, Field
 from typing import Dict, List, Optional
 from datetime import datetime, timezone, timedelta
+from oxygent.config import Config
 from oxygent.oxy import FunctionHub
+from oxygent.utils.http_client import create_session_client
+from oxygent.utils.lru_cache import LRUCache
 
+logger = logging.getLogger(__name__)
 train_ticket_tools = FunctionHub(name="train_ticket_tools")
 
+STATION_TTL = 7 * 24 * 3600  # 车站数据本地缓存的刷新周期（秒）
+COOKIE_TTL = 600  # 12306 cookie 的复用时长（秒）
+TICKET_CACHE_TTL = 60  # 车票查询结果的缓存时长（秒）
+
+_client = None
+_cookie_expires_at = 0.0
+_cookie_lock = asyncio.Lock()
+_stations = None
+_stations_loaded_at = 0.0
+_stations_lock = asyncio.Lock()
+_ticket_cache = LRUCache(256, TICKET_CACHE_TTL)
+
+
+def _get_client():
+    """返回带cookie的连接池客户端，首次使用时创建
+
+    12306 的会话 cookie 保存在这个客户端独立的 cookie jar 中，不与共享客户端混用；
+    MAS 退出时由 close_http_client 关闭
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_session_client(
+            timeout=20.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+        )
+    return _client
+
+
+def _get_stations_path():
+    return os.path.join(Config.get_cache_save_dir(), "train_ticket", "stations.json")
+
 
 class StationData(BaseModel):
     """车站息模型"""
@@ -55,11 +94,11 @@ class Ticket(BaseModel):
 
 @train_ticket_tools.tool(description="通过中文城市名查询代表该城市的 `station_code`。"
                                      "此接口主要用于在用户提供**城市名**作为出发地或到达地时，为接口准备`station_code` 参数。")
-def get_stations_of_city(
+async def get_stations_of_city(
         city_names: str = Field(..., description='要查询的城市，比如"西安"。若要查询多个城市，请用|分割，比如"北京|西安')
 ) -> Dict[str, List[StationData]]:
 
-    stations = get_stations()
+    stations = await get_stations()
     # 将城市名按|分割成列表
     city_list = city_names.split('|')
     # 创建结果字典，键为城市名，值为该城市的车站列表
@@ -78,7 +117,7 @@ def get_stations_of_city(
 
 
 @train_ticket_tools.tool(description="查询车票信息")
-def get_tickets(
+async def get_tickets(
         train_date: str = Field(..., description='查询日期，格式为 `yyyy-MM-dd`。如果用户提供的是相对日期（如“明天”），'
                                                  '请务必先调用 `get_current_date` 接口获取当前日期，并计算出目标日期。'),
         from_station_code: str = Field(..., description="出发地的 `station_code`，必须是通过 `get_stations_of_city` 接口"
@@ -88,21 +127,31 @@ def get_tickets(
         purpose_codes: str = Field(default="ADULT", description="乘客类型")
 ) -> List[Ticket]:
 
-    url = (f"https://kyfw.12306.cn/otn/leftTicket/queryG?"
-           f"leftTicketDTO.train_date={train_date}"
-           f"&leftTicketDTO.from_station={from_station_code}"
-           f"&leftTicketDTO.to_station={to_station_code}"
-           f"&purpose_codes={purpose_codes}")
-    # 构造请求Header
-    raw_cookie = get_cookie()
-    cookie = format_cookies(raw_cookie)
-    headers = {'Cookie': cookie}
-    # 查询车票信息
-    res = requests.get(url, headers=headers).text
-    res_json = json.loads(res)
-    result = res_json['data']['result']
+    cache_key = (train_date, from_station_code, to_station_code, purpose_codes)
+    tickets = _ticket_cache.get(cache_key)
+    if tickets is not None:
+        return tickets
+
+    url = "https://kyfw.12306.cn/otn/leftTicket/queryG"
+    params = {
+        "leftTicketDTO.train_date": train_date,
+        "leftTicketDTO.from_station": from_station_code,
+        "leftTicketDTO.to_station": to_station_code,
+        "purpose_codes": purpose_codes,
+    }
+    # 复用会话cookie查询车票信息，cookie失效时刷新后重试一次
+    for attempt in range(2):
+        await get_cookie(is_refresh=attempt > 0)
+        response = await _get_client().get(url, params=params)
+        try:
+            result = response.json()['data']['result']
+            break
+        except (ValueError, KeyError, TypeError):
+            if attempt:
+                raise Exception(f"[Error]: Query tickets failed. {response.text[:200]}")
     # 解析车票数据
     tickets = _parse_tickets(ticket_data=result)
+    _ticket_cache.set(cache_key, tickets)
 
     return tickets
 
@@ -118,7 +167,68 @@ def get_current_date() -> str:
     return formatted_date
 
 
-def get_stations() -> Dict[str, StationData]:
+def _load_stations_file():
+    path = _get_stations_path()
+    if not os.path.exists(path):
+        return None, 0.0
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        stations = {code: StationData(**item) for code, item in data.items()}
+        return stations, os.path.getmtime(path)
+    except Exception as error:
+        logger.warning(f"[Error]: Load station data failed. {error}")
+        return None, 0.0
+
+
+def _save_stations_file(stations):
+    path = _get_stations_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {code: station.model_dump() for code, station in stations.items()},
+            f,
+            ensure_ascii=False,
+        )
+    os.replace(tmp_path, path)
+
+
+async def get_stations() -> Dict[str, StationData]:
+    """
+    获取所有火车站数据
+
+    车站数据解析一次后保存在本地，超过 `STATION_TTL` 才重新从12306下载；
+    下载失败时沿用过期的本地数据。
+
+    Returns:
+        以车站代码为键的车站数据字典
+
+    Raises:
+        Exception: 当无法获取或解析车站数据且本地没有缓存时抛出异常
+    """
+    global _stations, _stations_loaded_at
+    async with _stations_lock:
+        if _stations is None:
+            _stations, _stations_loaded_at = _load_stations_file()
+        if _stations is not None and time.time() - _stations_loaded_at < STATION_TTL:
+            return _stations
+        try:
+            stations = await _download_stations()
+        except Exception as error:
+            if _stations is None:
+                raise
+            logger.warning(f"Using stale station data: {error}")
+            return _stations
+        try:
+            _save_stations_file(stations)
+        except Exception as error:
+            logger.warning(f"[Error]: Save station data failed. {error}")
+        _stations, _stations_loaded_at = stations, time.time()
+        return _stations
+
+
+async def _download_stations() -> Dict[str, StationData]:
     """
     从12306网站获取并解析所有火车站数据
 
@@ -130,8 +240,9 @@ def get_stations() -> Dict[str, StationData]:
     """
     # 获取网站HTML内容
     main_page_url = 'https://www.12306.cn/index/'
+    client = _get_client()
     try:
-        html = requests.get(main_page_url).text
+        html = (await client.get(main_page_url)).text
     except Exception as error:
         raise Exception(f"[Error]: Get the main page HTML failed.{error}")
 
@@ -143,7 +254,7 @@ def get_stations() -> Dict[str, StationData]:
     # 获取站名JS文件
     station_name_js_file_path = match.group(0)
     try:
-        station_name_js = requests.get(main_page_url + station_name_js_file_path).text
+        station_name_js = (await client.get(main_page_url + station_name_js_file_path)).text
     except Exception as error:
         raise Exception(f"[Error]: Get the main page HTML failed.{error}")
 
@@ -199,33 +310,29 @@ def parse_stations_data(raw_data: str) -> Dict[str, StationData]:
     return result
 
 
-def format_cookies(cookies):
+async def get_cookie(is_refresh=False):
     """
-    将cookie字典转换为字符串格式
+    从12306网站获取cookie，保存在连接池客户端的cookie jar中复用
 
     Args:
-        cookies: Cookie字典
-
-    Returns:
-        str: 格式化后的cookie字符串，如 'key1=value1; key2=value2'
-    """
-    return '; '.join([f"{key}={value}" for key, value in cookies.items()])
-
-
-def get_cookie():
-    """
-    从12306网站获取cookie
+        is_refresh: 是否忽略未过期的cookie强制刷新
 
     Returns:
         dict: Cookie字典，如果请求失败则返回None
     """
-    url = "https://kyfw.12306.cn/otn/leftTicket/init"
-    try:
-        response = requests.get(url)
-        return response.headers
-    except Exception as error:
-        print(f"[Error]: Get 12306 cookie failed. {error}")
-        return None
+    global _cookie_expires_at
+    client = _get_client()
+    async with _cookie_lock:
+        if not is_refresh and time.time() < _cookie_expires_at:
+            return dict(client.cookies)
+        url = "https://kyfw.12306.cn/otn/leftTicket/init"
+        try:
+            await client.get(url)
+        except Exception as error:
+            print(f"[Error]: Get 12306 cookie failed. {error}")
+            return None
+        _cookie_expires_at = time.time() + COOKIE_TTL
+        return dict(client.cookies)
 
 
 def _parse_tickets(ticket_data: List[str]) -> List[Ticket]:
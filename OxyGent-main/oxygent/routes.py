@@ -31,10 +31,12 @@ from fastapi.responses import RedirectResponse
 from pydantic import BaseModel
 
 from .config import Config
+from .databases.db_blob import EsBlob, LocalBlob
 from .databases.db_es import JesEs, LocalEs
 from .db_factory import DBFactory
 from .oxy_factory import OxyFactory
 from .schemas import OxyRequest, WebResponse
+from .utils.common_utils import to_json
 from .utils.data_utils import add_post_and_child_node_ids
 
 logger = logging.getLogger(__name__)
@@ -42,6 +44,30 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def get_blob_client(es_client):
+    """Return the blob store that holds the offloaded fields of node inputs."""
+    if Config.get_es_config():
+        return EsBlob(es_client)
+    return LocalBlob()
+
+
+async def resolve_node_input(es_client, node_input: str) -> dict:
+    """Parse a stored node input and load the arguments kept in the blob store.
+
+    Args:
+        es_client: The ES client of the node table.
+        node_input: The ``input`` field of a node document.
+
+    Returns:
+        dict: The node input with blob references replaced by their values.
+    """
+    node_input = json.loads(node_input)
+    if isinstance(node_input.get("arguments"), dict):
+        blob_client = get_blob_client(es_client)
+        node_input["arguments"] = await blob_client.resolve(node_input["arguments"])
+    return node_input
+
+
 # Basic route to redirect to the web interface
 @router.get("/")
 def read_root():
@@ -149,7 +175,9 @@ async def get_node_info(item_id: str):
                 node_data["next_id"] = node_ids[i + 1] if i <= len(node_ids) - 2 else ""
 
                 if "input" in node_data:
-                    node_data["input"] = json.loads(node_data["input"])
+                    node_data["input"] = await resolve_node_input(
+                        es_client, node_data["input"]
+                    )
 
                 if "prompt" in node_data["input"]["class_attr"]:
                     del node_data["input"]["class_attr"]["prompt"]
@@ -184,7 +212,18 @@ async def get_node_info(item_id: str):
 
 # Define the data model for the LLM call request
 @router.get("/view")
-async def get_task_info(item_id: str):
+async def get_task_info(item_id: str, is_resolve_blob: bool = False):
+    """Retrieve all nodes of the trace that *item_id* belongs to.
+
+    Args:
+        item_id: Either a node identifier or a trace identifier.
+        is_resolve_blob: Whether to load the node arguments kept in the blob
+            store. Off by default, since the flowchart does not need them and
+            ``/node`` resolves them for a single node on demand.
+
+    Returns:
+        dict: ``WebResponse`` containing the ordered nodes and the trace id.
+    """
     db_factory = DBFactory()
     if Config.get_es_config():
         jes_config = Config.get_es_config()
@@ -227,6 +266,10 @@ async def get_task_info(item_id: str):
             and data["_source"]["pre_node_ids"][0] == ""
         ):
             data["_source"]["pre_node_ids"] = []
+        if is_resolve_blob and "input" in data["_source"]:
+            data["_source"]["input"] = to_json(
+                await resolve_node_input(es_client, data["_source"]["input"])
+            )
         nodes.append(data["_source"])
     for index, node in enumerate(nodes):
         node["index"] = index
@@ -1,6 +1,6 @@
 from .color import Color
 from .llm import LLMResponse, LLMState
-from .memory import Memory, Message
+from .memory import Memory, Message, MessageBuffer
 from .observation import ExecResult, Observation
 from .oxy import OxyOutput, OxyRequest, OxyResponse, OxyState
 from .web import WebResponse
@@ -11,6 +11,7 @@ __all__ = [
     "LLMResponse",
     "Message",
     "Memory",
+    "MessageBuffer",
     "Observation",
     "ExecResult",
     "OxyState",
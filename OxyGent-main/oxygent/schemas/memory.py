@@ -181,3 +181,158 @@ class Memory(BaseModel):
                 messages.insert(0, self.messages[0])
             return [msg.to_dict() for msg in messages]
         return [msg.to_dict() for msg in self.messages]
+
+
+class MessageBuffer(object):
+    """Message dicts of a prompt that only grows at its end.
+
+    Agents that call the LLM once per round keep one buffer for the whole loop: the
+    system, history and query prefix is converted once, and each round only appends
+    its new turns. :meth:`to_dict_list` trims exactly like
+    :meth:`Memory.to_dict_list`, without converting messages again.
+
+    With a ``count_tokens`` callable, the tokens of each message are counted once
+    when it is added, and :meth:`to_dict_list` can also fit the prompt into a token
+    budget: the oldest history turns are dropped first, then the oldest react turns
+    (after :meth:`mark_prefix`), and the longest messages are finally shortened. A
+    react turn is an assistant message with the user or tool messages answering it,
+    so tool results are never separated from their tool calls.
+    """
+
+    def __init__(self, max_messages=50, count_tokens=None):
+        self.messages: List[dict] = []
+        self.max_messages = max_messages
+        self.count_tokens = count_tokens
+        self.token_counts: List[int] = []
+        self.prefix_size = None
+
+    def __len__(self):
+        return len(self.messages)
+
+    def _count(self, message):
+        from ..utils.token_counter import count_message_tokens
+
+        return count_message_tokens(message, self.count_tokens)
+
+    def add_message(self, message: Union[Message, dict]) -> None:
+        """Append a Message or an SDK-format message dict."""
+        if isinstance(message, Message):
+            message = message.to_dict()
+        self.messages.append(message)
+        if self.count_tokens is not None:
+            self.token_counts.append(self._count(message))
+
+    def add_dict_list(self, dict_list: List[dict]) -> None:
+        """Append dicts, keeping the system/user/assistant role and content only,
+        as :meth:`Message.dict_list_to_messages` does."""
+        for msg_dict in dict_list:
+            if msg_dict["role"] in ("system", "user", "assistant"):
+                message = {"role": msg_dict["role"]}
+                if msg_dict["content"] is not None:
+                    message["content"] = msg_dict["content"]
+                self.add_message(message)
+
+    def mark_prefix(self) -> None:
+        """Mark the messages added so far (system, history, query) as the prefix;
+        later messages are react turns."""
+        self.prefix_size = len(self.messages)
+
+    def get_token_count(self) -> int:
+        return sum(self.token_counts)
+
+    def _get_prefix_size(self):
+        return len(self.messages) if self.prefix_size is None else self.prefix_size
+
+    def get_react_messages(self) -> List[dict]:
+        return self.messages[self._get_prefix_size() :]
+
+    def replace_react_messages(self, n: int, messages: List[dict]) -> None:
+        """Replace the ``n`` oldest react messages, e.g. with a summary of them."""
+        start = self._get_prefix_size()
+        self.messages[start : start + n] = messages
+        if self.count_tokens is not None:
+            self.token_counts[start : start + n] = [self._count(m) for m in messages]
+
+    def _get_window(self, short_memory_size):
+        n_messages = len(self.messages)
+        if n_messages > short_memory_size * 2 + 2:
+            indices = list(range(n_messages - (short_memory_size * 2 + 1), n_messages))
+            # Tool results cannot open the window without their tool calls
+            while indices and self.messages[indices[0]]["role"] == "tool":
+                indices.pop(0)
+            if self.messages[0]["role"] == "system":
+                indices.insert(0, 0)
+            return indices
+        return list(range(n_messages))
+
+    def _get_droppable_turns(self, indices):
+        """Return index groups in drop order: history turns, then react turns except
+        the latest one, oldest first."""
+        prefix_size = self._get_prefix_size()
+        history = [i for i in indices if 0 < i < prefix_size - 1]
+        turns = [history[k : k + 2] for k in range(0, len(history), 2)]
+        react_turns = []
+        for i in indices:
+            if i < prefix_size:
+                continue
+            if self.messages[i]["role"] == "assistant" or not react_turns:
+                react_turns.append([])
+            react_turns[-1].append(i)
+        return turns + react_turns[:-1]
+
+    def _fit_to_budget(self, indices, max_tokens):
+        total = sum(self.token_counts[i] for i in indices)
+        if total <= max_tokens:
+            return [self.messages[i] for i in indices]
+        dropped = set()
+        for turn in self._get_droppable_turns(indices):
+            if total <= max_tokens:
+                break
+            dropped.update(turn)
+            total -= sum(self.token_counts[i] for i in turn)
+        kept = [i for i in indices if i not in dropped]
+        messages = {i: self.messages[i] for i in kept}
+        counts = {i: self.token_counts[i] for i in kept}
+        # Shorten the longest messages, keeping the system message for last
+        while total > max_tokens:
+            candidates = [
+                i
+                for i in kept
+                if isinstance(messages[i].get("content"), str) and counts[i] > 64
+            ]
+            if not candidates:
+                break
+            non_system = [i for i in candidates if messages[i]["role"] != "system"]
+            index = max(non_system or candidates, key=lambda i: counts[i])
+            excess = total - max_tokens
+            content = messages[index]["content"]
+            keep_ratio = max(counts[index] - excess - 32, 32) / counts[index]
+            keep_chars = int(len(content) * keep_ratio) // 2
+            content = (
+                content[:keep_chars]
+                + f"\n...[{len(content) - 2 * keep_chars} characters omitted]...\n"
+                + content[len(content) - keep_chars :]
+            )
+            messages[index] = {**messages[index], "content": content}
+            count = self._count(messages[index])
+            total -= counts[index] - count
+            if count >= counts[index]:
+                break
+            counts[index] = count
+        return [messages[i] for i in kept]
+
+    def to_dict_list(self, short_memory_size=None, max_tokens=None) -> List[dict]:
+        """Return a new list of the (trimmed) message dicts.
+
+        Args:
+            short_memory_size (int, optional): Message-count window, as in
+                :meth:`Memory.to_dict_list`.
+            max_tokens (int, optional): Token budget of the returned messages.
+                Requires ``count_tokens``.
+        """
+        if short_memory_size is None:
+            short_memory_size = self.max_messages // 2
+        indices = self._get_window(short_memory_size)
+        if max_tokens and self.count_tokens is not None:
+            return self._fit_to_budget(indices, max_tokens)
+        return [self.messages[i] for i in indices]
@@ -52,6 +52,9 @@ class OxyRequest(BaseModel):
         Call-specific parameters (user input, tool args, etc.).
     shared_data : dict
         Scratch space shared with descendants in the same trace.
+    memo_data : dict
+        Results of idempotent tools shared with descendants in the same trace,
+        keyed by (callee, input_md5).
     """
 
     # Static
@@ -109,6 +112,11 @@ class OxyRequest(BaseModel):
     group_data: dict = Field(
         default_factory=dict, description="public data in the scope of a session group"
     )
+    memo_data: dict = Field(
+        default_factory=dict,
+        exclude=True,
+        description="results of idempotent tools in the scope of a single request",
+    )
 
     @property
     def session_name(self) -> str:  # We use a easy method to create session name
@@ -132,6 +140,7 @@ class OxyRequest(BaseModel):
             "mas": None,
             "shared_data": dict(),
             "group_data": dict(),
+            "memo_data": dict(),
             "parallel_id": "",
             "latest_node_ids": [],
         }
@@ -148,6 +157,7 @@ class OxyRequest(BaseModel):
         new_instance.mas = self.mas
         new_instance.shared_data = self.shared_data
         new_instance.group_data = self.group_data
+        new_instance.memo_data = self.memo_data
 
         return new_instance
 
@@ -301,6 +311,10 @@ class OxyRequest(BaseModel):
             oxy_request.arguments["agent_name"] = caller_oxy.name
             oxy_request.arguments["top_k"] = caller_oxy.top_k_tools
             oxy_request.arguments["vearch_client"] = self.mas.vearch_client
+            oxy_request.arguments["lexical_index"] = self.mas.tool_lexical_index
+            oxy_request.arguments["tool_names"] = self.mas.get_retrievable_tool_names(
+                caller_oxy.name
+            )
         # Execute the oxy
         try:
             oxy_response = await asyncio.wait_for(
@@ -308,6 +322,8 @@ class OxyRequest(BaseModel):
             )
             # Process special parameters in response
             if oxy_name == "retrieve_tools":
+                if isinstance(oxy_response.output, list):
+                    oxy_response.extra["tool_names"] = oxy_response.output
                 llm_tool_desc_list = [
                     self.get_oxy(tool_name).desc_for_llm
                     for tool_name in oxy_response.output
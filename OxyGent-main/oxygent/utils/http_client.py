@@ -0,0 +1,315 @@
+"""Shared pooled HTTP client with an HTTP cache.
+
+This module provides :func:`request`, used by :class:`HttpTool` and the preset
+``http_tools``. All requests share one keep-alive ``httpx.AsyncClient``, and a
+semaphore per host caps the requests in flight to any single host.
+
+GET responses are cached according to ``Cache-Control``, ``Expires``, ``ETag`` and
+``Last-Modified``: a fresh entry is served without a request, and a stale entry with
+validators is revalidated with ``If-None-Match`` / ``If-Modified-Since``, so a
+``304 Not Modified`` answer is served from the cache. Entries are keyed by the URL
+and all request headers, which covers any ``Vary``; ``Vary: *`` responses, and
+``private`` responses to requests with credentials, are not stored. Entries live in
+an in-memory LRU and, optionally, in files under ``{cache_dir}/http_cache``.
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from ..config import Config
+from .common_utils import get_md5
+
+logger = logging.getLogger(__name__)
+
+_http_client = None
+_session_clients = set()
+_host_semaphores = {}
+_http_cache = None
+
+# Request headers that make a response specific to its caller
+_PRIVATE_REQUEST_HEADERS = ("authorization", "cookie", "proxy-authorization")
+# Request headers added by the cache itself to revalidate an entry
+_CONDITIONAL_REQUEST_HEADERS = ("if-none-match", "if-modified-since")
+
+
+def _get_http_client():
+    """Return the shared pooled client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=Config.get_http_max_connections(),
+                max_keepalive_connections=Config.get_http_max_keepalive_connections(),
+                keepalive_expiry=Config.get_http_keepalive_expiry(),
+            ),
+            follow_redirects=True,
+        )
+    return _http_client
+
+
+def create_session_client(**kwargs):
+    """Return a new ``httpx.AsyncClient`` closed by :func:`close_http_client`.
+
+    For tools that keep per-site state such as a cookie jar, which must not be mixed
+    into the shared client.
+    """
+    client = httpx.AsyncClient(**kwargs)
+    _session_clients.add(client)
+    return client
+
+
+def _get_host_semaphore(host):
+    semaphore = _host_semaphores.get(host)
+    if semaphore is None:
+        semaphore = _host_semaphores[host] = asyncio.Semaphore(
+            Config.get_http_max_connections_per_host()
+        )
+    return semaphore
+
+
+def _parse_cache_control(value):
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"')
+    return directives
+
+
+def _get_max_age(headers, now):
+    """Return the seconds a response stays fresh, or None if it must not be stored."""
+    directives = _parse_cache_control(headers.get("cache-control"))
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0
+    if "max-age" in directives:
+        try:
+            return max(int(directives["max-age"]), 0)
+        except ValueError:
+            return 0
+    if "expires" in headers:
+        try:
+            expires = parsedate_to_datetime(headers["expires"]).timestamp()
+            return max(expires - now, 0)
+        except (TypeError, ValueError):
+            return 0
+    return 0
+
+
+class HttpCache(object):
+    """In-memory LRU of cached responses with an optional disk tier."""
+
+    def __init__(self, max_size=None, max_entry_bytes=None, is_disk_cache=None):
+        self.max_size = max_size or Config.get_http_cache_size()
+        self.max_entry_bytes = (
+            max_entry_bytes or Config.get_http_max_cache_entry_bytes()
+        )
+        self.is_disk_cache = (
+            Config.get_http_is_disk_cache() if is_disk_cache is None else is_disk_cache
+        )
+        self.data_dir = os.path.join(Config.get_cache_save_dir(), "http_cache")
+        self.entries = OrderedDict()
+
+    def get_key(self, url, headers):
+        """Key a request by its URL and all its headers.
+
+        Any header may be named by the ``Vary`` of the response, so requests that
+        differ in a header never share an entry.
+        """
+        headers = {
+            name.lower(): value
+            for name, value in headers.items()
+            if name.lower() not in _CONDITIONAL_REQUEST_HEADERS
+        }
+        return get_md5(json.dumps([str(url), headers], sort_keys=True))
+
+    def _get_path(self, key):
+        return os.path.join(self.data_dir, f"{key}.json")
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            return entry
+        if not self.is_disk_cache or not os.path.exists(self._get_path(key)):
+            return None
+        try:
+            with open(self._get_path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            entry["content"] = base64.b64decode(entry["content"])
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable HTTP cache entry {key}: {e}")
+            return None
+        self._set_memory(key, entry)
+        return entry
+
+    def _set_memory(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def set(self, key, entry):
+        if len(entry["content"]) > self.max_entry_bytes:
+            return
+        self._set_memory(key, entry)
+        if self.is_disk_cache:
+            try:
+                os.makedirs(self.data_dir, exist_ok=True)
+                tmp_path = self._get_path(key) + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(
+                        {
+                            **entry,
+                            "content": base64.b64encode(entry["content"]).decode(),
+                        },
+                        f,
+                    )
+                os.replace(tmp_path, self._get_path(key))
+            except Exception as e:
+                logger.warning(f"Failed to write HTTP cache entry {key}: {e}")
+
+    def clear(self):
+        self.entries.clear()
+
+
+def _get_http_cache():
+    global _http_cache
+    if _http_cache is None:
+        _http_cache = HttpCache()
+    return _http_cache
+
+
+def _to_entry(response, now, headers):
+    """Return the cache entry of a response, or None if it must not be stored."""
+    max_age = _get_max_age(response.headers, now)
+    if max_age is None:
+        return None
+    # The entries are shared by every caller of the process
+    directives = _parse_cache_control(response.headers.get("cache-control"))
+    has_credentials = any(name.lower() in _PRIVATE_REQUEST_HEADERS for name in headers)
+    if "private" in directives and has_credentials:
+        return None
+    if response.headers.get("vary", "").strip() == "*":
+        return None
+    etag = response.headers.get("etag")
+    last_modified = response.headers.get("last-modified")
+    if not max_age and not etag and not last_modified:
+        return None
+    return {
+        "status_code": response.status_code,
+        "headers": dict(response.headers),
+        "content": response.content,
+        "expires_at": now + max_age,
+        "etag": etag,
+        "last_modified": last_modified,
+    }
+
+
+def _to_response(entry, method, url):
+    headers = {
+        name: value
+        for name, value in entry["headers"].items()
+        # The cached content is already decoded
+        if name.lower()
+        not in ("content-encoding", "content-length", "transfer-encoding")
+    }
+    return httpx.Response(
+        entry["status_code"],
+        headers=headers,
+        content=entry["content"],
+        request=httpx.Request(method, url),
+    )
+
+
+async def _send(method, url, **kwargs):
+    async with _get_host_semaphore(url.host):
+        return await _get_http_client().request(method, url, **kwargs)
+
+
+async def request(
+    method,
+    url,
+    params=None,
+    headers=None,
+    json_data=None,
+    data=None,
+    timeout=None,
+    is_cached=None,
+):
+    """Send a request through the shared client, using the HTTP cache for GET.
+
+    Args:
+        method (str): HTTP method.
+        url (str): Target URL.
+        params (dict, optional): Query parameters.
+        headers (dict, optional): Request headers.
+        json_data (Any, optional): JSON body.
+        data (dict, optional): Form body.
+        timeout (float, optional): Timeout in seconds.
+        is_cached (bool, optional): Whether GET responses may be cached. Defaults to
+            ``Config.get_http_is_cache()``.
+
+    Returns:
+        httpx.Response: The response, possibly served from the cache.
+    """
+    method = method.upper()
+    headers = dict(headers or {})
+    url = httpx.URL(url, params=params) if params else httpx.URL(url)
+    kwargs = {"headers": headers, "json": json_data, "data": data}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    if is_cached is None:
+        is_cached = Config.get_http_is_cache()
+    if method != "GET" or not is_cached:
+        return await _send(method, url, **kwargs)
+
+    cache = _get_http_cache()
+    key = cache.get_key(url, headers)
+    entry = cache.get(key)
+    now = time.time()
+    if entry is not None:
+        if now < entry["expires_at"]:
+            return _to_response(entry, method, url)
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = await _send(method, url, **kwargs)
+    now = time.time()
+    if response.status_code == 304 and entry is not None:
+        entry["headers"].update(response.headers)
+        entry["expires_at"] = now + (_get_max_age(response.headers, now) or 0)
+        cache.set(key, entry)
+        return _to_response(entry, method, url)
+    if response.status_code == 200:
+        new_entry = _to_entry(response, now, headers)
+        if new_entry is not None:
+            cache.set(key, new_entry)
+    return response
+
+
+async def close_http_client():
+    """Close the shared client and the session clients.
+
+    The next request opens a new shared client.
+    """
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    clients = list(_session_clients)
+    _session_clients.clear()
+    for client in clients:
+        await client.aclose()
+    _host_semaphores.clear()
@@ -0,0 +1,55 @@
+"""lru_cache.py In-memory LRU Cache Module.
+
+This file provides :class:`LRUCache`, a size-bounded cache with an optional
+time-to-live, used by tool retrieval, the knowledge base and preset tools. It counts
+hits and misses for :meth:`LRUCache.get_stats`.
+"""
+
+import time
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """Least-recently-used cache whose entries optionally expire.
+
+    Keys must be hashable. ``None`` cannot be cached, as :meth:`get` returns it for
+    missing and expired entries.
+    """
+
+    def __init__(self, max_size, ttl=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        item = self.data.get(key)
+        if item is not None and (
+            self.ttl is None or time.monotonic() - item[1] < self.ttl
+        ):
+            self.data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+        if item is not None:
+            del self.data[key]
+        self.misses += 1
+        return None
+
+    def set(self, key, value):
+        self.data[key] = (value, time.monotonic())
+        self.data.move_to_end(key)
+        while len(self.data) > self.max_size:
+            self.data.popitem(last=False)
+
+    def clear(self):
+        self.data.clear()
+
+    def get_stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self.data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
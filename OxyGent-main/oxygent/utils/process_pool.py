@@ -0,0 +1,138 @@
+"""Pool of worker processes for process-mode tools.
+
+This module provides the ToolProcessPool class behind ``MAS.run_in_executor`` in
+``process`` mode. Unlike ``concurrent.futures.ProcessPoolExecutor``, every call owns
+its worker while it runs, so a call cancelled by its timeout is stopped by killing
+that one worker; the other calls keep running and the pool keeps serving. Workers are
+started on demand, up to ``max_workers``, and reused between calls.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def _worker_main(conn):
+    """Run the ``(func, args)`` received on ``conn`` until ``None`` is received."""
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        func, args = message
+        try:
+            result = (True, func(*args))
+        except Exception as e:
+            result = (False, e)
+        try:
+            conn.send(result)
+        except Exception as e:
+            # The result or the exception cannot be pickled
+            conn.send((False, RuntimeError(f"Failed to return the result: {e!r}")))
+
+
+class _Worker(object):
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+
+    def kill(self):
+        self.process.kill()
+        self.process.join(timeout=5)
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+
+class ToolProcessPool(object):
+    """Worker processes that run picklable functions, one call per worker.
+
+    Example:
+        >>> pool = ToolProcessPool(4)
+        >>> await pool.run(pow, 2, 10)
+        1024
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._ctx = multiprocessing.get_context()
+        self._semaphore = asyncio.Semaphore(self.max_workers)
+        self._idle = []
+        self._workers = set()
+
+    def _spawn(self):
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main, args=(child_conn,), daemon=True
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+        self._workers.add(worker)
+        return worker
+
+    async def _discard(self, worker, receiving):
+        self._workers.discard(worker)
+        await asyncio.to_thread(worker.kill)
+        # The receiving thread gets EOFError once the worker is dead
+        await asyncio.gather(receiving, return_exceptions=True)
+        worker.conn.close()
+
+    async def run(self, func, *args):
+        """Return ``func(*args)`` computed in an idle worker.
+
+        Raises the exception raised by ``func``. If the awaiting task is cancelled,
+        the worker running the call is killed and replaced on a later call.
+        """
+        async with self._semaphore:
+            worker = self._idle.pop() if self._idle else None
+            if worker is None:
+                worker = await asyncio.to_thread(self._spawn)
+            try:
+                # Pickling fails before anything is written, the worker stays usable
+                worker.conn.send((func, args))
+            except Exception:
+                self._idle.append(worker)
+                raise
+            receiving = asyncio.ensure_future(asyncio.to_thread(worker.conn.recv))
+            try:
+                is_ok, result = await asyncio.shield(receiving)
+            except asyncio.CancelledError:
+                logger.warning(f"Killing the tool process of a cancelled call: {func}")
+                await asyncio.shield(self._discard(worker, receiving))
+                raise
+            except (EOFError, OSError):
+                await self._discard(worker, receiving)
+                raise RuntimeError(
+                    f"Tool process exited with code {worker.process.exitcode} "
+                    f"while running {func}"
+                )
+            self._idle.append(worker)
+        if not is_ok:
+            raise result
+        return result
+
+    def shutdown(self):
+        """Stop idle workers and kill the workers of running calls.
+
+        Running calls then raise ``RuntimeError``.
+        """
+        workers, self._workers = list(self._workers), set()
+        idle, self._idle = set(self._idle), []
+        for worker in workers:
+            if worker in idle:
+                worker.stop()
+            else:
+                worker.kill()
@@ -0,0 +1,309 @@
+"""Pool of warm, resource-limited Python worker processes.
+
+This module provides the PythonSandboxPool class behind ``run_python_code``. Snippets
+run in separate worker processes, so a CPU-heavy or runaway snippet cannot block the
+event loop or change the state of the MAS process. Each worker:
+
+- is forked from a forkserver that has already imported ``preload_modules`` (numpy
+  and pandas by default), so starting a worker does not pay their import cost;
+- runs under an address-space rlimit, and a CPU-time rlimit per snippet;
+- executes every snippet in a fresh namespace, with stdout captured up to
+  ``max_output_chars``.
+
+A worker that exceeds the wall-clock timeout, is cancelled, or dies from its limits is
+killed and replaced in the background, while the other workers keep serving.
+
+As with any non-fork multiprocessing start method, the entry script must be guarded
+by ``if __name__ == "__main__":``.
+"""
+
+import asyncio
+import builtins
+import contextlib
+import importlib
+import io
+import logging
+import multiprocessing
+import sys
+import traceback
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+_sandbox_pool = None
+
+
+class _BoundedWriter(io.TextIOBase):
+    def __init__(self, max_chars):
+        self.max_chars = max_chars
+        self.parts = []
+        self.size = 0
+        self.is_truncated = False
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        room = self.max_chars - self.size
+        if len(s) > room:
+            s = s[: max(room, 0)]
+            self.is_truncated = True
+        if s:
+            self.parts.append(s)
+            self.size += len(s)
+        return len(s)
+
+    def getvalue(self):
+        value = "".join(self.parts)
+        if self.is_truncated:
+            value += "\n...[output truncated]"
+        return value
+
+
+def _set_cpu_limit(cpu_limit):
+    import resource
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(usage.ru_utime + usage.ru_stime) + cpu_limit
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(conn, preload_modules, cpu_limit, memory_limit, max_output_chars):
+    """Serve snippets received on ``conn`` until ``None`` is received."""
+    for module_name in preload_modules:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+    has_rlimits = sys.platform != "win32"
+    if has_rlimits and memory_limit:
+        import resource
+
+        limit = memory_limit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        code, variable_to_return, safe_globals, safe_locals = message
+        if has_rlimits and cpu_limit:
+            _set_cpu_limit(cpu_limit)
+
+        namespace = {"__name__": "__main__", "__builtins__": builtins}
+        namespace.update(safe_globals or {})
+        local_namespace = namespace if safe_locals is None else dict(safe_locals)
+        stdout = _BoundedWriter(max_output_chars)
+        result = {"stdout": "", "value": None, "error": None}
+        try:
+            with contextlib.redirect_stdout(stdout):
+                exec(code, namespace, local_namespace)
+            if variable_to_return:
+                value = local_namespace.get(variable_to_return)
+                result["value"] = None if value is None else str(value)
+        except BaseException as e:
+            if isinstance(e, KeyboardInterrupt):
+                raise
+            result["error"] = "".join(
+                traceback.format_exception_only(type(e), e)
+            ).strip()
+        result["stdout"] = stdout.getvalue()
+        try:
+            conn.send(result)
+        except Exception as e:
+            conn.send({"stdout": "", "value": None, "error": repr(e)})
+
+
+class _Worker(object):
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+
+    def kill(self):
+        try:
+            self.process.kill()
+            self.process.join(timeout=5)
+        finally:
+            self.conn.close()
+
+
+class PythonSandboxPool(object):
+    """Warm worker processes that execute Python snippets under limits.
+
+    Example:
+        >>> pool = PythonSandboxPool()
+        >>> await pool.run("import numpy as np\\nx = np.arange(3).sum()", "x")
+        {'stdout': '', 'value': '3', 'error': None}
+    """
+
+    def __init__(
+        self,
+        pool_size=None,
+        timeout=None,
+        cpu_limit=None,
+        memory_limit=None,
+        max_output_chars=None,
+        preload_modules=None,
+    ):
+        """Create the pool; workers are started on the first call.
+
+        Arguments default to the ``sandbox`` module of the Config.
+        """
+        self.pool_size = pool_size or Config.get_sandbox_pool_size()
+        self.timeout = timeout or Config.get_sandbox_timeout()
+        self.cpu_limit = (
+            Config.get_sandbox_cpu_limit() if cpu_limit is None else cpu_limit
+        )
+        self.memory_limit = (
+            Config.get_sandbox_memory_limit() if memory_limit is None else memory_limit
+        )
+        self.max_output_chars = (
+            max_output_chars or Config.get_sandbox_max_output_chars()
+        )
+        self.preload_modules = (
+            Config.get_sandbox_preload_modules()
+            if preload_modules is None
+            else preload_modules
+        )
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            self._ctx = multiprocessing.get_context("forkserver")
+        else:
+            self._ctx = multiprocessing.get_context("spawn")
+        self._idle = None
+        self._start_lock = asyncio.Lock()
+        self._workers = set()
+        self._spawn_tasks = set()
+
+    def _spawn(self):
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                child_conn,
+                self.preload_modules,
+                self.cpu_limit,
+                self.memory_limit,
+                self.max_output_chars,
+            ),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+        self._workers.add(worker)
+        return worker
+
+    async def _add_worker(self, retry_delay=5):
+        while True:
+            try:
+                worker = await asyncio.to_thread(self._spawn)
+            except Exception as e:
+                logger.error(
+                    f"Failed to start python sandbox worker, "
+                    f"retrying in {retry_delay}s: {e}"
+                )
+                await asyncio.sleep(retry_delay)
+                continue
+            self._idle.put_nowait(worker)
+            return
+
+    async def start(self):
+        """Start the workers, if they are not running yet."""
+        async with self._start_lock:
+            if self._idle is not None:
+                return
+            if self._ctx.get_start_method() == "forkserver":
+                # Takes effect if the forkserver of the process is not running yet
+                self._ctx.set_forkserver_preload(
+                    [__name__] + list(self.preload_modules)
+                )
+            idle = asyncio.Queue()
+            for worker in await asyncio.gather(
+                *[asyncio.to_thread(self._spawn) for _ in range(self.pool_size)]
+            ):
+                idle.put_nowait(worker)
+            self._idle = idle
+
+    async def _replace(self, worker):
+        self._workers.discard(worker)
+        await asyncio.to_thread(worker.kill)
+        exitcode = worker.process.exitcode
+        task = asyncio.create_task(self._add_worker())
+        self._spawn_tasks.add(task)
+        task.add_done_callback(self._spawn_tasks.discard)
+        return exitcode
+
+    async def run(
+        self, code, variable_to_return=None, safe_globals=None, safe_locals=None
+    ):
+        """Execute a snippet in an idle worker.
+
+        Args:
+            code (str): The Python source to execute.
+            variable_to_return (str, optional): Name of the variable whose ``str``
+                value is returned.
+            safe_globals (dict, optional): Picklable initial global variables.
+            safe_locals (dict, optional): Picklable local variables. By default the
+                snippet runs at module level.
+
+        Returns:
+            dict: ``{"stdout", "value", "error"}``.
+        """
+        await self.start()
+        worker = await self._idle.get()
+        try:
+            worker.conn.send((code, variable_to_return, safe_globals, safe_locals))
+            is_ready = await asyncio.to_thread(worker.conn.poll, self.timeout)
+            result = worker.conn.recv() if is_ready else None
+        except asyncio.CancelledError:
+            await asyncio.shield(self._replace(worker))
+            raise
+        except (EOFError, OSError):
+            exitcode = await self._replace(worker)
+            return {
+                "stdout": "",
+                "value": None,
+                "error": f"Python worker exited with code {exitcode}, the snippet "
+                "may have exceeded its CPU or memory limit",
+            }
+        if result is None:
+            await self._replace(worker)
+            return {
+                "stdout": "",
+                "value": None,
+                "error": f"Execution timed out after {self.timeout} seconds",
+            }
+        self._idle.put_nowait(worker)
+        return result
+
+    async def close(self):
+        """Stop every worker."""
+        for task in list(self._spawn_tasks):
+            task.cancel()
+        workers, self._workers = list(self._workers), set()
+        self._idle = None
+        for worker in workers:
+            await asyncio.to_thread(worker.kill)
+
+
+def get_sandbox_pool():
+    """Return the pool shared by ``run_python_code``, creating it on first use."""
+    global _sandbox_pool
+    if _sandbox_pool is None:
+        _sandbox_pool = PythonSandboxPool()
+    return _sandbox_pool
+
+
+async def close_sandbox_pool():
+    """Stop the shared pool, if it was created; the next call creates a new one."""
+    global _sandbox_pool
+    if _sandbox_pool is not None:
+        await _sandbox_pool.close()
+        _sandbox_pool = None
@@ -0,0 +1,91 @@
+"""Token counting for prompt budgeting.
+
+Agents budget their prompts in tokens rather than characters. A counter is any
+callable mapping a text to its number of tokens; :func:`get_token_counter` returns the
+one configured by ``Config.get_agent_tokenizer()``:
+
+- a tiktoken encoding name (e.g. ``"cl100k_base"``, ``"o200k_base"``), or ``"auto"``
+  for ``cl100k_base``, when tiktoken is installed;
+- otherwise, or with ``"heuristic"``, :class:`HeuristicTokenCounter`, which counts
+  each CJK character as one token and other text as
+  ``Config.get_agent_chars_per_token()`` characters per token.
+"""
+
+import functools
+import logging
+import math
+import re
+
+from ..config import Config
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Tokens added by chat formatting around each message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+_CJK_PATTERN = re.compile(
+    r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]"
+)
+
+
+class HeuristicTokenCounter(object):
+    """Approximate token counter for when no tokenizer is available."""
+
+    def __init__(self, chars_per_token=4.0):
+        self.chars_per_token = chars_per_token
+
+    def __call__(self, text):
+        if not text:
+            return 0
+        n_cjk = len(_CJK_PATTERN.findall(text))
+        return n_cjk + math.ceil((len(text) - n_cjk) / self.chars_per_token)
+
+
+class TiktokenCounter(object):
+    """Exact counter of a tiktoken encoding."""
+
+    def __init__(self, encoding_name="cl100k_base"):
+        self.encoding = tiktoken.get_encoding(encoding_name)
+
+    def __call__(self, text):
+        if not text:
+            return 0
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+
+@functools.lru_cache(maxsize=None)
+def _create_token_counter(tokenizer, chars_per_token):
+    if tokenizer != "heuristic" and tiktoken is not None:
+        try:
+            return TiktokenCounter("cl100k_base" if tokenizer == "auto" else tokenizer)
+        except Exception as e:
+            logger.warning(f"Falling back to heuristic token counting: {e}")
+    return HeuristicTokenCounter(chars_per_token)
+
+
+def get_token_counter():
+    """Return the configured token counter."""
+    return _create_token_counter(
+        Config.get_agent_tokenizer(), Config.get_agent_chars_per_token()
+    )
+
+
+def count_message_tokens(message, count_tokens):
+    """Count the tokens of an SDK-format message dict."""
+    content = message.get("content")
+    if content is None:
+        content = ""
+    elif not isinstance(content, str):
+        content = str(content)
+    n_tokens = count_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+    for tool_call in message.get("tool_calls") or []:
+        function = tool_call.get("function", {})
+        n_tokens += count_tokens(function.get("name", "")) + count_tokens(
+            str(function.get("arguments", ""))
+        )
+    return n_tokens